@@ -1,17 +1,33 @@
 import os
+import time
 import logging
 import json
 import re
-from flask import Flask, render_template, request, redirect, url_for, flash, session, jsonify, send_file
+import click
+from flask import Flask, Response, render_template, request, redirect, url_for, flash, session, jsonify, send_file, stream_with_context
 from werkzeug.middleware.proxy_fix import ProxyFix
 from werkzeug.utils import secure_filename
 import tempfile
+import zipfile
 from io import BytesIO
 
 from sqlalchemy import text
-from resume_parser import parse_resume
-from text_processor import extract_skills_experience
-from models import db, JobDescription, Resume
+from sqlalchemy.orm.attributes import set_committed_value
+from ingest import extract_archive
+from text_processor import extract_candidate_info
+from resume_cache import content_cache, parse_resume_cached, extract_skills_experience_cached, process_resume_files_cached
+from models import db, JobDescription, Resume, IngestTask, RESUME_LIST_COLUMNS, RESUME_RANK, UNSCORED_RANK
+from skill_search import search_candidates, rebuild_skill_index, QuerySyntaxError
+from rescoring import rescore_job
+from job_matchers import job_matchers
+from cross_matching import match_resumes, backfill_job, rebuild_matches, strong_candidates_elsewhere
+from result_store import save_result, load_result, delete_result
+from migrations import upgrade_schema
+from fulltext import ensure_fulltext_index, search_resumes
+from exports import EXPORT_FORMATS, iter_ranked_candidates
+from job_profiles import build_job_profile, rebuild_job_profiles
+import bm25
+import metrics
 
 
 # Configure logging
@@ -60,59 +76,68 @@ UPLOAD_FOLDER = tempfile.gettempdir()
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 
+# Uploads queued for the background worker (see worker.py) are spooled here
+INGEST_SPOOL_DIR = os.environ.get('INGEST_SPOOL_DIR', os.path.join(UPLOAD_FOLDER, 'resume_ranker_queue'))
+os.makedirs(INGEST_SPOOL_DIR, exist_ok=True)
+
+# Bulk uploads: worker processes used for parsing and rows per commit
+BULK_UPLOAD_WORKERS = int(os.environ.get('BULK_UPLOAD_WORKERS', 0)) or None
+BULK_COMMIT_SIZE = 100
+# A bulk request carries hundreds of resumes, so it gets its own size cap
+BULK_MAX_CONTENT_LENGTH = int(os.environ.get('BULK_MAX_CONTENT_LENGTH', 512 * 1024 * 1024))
+
+# Candidates shown per page on a job's page
+RESUMES_PAGE_SIZE = 50
+
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
 # Create database tables
 with app.app_context():#####with statement
-    db.create_all()
-    
-# Helper function to extract candidate information from resume text
-def extract_candidate_info(text):
-    """Extract candidate name, email, and phone from resume text"""
-    info = {
-        'name': None,
-        'email': None,
-        'phone': None
-    }
-    
-    # Try to extract email
-    email_match = re.search(r'[\w.+-]+@[\w-]+\.[\w.-]+', text)
-    if email_match:
-        info['email'] = email_match.group(0)
-    
-    # Try to extract phone (simple pattern for various formats)
-    phone_match = re.search(r'(\+\d{1,3}[\s.-])?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}', text)
-    if phone_match:
-        info['phone'] = phone_match.group(0)
+    upgrade_schema(db)
+    ensure_fulltext_index(db)
+    job_matchers.warm()
     
-    # Try to extract name (this is more complex, using first 2 lines if they don't match email/phone)
-    lines = text.split('\n')
-    for line in lines[:3]:  # Check first 3 lines for name
-        line = line.strip() #removen any spaces or empty character before and after the text
-        if line and len(line) > 3:
-            # Skip if line contains email or phone
-            if info['email'] and info['email'] in line:
-                continue
-            if info['phone'] and info['phone'] in line:
-                continue
-            if not re.search(r'[\w.+-]+@[\w-]+\.[\w.-]+', line) and not re.search(r'(\+\d{1,3}[\s.-])?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}', line):
-                info['name'] = line
-                break
-    
-    return info
+def build_resume(filename, text_content, extracted_data, job):
+    """Create a scored Resume row for a job from parsed text and extraction results"""
+    candidate_info = extract_candidate_info(text_content)
+    # The row is added to the session by the caller, so don't flush it half-built
+    with db.session.no_autoflush:
+        resume = Resume(
+            filename=filename,
+            candidate_name=candidate_info['name'],
+            email=candidate_info['email'],
+            phone=candidate_info['phone'],
+            experience=extracted_data.get('experience', {}).get('content'),
+            raw_text=text_content[:5000],  # Limit the stored text
+            job_description_id=job.id if job is not None else None
+        )
+        # Attach the job without queueing the row on job.resumes, so flushing the
+        # job before the caller adds the row doesn't cascade into it
+        set_committed_value(resume, 'job_description', job)
+        resume.set_skills(extracted_data.get('skills', {}).get('identified', []))
+        resume.calculate_match_score()
+    return resume
 
 @app.route('/')
 def index():
     # Get job descriptions for the dropdown
-    job_descriptions = JobDescription.query.order_by(JobDescription.created_at.desc()).all()
+    job_descriptions = JobDescription.query.options(
+        db.load_only(JobDescription.id, JobDescription.title, JobDescription.company)
+    ).order_by(JobDescription.created_at.desc()).all()
     return render_template('index.html', job_descriptions=job_descriptions)
 
 @app.route('/jobs')
 def job_descriptions():
     """List all job descriptions"""
-    jobs = JobDescription.query.order_by(JobDescription.created_at.desc()).all()
-    return render_template('jobs.html', jobs=jobs)
+    jobs = JobDescription.query.options(
+        db.defer(JobDescription.description)
+    ).order_by(JobDescription.created_at.desc()).all()
+    # One grouped count instead of loading every job's resumes
+    resume_counts = dict(db.session.query(Resume.job_description_id, db.func.count(Resume.id)).filter(
+        Resume.job_description_id.isnot(None)
+    ).group_by(Resume.job_description_id).all())
+    return render_template('jobs.html', jobs=jobs, resume_counts=resume_counts)
 
 @app.route('/jobs/create', methods=['GET', 'POST'])
 def create_job():
@@ -138,11 +163,15 @@ def create_job():
                 description=description
             )
             job.set_required_skills(skills)
+            job.is_open = bool(request.form.get('is_open'))
+            build_job_profile(job)
             
             db.session.add(job)
             db.session.commit()
             
-            flash('Job description created successfully', 'success')
+            # Find strong candidates among resumes uploaded for other jobs
+            stats = backfill_job(job.id)
+            flash(f"Job description created successfully. {stats['stored']} strong candidates found among existing resumes", 'success')
             return redirect(url_for('job_descriptions'))
         except Exception as e:
             db.session.rollback()
@@ -151,24 +180,195 @@ def create_job():
     
     return render_template('create_job.html')
 
+def top_resumes_page(job_id, after_score=None, after_id=None, page_size=None):
+    """
+    Fetch one page of a job's resumes, best match first, using keyset pagination
+
+    Rows are ordered by (RESUME_RANK DESC, id DESC), which ix_resumes_job_rank
+    serves directly; the next page starts strictly after the last row seen
+    instead of using OFFSET, so every page costs the same. Unscored resumes
+    rank as UNSCORED_RANK, so they page like any other score.
+
+    Args:
+        after_score (float): Rank of the last row seen (see resume_cursor)
+        after_id (int): Id of the last row seen
+
+    Returns:
+        list: Up to page_size + 1 resumes (the extra row signals a next page)
+    """
+    page_size = page_size or RESUMES_PAGE_SIZE
+    query = Resume.query.options(db.load_only(*RESUME_LIST_COLUMNS)).filter(Resume.job_description_id == job_id)
+    if after_score is not None and after_id is not None:
+        query = query.filter(db.or_(
+            RESUME_RANK < after_score,
+            db.and_(RESUME_RANK == after_score, Resume.id < after_id)
+        ))
+    return query.order_by(RESUME_RANK.desc(), Resume.id.desc()).limit(page_size + 1).all()
+
+def resume_cursor(resume):
+    """Keyset cursor (after_score, after_id) of the page that follows resume"""
+    score = resume.match_score if resume.match_score is not None else UNSCORED_RANK
+    return {'after_score': score, 'after_id': resume.id}
+
+@app.route('/jobs/<int:job_id>/edit', methods=['GET', 'POST'])
+def edit_job(job_id):
+    """Edit a job description, rescoring its resumes if the required skills change"""
+    job = JobDescription.query.get_or_404(job_id)
+    if request.method == 'POST':
+        title = request.form.get('title')
+        description = request.form.get('description')
+        skills_text = request.form.get('required_skills', '')
+        skills = [skill.strip() for skill in re.split(r'[,;\n]', skills_text) if skill.strip()]
+
+        if not title or not description:
+            flash('Job title and description are required', 'danger')
+            return render_template('create_job.html', job=job)
+
+        try:
+            scoring_skills = job.get_scoring_skills()
+            is_open = bool(request.form.get('is_open'))
+            open_changed = is_open != (job.is_open is not False)
+            job.title = title
+            job.company = request.form.get('company')
+            job.description = description
+            job.set_required_skills(skills)
+            job.is_open = is_open
+            # The profile merges the manual skills with those found in the new description
+            build_job_profile(job)
+            skills_changed = job.get_scoring_skills() != scoring_skills
+            matching_changed = skills_changed or open_changed
+            db.session.commit()
+            job_matchers.invalidate(job.id)
+
+            if matching_changed:
+                backfill_job(job.id)
+            if skills_changed:
+                stats = rescore_job(job.id)
+                flash(f"Job updated. Rescored {stats['rescored']} resumes in {stats['seconds']}s", 'success')
+            else:
+                flash('Job updated', 'success')
+            return redirect(url_for('view_job', job_id=job.id))
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error updating job description: {str(e)}", exc_info=True)
+            flash(f'Error updating job description: {str(e)}', 'danger')
+
+    return render_template('create_job.html', job=job)
+
+@app.route('/jobs/<int:job_id>/rescore', methods=['POST'])
+def rescore_job_scores(job_id):
+    """Recompute every resume's match score for a job and report throughput"""
+    JobDescription.query.get_or_404(job_id)
+    return jsonify(rescore_job(job_id))
+
+@app.cli.command('rescore-job')
+@click.argument('job_id', type=int)
+def rescore_job_command(job_id):
+    """Recompute every resume's match score for a job"""
+    stats = rescore_job(job_id)
+    print(f"Rescored {stats['rescored']} resumes in {stats['seconds']}s ({stats['rows_per_second']} rows/s)")
+
+@app.route('/jobs/<int:job_id>/ranking')
+def rank_job_resumes(job_id):
+    """Rank resumes by BM25 relevance of their text to the job description"""
+    job = JobDescription.query.get_or_404(job_id)
+    k = min(request.args.get('k', 20, type=int), 500)
+    # By default only this job's applicants are ranked; all=1 searches every resume
+    scope = None if request.args.get('all') else job.id
+
+    profile = job.current_profile
+    if profile is not None:
+        ranked = bm25.rank_terms(profile.get_term_vector(), k=k, job_id=scope)
+    else:
+        ranked = bm25.rank(job.description, k=k, job_id=scope)
+    resumes = {resume.id: resume for resume in Resume.query.options(
+        db.load_only(*RESUME_LIST_COLUMNS)
+    ).filter(Resume.id.in_([rid for rid, _ in ranked]))}
+    return jsonify({
+        'job_id': job.id,
+        'results': [{
+            'resume_id': resume_id,
+            'candidate_name': resumes[resume_id].candidate_name,
+            'filename': resumes[resume_id].filename,
+            'job_id': resumes[resume_id].job_description_id,
+            'bm25_score': round(score, 4),
+            'match_score': resumes[resume_id].match_score
+        } for resume_id, score in ranked if resume_id in resumes]
+    })
+
+@app.cli.command('index-text')
+def index_text_command():
+    """Add stored resumes to the BM25 text index"""
+    count = bm25.rebuild_index()
+    print(f"Indexed text for {count} resumes")
+
+@app.cli.command('cross-match')
+def cross_match_command():
+    """Score every stored resume against every open job"""
+    count = rebuild_matches()
+    print(f"Stored {count} cross-job matches")
+
+@app.cli.command('build-job-profiles')
+def build_job_profiles_command():
+    """Build scoring profiles for jobs created before profiles existed"""
+    changed = rebuild_job_profiles()
+    for job_id in changed:
+        rescore_job(job_id)
+        backfill_job(job_id)
+    print(f"Rescored and cross-matched {len(changed)} jobs whose skills changed")
+
+@app.cli.command('seed-jobs')
+@click.argument('csv_path', required=False)
+@click.option('--closed', is_flag=True, help="Seed the jobs as closed, leaving them out of cross-job matching")
+def seed_jobs_command(csv_path, closed):
+    """Bulk-load job descriptions and their extracted skills from a job CSV (default: the bundled one)"""
+    # Imported here so serving requests never loads pandas
+    from job_catalogue import JOB_CSV_PATH, seed_jobs
+
+    start = time.perf_counter()
+    count = seed_jobs(csv_path or JOB_CSV_PATH, is_open=not closed)
+    print(f"Seeded {count} job descriptions in {time.perf_counter() - start:.1f}s")
+    if not closed:
+        print("Run 'flask cross-match' to match stored resumes against them")
+
 @app.route('/jobs/<int:job_id>')
 def view_job(job_id):
     """View a job description and associated resumes"""
+    job = JobDescription.query.options(db.joinedload(JobDescription.profile)).get_or_404(job_id)
+    after_score = request.args.get('after_score', type=float)
+    after_id = request.args.get('after_id', type=int)
+
+    resumes = top_resumes_page(job_id, after_score=after_score, after_id=after_id)
+    has_more = len(resumes) > RESUMES_PAGE_SIZE
+    resumes = resumes[:RESUMES_PAGE_SIZE]
+    total = db.session.query(db.func.count(Resume.id)).filter(Resume.job_description_id == job_id).scalar()
+
+    return render_template(
+        'view_job.html',
+        job=job,
+        resumes=resumes,
+        total_resumes=total,
+        next_page=resume_cursor(resumes[-1]) if has_more else None,
+        is_first_page=after_id is None,
+        candidates_elsewhere=strong_candidates_elsewhere(job_id) if after_id is None else []
+    )
+
+@app.route('/jobs/<int:job_id>/export.<any(csv, jsonl):fmt>')
+def export_job_candidates(job_id, fmt):
+    """Stream every ranked candidate of a job as CSV or JSON lines"""
     job = JobDescription.query.get_or_404(job_id)
-    resumes = Resume.query.filter_by(job_description_id=job_id).order_by(Resume.match_score.desc()).all()
+    encode, mimetype = EXPORT_FORMATS[fmt]
+    filename = secure_filename(f'{job.title}_candidates.{fmt}') or f'job_{job_id}_candidates.{fmt}'
 
-    print("Job Required Skills:", job.get_required_skills())
-    for resume in resumes:
-        print(f"Resume: {resume.filename}")
-        print("Extracted Skills:", resume.get_skills())
-        print("Match Score:", resume.match_score)
-    
-    return render_template('view_job.html', job=job, resumes=resumes)
+    # The generator runs after the view returns, so it keeps the request context
+    return Response(
+        stream_with_context(encode(iter_ranked_candidates(job_id))),
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+    )
 
 @app.route('/upload', methods=['POST'])
 def upload_file():
-    # Add more detailed logging
-    print("\n\n***** UPLOAD REQUEST RECEIVED *****\n\n")
     logger.debug("Upload request received")
     
     # Get job description ID if provided
@@ -185,63 +385,53 @@ def upload_file():
     
     # Check if file part exists in the request
     if 'resume' not in request.files:
-        print("NO FILE PART IN REQUEST")
         logger.warning("No file part in the request")
         flash('No file part', 'danger')
         return redirect(url_for('index'))
     
     file = request.files['resume']
-    print(f"FILE RECEIVED: {file.filename}")
     logger.debug(f"File received: {file.filename}")
     
     # Check if user submitted an empty form
     if file.filename == '':
-        print("EMPTY FILENAME SUBMITTED")
         logger.warning("Empty filename submitted")
         flash('No file selected', 'danger')
         return redirect(url_for('index'))
     
     # Check file extension
     if not allowed_file(file.filename):
-        print(f"INVALID FILE TYPE: {file.filename}")
         logger.warning(f"Invalid file type: {file.filename}")
         flash('File type not allowed. Please upload PDF, DOCX, or TXT files only.', 'danger')
         return redirect(url_for('index'))
     
     # Process valid file
     filename = secure_filename(file.filename)
-    filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+    file_type = filename.rsplit('.', 1)[-1].lower()
+    upload_start = time.perf_counter()
     
     try:
-        print(f"SAVING FILE TO: {filepath}")
-        logger.debug(f"Saving file to: {filepath}")
-        file.save(filepath)
+        # Parse straight from memory; Werkzeug only spools large request bodies to disk
+        logger.debug(f"Reading uploaded file: {filename}")
+        with metrics.UPLOAD_STAGE_SECONDS.time(stage='read'):
+            file_data = file.read()
+        metrics.UPLOAD_BYTES_TOTAL.inc(len(file_data), file_type=file_type)
         
-        # Parse the resume
-        print(f"PARSING RESUME: {filename}")
+        # Parse the resume; identical files reuse their previously parsed text
         logger.debug(f"Parsing resume file: {filename}")
-        
-        # Create a simple text file handler for the sample resume
-        if filename.endswith('.txt'):
-            with open(filepath, 'r') as f:
-                text_content = f.read()
-        else:
-            text_content = parse_resume(filepath)
-        
-        print("RESUME PARSING SUCCESSFUL")
-        logger.debug("Resume parsing successful")
+        with metrics.UPLOAD_STAGE_SECONDS.time(stage='parse'):
+            text_content = parse_resume_cached(file_data, file_type=file_type)
         
         # Extract skills and experience
-        print("EXTRACTING SKILLS AND EXPERIENCE")
         logger.debug("Extracting skills and experience")
-        extracted_data = extract_skills_experience(text_content)
+        with metrics.UPLOAD_STAGE_SECONDS.time(stage='extract'):
+            extracted_data = extract_skills_experience_cached(text_content)
         
         skill_count = len(extracted_data.get('skills', {}).get('identified', []))
-        print(f"EXTRACTION COMPLETE. SKILLS FOUND: {skill_count}")
         logger.debug(f"Extraction complete. Skills found: {skill_count}")
         
         # Extract candidate information
-        candidate_info = extract_candidate_info(text_content)
+        with metrics.UPLOAD_STAGE_SECONDS.time(stage='candidate_info'):
+            candidate_info = extract_candidate_info(text_content)
         
         # Store in the database if a job was selected
         if job:
@@ -259,20 +449,19 @@ def upload_file():
             # Set the skills
             resume.set_skills(extracted_data.get('skills', {}).get('identified', []))
             
-            # Print debug info before calculating match score
-            print("Resume skills (before match):", resume.get_skills())
-            print("Job required skills (before match):", job.get_required_skills())
-            print("Resume job_description_id:", resume.job_description_id)
-            print("Resume job_description:", resume.job_description)
-            
             # Save to database and flush to get relationships
-            db.session.add(resume)
-            db.session.flush()  # This will assign the relationship
+            with metrics.UPLOAD_STAGE_SECONDS.time(stage='flush'):
+                db.session.add(resume)
+                db.session.flush()  # This will assign the relationship
             
-            # Now calculate match score
-            resume.calculate_match_score()
+            # Now calculate match score, and score against every other open job
+            with metrics.UPLOAD_STAGE_SECONDS.time(stage='score'):
+                resume.calculate_match_score()
+            with metrics.UPLOAD_STAGE_SECONDS.time(stage='cross_match'):
+                match_resumes([resume])
             
-            db.session.commit()
+            with metrics.UPLOAD_STAGE_SECONDS.time(stage='commit'):
+                db.session.commit()
             
             # Add job info to the extracted data
             extracted_data['job_match'] = {
@@ -281,41 +470,248 @@ def upload_file():
                 'job_id': job.id
             }
         
-        # Store results in session
-        print("STORING RESULTS IN SESSION")
-        logger.debug("Storing results in session")
-        session['extracted_data'] = extracted_data
+        # Store results server-side; the session cookie only carries their id
+        logger.debug("Storing results")
+        delete_result(session.pop('result_id', None))
+        session['result_id'] = save_result({
+            'extracted_data': extracted_data,
+            'candidate_info': candidate_info
+        })
         
-        # Add candidate info to session
-        session['candidate_info'] = candidate_info
-        
-        # Clean up the temporary file
-        print(f"REMOVING TEMPORARY FILE: {filepath}")
-        logger.debug(f"Removing temporary file: {filepath}")
-        os.remove(filepath)
+        metrics.UPLOADS_TOTAL.inc(file_type=file_type, status='ok')
         
         # Redirect to results page
-        print("REDIRECTING TO RESULTS PAGE")
         logger.debug("Redirecting to results page")
         return redirect(url_for('show_results'))
     
     except Exception as e:
-        # Clean up the temporary file in case of error
-        if 'filepath' in locals() and os.path.exists(filepath):
-            print(f"REMOVING TEMPORARY FILE AFTER ERROR: {filepath}")
-            logger.debug(f"Removing temporary file after error: {filepath}")
-            os.remove(filepath)
-            
-        print(f"ERROR PROCESSING FILE: {str(e)}")
+        metrics.UPLOADS_TOTAL.inc(file_type=file_type, status='error')
         logger.error(f"Error processing file: {str(e)}", exc_info=True)
         flash(f'Error processing file: {str(e)}', 'danger')
         return redirect(url_for('index'))
+    finally:
+        metrics.UPLOAD_SECONDS.observe(time.perf_counter() - upload_start, file_type=file_type)
+
+def flush_resume_batch(batch, summary):
+    """
+    Flush new Resume rows, isolating the rows the database rejects
+
+    The batch is flushed in one savepoint; if that fails, each row is retried
+    in its own savepoint so one bad file doesn't sink the rest.
+
+    Returns:
+        list: The (filename, resume) pairs that were flushed
+    """
+    try:
+        with db.session.begin_nested():
+            db.session.add_all([resume for _, resume in batch])
+        return batch
+    except Exception as e:
+        logger.warning(f"Resume batch failed to flush, retrying row by row: {str(e)}")
+
+    flushed = []
+    for filename, resume in batch:
+        try:
+            with db.session.begin_nested():
+                db.session.add(resume)
+            flushed.append((filename, resume))
+        except Exception as e:
+            logger.error(f"Error saving resume {filename}: {str(e)}", exc_info=True)
+            summary.append({'filename': filename, 'status': 'error', 'error': str(e)})
+    return flushed
+
+def commit_resume_batch(batch, summary):
+    """Commit a batch of new Resume rows and record the outcome of each in summary"""
+    try:
+        batch = flush_resume_batch(batch, summary)
+        match_resumes([resume for _, resume in batch])
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error saving resume batch: {str(e)}", exc_info=True)
+        summary.extend({'filename': filename, 'status': 'error', 'error': str(e)} for filename, _ in batch)
+        return 0
+
+    for filename, resume in batch:
+        summary.append({
+            'filename': filename,
+            'status': 'ok',
+            'resume_id': resume.id,
+            'candidate_name': resume.candidate_name,
+            'match_score': resume.match_score,
+            'skills_found': len(resume.get_skills())
+        })
+    return len(batch)
+
+@app.route('/upload/bulk', methods=['POST'])
+def bulk_upload():
+    """Upload many resumes (or one ZIP archive of resumes) against a job description"""
+    # Raise the app-wide cap before the form is parsed
+    request.max_content_length = BULK_MAX_CONTENT_LENGTH
+    job_id = request.form.get('job_id', type=int)
+    job = JobDescription.query.get(job_id) if job_id else None
+    if not job:
+        return jsonify({'error': 'A valid job_id is required'}), 400
+
+    files = [f for f in request.files.getlist('resumes') if f and f.filename]
+    if not files:
+        return jsonify({'error': 'No files uploaded'}), 400
+
+    summary = []
+    with tempfile.TemporaryDirectory(dir=app.config['UPLOAD_FOLDER']) as work_dir:
+        # Stage every upload on disk, expanding archives into their members
+        staged = []
+        for index, file in enumerate(files):
+            if file.filename.lower().endswith('.zip'):
+                try:
+                    staged.extend(extract_archive(file.stream, work_dir, allowed_file))
+                except (zipfile.BadZipFile, ValueError) as e:
+                    summary.append({'filename': file.filename, 'status': 'error', 'error': str(e)})
+                continue
+            if not allowed_file(file.filename):
+                summary.append({'filename': file.filename, 'status': 'error', 'error': 'File type not allowed'})
+                continue
+            filepath = os.path.join(work_dir, f"{index:05d}_{secure_filename(file.filename)}")
+            file.save(filepath)
+            staged.append((file.filename, filepath))
+
+        logger.debug(f"Bulk upload: {len(staged)} files staged for job {job.id}")
+        results = process_resume_files_cached([path for _, path in staged], workers=BULK_UPLOAD_WORKERS)
+
+    # Insert the resumes in batched commits
+    batch = []
+    saved = 0
+    for (filename, _), result in zip(staged, results):
+        if 'error' in result:
+            summary.append({'filename': filename, 'status': 'error', 'error': result['error']})
+            continue
+
+        try:
+            resume = build_resume(secure_filename(filename), result['text'], result['extracted'], job)
+        except Exception as e:
+            logger.error(f"Error building resume for {filename}: {str(e)}", exc_info=True)
+            summary.append({'filename': filename, 'status': 'error', 'error': str(e)})
+            continue
+        batch.append((filename, resume))
+
+        if len(batch) == BULK_COMMIT_SIZE:
+            saved += commit_resume_batch(batch, summary)
+            batch = []
+    if batch:
+        saved += commit_resume_batch(batch, summary)
+
+    return jsonify({
+        'job_id': job.id,
+        'processed': saved,
+        'failed': len(summary) - saved,
+        'files': summary
+    })
+
+@app.route('/upload/async', methods=['POST'])
+def enqueue_upload():
+    """Spool an uploaded resume and queue it for the background worker"""
+    job_id = request.form.get('job_id', type=int)
+    job = JobDescription.query.get(job_id) if job_id else None
+    if not job:
+        return jsonify({'error': 'A valid job_id is required'}), 400
+
+    file = request.files.get('resume')
+    if not file or file.filename == '':
+        return jsonify({'error': 'No file selected'}), 400
+    if not allowed_file(file.filename):
+        return jsonify({'error': 'File type not allowed. Please upload PDF, DOCX, or TXT files only.'}), 400
+
+    filename = secure_filename(file.filename)
+    fd, filepath = tempfile.mkstemp(dir=INGEST_SPOOL_DIR, suffix='_' + filename)
+    with os.fdopen(fd, 'wb') as spool:
+        file.save(spool)
+
+    try:
+        task = IngestTask(filename=filename, file_path=filepath, job_description_id=job.id)
+        db.session.add(task)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        os.remove(filepath)
+        logger.error(f"Error queueing upload: {str(e)}", exc_info=True)
+        return jsonify({'error': f'Error queueing upload: {str(e)}'}), 500
+
+    logger.debug(f"Queued ingest task {task.id} for {filename}")
+    response = task.to_dict()
+    response['status_url'] = url_for('task_status', task_id=task.id)
+    return jsonify(response), 202
+
+@app.route('/tasks/<int:task_id>')
+def task_status(task_id):
+    """Report the status of a queued upload and link to the resulting resume"""
+    task = IngestTask.query.get_or_404(task_id)
+    response = task.to_dict()
+    if task.resume_id and task.job_description_id:
+        response['match_score'] = task.resume.match_score if task.resume else None
+        response['job_url'] = url_for('view_job', job_id=task.job_description_id)
+    return jsonify(response)
+
+@app.route('/candidates/search')
+def search_skills():
+    """Find candidates with a boolean skill query, e.g. python AND (django OR flask) AND NOT php"""
+    query = request.args.get('q', '')
+    job_id = request.args.get('job_id', type=int)
+    limit = min(request.args.get('limit', 50, type=int), 500)
+
+    try:
+        candidates = search_candidates(query, job_id=job_id).limit(limit).all()
+    except QuerySyntaxError as e:
+        return jsonify({'error': str(e)}), 400
+
+    return jsonify({
+        'query': query,
+        'count': len(candidates),
+        'results': [{
+            'resume_id': resume.id,
+            'candidate_name': resume.candidate_name,
+            'filename': resume.filename,
+            'job_id': resume.job_description_id,
+            'match_score': resume.match_score
+        } for resume in candidates]
+    })
+
+@app.route('/search')
+def search_resumes_text():
+    """Full-text search over resume text, most relevant first"""
+    query = request.args.get('q', '')
+    job_id = request.args.get('job_id', type=int)
+    page = max(request.args.get('page', 1, type=int), 1)
+    per_page = min(max(request.args.get('per_page', 20, type=int), 1), 100)
+
+    results, total = search_resumes(query, job_id=job_id, page=page, per_page=per_page)
+    return jsonify({
+        'query': query,
+        'total': total,
+        'page': page,
+        'per_page': per_page,
+        'has_more': page * per_page < total,
+        'results': [{
+            'resume_id': resume.id,
+            'candidate_name': resume.candidate_name,
+            'filename': resume.filename,
+            'job_id': resume.job_description_id,
+            'relevance': round(float(score), 4),
+            'match_score': resume.match_score
+        } for resume, score in results]
+    })
+
+@app.cli.command('index-skills')
+def index_skills_command():
+    """Build the normalized skill index for resumes stored before it existed"""
+    count = rebuild_skill_index()
+    print(f"Indexed skills for {count} resumes")
 
 @app.route('/results')
 def show_results():
-    # Retrieve data from session
-    extracted_data = session.get('extracted_data')
-    candidate_info = session.get('candidate_info', {})
+    # Retrieve the results stored for this session
+    result = load_result(session.get('result_id')) or {}
+    extracted_data = result.get('extracted_data')
+    candidate_info = result.get('candidate_info', {})
     
     if not extracted_data:
         flash('No data to display. Please upload a resume.', 'warning')
@@ -329,8 +725,8 @@ def show_results():
 
 @app.route('/download')
 def download_results():
-    # Retrieve data from session
-    extracted_data = session.get('extracted_data')
+    # Retrieve the results stored for this session
+    extracted_data = (load_result(session.get('result_id')) or {}).get('extracted_data')
     
     if not extracted_data:
         flash('No data to download. Please upload a resume.', 'warning')
@@ -350,13 +746,26 @@ def download_results():
 
 @app.route('/clear')
 def clear_session():
+    delete_result(session.get('result_id'))
     session.clear()
     flash('Session cleared. You can upload a new resume.', 'info')
     return redirect(url_for('index'))
 
+@app.route('/metrics')
+def prometheus_metrics():
+    """Expose upload stage latencies, throughput counters and cache statistics to Prometheus"""
+    cache_counters = {
+        f'resume_cache_{name}_total': (f'Content cache {name.replace("_", " ")}', value)
+        for name, value in content_cache.stats().items() if name != 'memory_entries'
+    }
+    return app.response_class(metrics.render_prometheus(cache_counters), mimetype='text/plain; version=0.0.4')
+
 @app.errorhandler(413)
 def request_entity_too_large(error):
-    flash('File too large. Maximum size is 16MB.', 'danger')
+    limit_mb = (request.max_content_length or 0) // (1024 * 1024)
+    if request.endpoint == 'bulk_upload':
+        return jsonify({'error': f'Upload too large. Maximum size is {limit_mb}MB per request.'}), 413
+    flash(f'File too large. Maximum size is {limit_mb}MB.', 'danger')
     return redirect(url_for('index'))
 
 @app.errorhandler(404)
@@ -0,0 +1,89 @@
+"""
+Benchmark per-resume skill extraction as the vocabulary grows.
+
+Compares the old per-skill regex loop with the compiled SkillMatcher for
+vocabularies from 250 up to 50k terms. Usage:
+
+    python benchmarks/bench_skill_matcher.py [--sizes 250,1000,5000] [--repeat 5]
+"""
+import argparse
+import logging
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from skill_matcher import SkillMatcher
+from text_processor import COMMON_SKILLS, normalize_text
+
+SAMPLE_RESUME = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'sample-resume.txt')
+
+# The regex loop is only timed up to this size; beyond it a single resume takes seconds
+LEGACY_LIMIT = 10000
+
+
+def build_vocabulary(size, seed=42):
+    """Pad COMMON_SKILLS with deterministic synthetic terms up to the given size"""
+    rng = random.Random(seed)
+    vocabulary = list(dict.fromkeys(COMMON_SKILLS))
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    while len(vocabulary) < size:
+        words = [''.join(rng.choice(letters) for _ in range(rng.randint(3, 9))) for _ in range(rng.randint(1, 3))]
+        vocabulary.append(' '.join(words))
+    return vocabulary[:size]
+
+
+def legacy_extract(text, vocabulary):
+    """The per-skill regex loop that extract_skills used before SkillMatcher"""
+    found = set()
+    for skill in vocabulary:
+        if re.search(r'\b' + re.escape(skill) + r'\b', text, re.IGNORECASE):
+            found.add(skill)
+    return found
+
+
+def time_call(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default='250,1000,5000,10000,50000')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    logging.disable(logging.DEBUG)
+    with open(SAMPLE_RESUME) as f:
+        text = normalize_text(f.read())
+
+    print(f"Resume length: {len(text)} characters")
+    print(f"{'terms':>8} {'compile (ms)':>13} {'matcher (ms)':>13} {'regex loop (ms)':>16} {'speedup':>8}")
+    for size in (int(s) for s in args.sizes.split(',')):
+        vocabulary = build_vocabulary(size)
+
+        start = time.perf_counter()
+        matcher = SkillMatcher(vocabulary)
+        compile_time = time.perf_counter() - start
+
+        matcher_time = time_call(lambda: matcher.match(text), args.repeat)
+        if size <= LEGACY_LIMIT:
+            legacy_time = time_call(lambda: legacy_extract(text, vocabulary), args.repeat)
+            legacy_column = f"{legacy_time * 1000:16.2f}"
+            speedup_column = f"{legacy_time / matcher_time:7.1f}x"
+        else:
+            legacy_column = f"{'skipped':>16}"
+            speedup_column = f"{'-':>8}"
+
+        print(f"{size:>8} {compile_time * 1000:13.1f} {matcher_time * 1000:13.2f} {legacy_column} {speedup_column}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Shared fixtures for the microbenchmark suite
+
+The corpus is generated once per session from fixed seeds, so every run
+measures the same inputs.
+"""
+import os
+import sys
+import logging
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# The app module connects to DATABASE_URL on import; benchmarks only need a
+# throwaway database for the ORM scoring path
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+
+from corpus import generate_resume, write_docx, write_pdf
+
+CORPUS_SEED = 1234
+
+
+@pytest.fixture(autouse=True, scope='session')
+def quiet_logging():
+    """Keep debug logging out of the timed code paths"""
+    logging.disable(logging.INFO)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+@pytest.fixture(scope='session', params=['standard', 'bullets', 'no_headers'])
+def resume_text(request):
+    return generate_resume(CORPUS_SEED, paragraphs=8, layout=request.param)
+
+
+@pytest.fixture(scope='session')
+def long_resume_text():
+    return generate_resume(CORPUS_SEED, paragraphs=60)
+
+
+@pytest.fixture(scope='session')
+def pdf_path(tmp_path_factory, long_resume_text):
+    path = tmp_path_factory.mktemp('corpus') / 'resume.pdf'
+    write_pdf(str(path), long_resume_text)
+    return str(path)
+
+
+@pytest.fixture(scope='session')
+def docx_path(tmp_path_factory, long_resume_text):
+    path = tmp_path_factory.mktemp('corpus') / 'resume.docx'
+    write_docx(str(path), long_resume_text)
+    return str(path)
+
+
+@pytest.fixture(scope='session')
+def flask_app():
+    from app import app
+    with app.app_context():
+        yield app
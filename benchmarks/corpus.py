@@ -0,0 +1,194 @@
+"""
+Deterministic synthetic resume generator for benchmarks.
+
+Resumes are built from a seeded random generator, so the same arguments
+always produce the same text and the same files. Usage:
+
+    python benchmarks/corpus.py OUT_DIR [--count 100] [--formats txt,docx,pdf]
+        [--paragraphs 8] [--skill-density 0.3] [--layout standard]
+"""
+import os
+import sys
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from text_processor import COMMON_SKILLS
+
+LAYOUTS = ('standard', 'bullets', 'no_headers')
+
+FIRST_NAMES = ['Ada', 'Grace', 'Alan', 'Linus', 'Margaret', 'Dennis', 'Barbara', 'Ken', 'Radia', 'Guido']
+LAST_NAMES = ['Lovelace', 'Hopper', 'Turing', 'Torvalds', 'Hamilton', 'Ritchie', 'Liskov', 'Thompson', 'Perlman', 'Rossum']
+TITLES = ['Software Engineer', 'Senior Developer', 'Data Analyst', 'DevOps Engineer', 'Project Manager', 'Consultant']
+COMPANIES = ['Acme Corp', 'Globex', 'Initech', 'Umbrella', 'Hooli', 'Stark Industries', 'Wayne Enterprises']
+FILLER = (
+    'delivered projects on schedule while working closely with stakeholders across several teams '
+    'improved reliability and reduced costs by automating manual processes and reviewing designs '
+    'mentored junior colleagues and documented the architecture for future maintainers'
+).split()
+
+
+def generate_resume(seed=0, paragraphs=8, skill_density=0.3, layout='standard'):
+    """
+    Build the text of a synthetic resume
+
+    Args:
+        seed (int): Seed for the random generator; equal seeds give equal text
+        paragraphs (int): Number of experience paragraphs, controls length
+        skill_density (float): Fraction of filler words replaced by vocabulary skills
+        layout (str): 'standard' (headed sections), 'bullets' (bulleted skill
+            lists) or 'no_headers' (free text without section headers)
+
+    Returns:
+        str: Resume text
+    """
+    if layout not in LAYOUTS:
+        raise ValueError(f"Unknown layout: {layout}")
+    rng = random.Random(seed)
+
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    lines = [
+        name,
+        f"{name.lower().replace(' ', '.')}@example.com | (555) {rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+        ''
+    ]
+
+    skills = rng.sample(COMMON_SKILLS, min(len(COMMON_SKILLS), 8 + int(40 * skill_density)))
+    if layout == 'standard':
+        lines += ['Skills', ', '.join(skills), '']
+    elif layout == 'bullets':
+        lines += ['Technical Skills'] + [f"• {skill}" for skill in skills] + ['']
+
+    if layout != 'no_headers':
+        lines.append('Work Experience')
+    for index in range(paragraphs):
+        start_year = 2024 - 2 * (index + 1)
+        lines.append(f"{rng.choice(TITLES)} at {rng.choice(COMPANIES)}, {start_year} - {start_year + 2}")
+        words = [
+            rng.choice(COMMON_SKILLS) if rng.random() < skill_density else rng.choice(FILLER)
+            for _ in range(rng.randint(40, 80))
+        ]
+        lines.append(' '.join(words).capitalize() + '.')
+        lines.append('')
+
+    if layout != 'no_headers':
+        lines.append('Education')
+    lines.append(f"B.Sc. Computer Science, {rng.choice(['State University', 'Tech Institute', 'City College'])}")
+    return '\n'.join(lines)
+
+
+def write_txt(path, text):
+    with open(path, 'w') as f:
+        f.write(text)
+
+
+def write_docx(path, text):
+    """Write the text as a DOCX document, one paragraph per line"""
+    import docx
+    document = docx.Document()
+    for line in text.split('\n'):
+        document.add_paragraph(line)
+    document.save(path)
+
+
+def _pdf_escape(line):
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def _wrap(text, width=90):
+    for line in text.split('\n'):
+        while len(line) > width:
+            cut = line.rfind(' ', 0, width)
+            cut = cut if cut > 0 else width
+            yield line[:cut]
+            line = line[cut:].lstrip()
+        yield line
+
+
+def write_pdf(path, text, lines_per_page=60):
+    """
+    Write the text as a minimal multi-page PDF using the built-in Helvetica font
+
+    The writer has no dependencies, so benchmark fixtures can be generated
+    anywhere PyPDF2 can read them back.
+    """
+    lines = list(_wrap(text))
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+
+    # Object 1: catalog, 2: page tree, 3: font, then a page and a content stream per page
+    objects = [None, None, b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>']
+    page_ids = []
+    for page_lines in pages:
+        content = 'BT /F1 10 Tf 12 TL 50 780 Td\n' + ''.join(f'({_pdf_escape(line)}) Tj T*\n' for line in page_lines) + 'ET'
+        content = content.encode('cp1252', errors='replace')
+        objects.append(b'<< /Length %d >>\nstream\n%s\nendstream' % (len(content), content))
+        content_id = len(objects)
+        objects.append(
+            b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] '
+            b'/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>' % content_id
+        )
+        page_ids.append(len(objects))
+    objects[0] = b'<< /Type /Catalog /Pages 2 0 R >>'
+    objects[1] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (
+        b' '.join(b'%d 0 R' % page_id for page_id in page_ids), len(page_ids)
+    )
+
+    output = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b'%d 0 obj\n%s\nendobj\n' % (number, body)
+    xref_offset = len(output)
+    output += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    output += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+    output += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref_offset)
+
+    with open(path, 'wb') as f:
+        f.write(output)
+
+
+WRITERS = {'txt': write_txt, 'docx': write_docx, 'pdf': write_pdf}
+
+
+def generate_corpus(out_dir, count=100, formats=('txt',), paragraphs=8, skill_density=0.3, layout='standard'):
+    """
+    Write count synthetic resumes per format into out_dir
+
+    Returns:
+        list: Paths of the written files
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for seed in range(count):
+        text = generate_resume(seed, paragraphs=paragraphs, skill_density=skill_density, layout=layout)
+        for file_format in formats:
+            path = os.path.join(out_dir, f'resume_{seed:05d}.{file_format}')
+            WRITERS[file_format](path, text)
+            paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a deterministic synthetic resume corpus")
+    parser.add_argument('out_dir')
+    parser.add_argument('--count', type=int, default=100)
+    parser.add_argument('--formats', default='txt', help="Comma-separated: txt,docx,pdf")
+    parser.add_argument('--paragraphs', type=int, default=8)
+    parser.add_argument('--skill-density', type=float, default=0.3)
+    parser.add_argument('--layout', choices=LAYOUTS, default='standard')
+    args = parser.parse_args()
+
+    paths = generate_corpus(
+        args.out_dir,
+        count=args.count,
+        formats=args.formats.split(','),
+        paragraphs=args.paragraphs,
+        skill_density=args.skill_density,
+        layout=args.layout
+    )
+    print(f"Wrote {len(paths)} files to {args.out_dir}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Microbenchmarks for the resume processing hot paths
+
+Run from the repository root (requires pytest-benchmark):
+
+    pytest benchmarks --benchmark-autosave
+
+saves a baseline under .benchmarks/. After a change, compare against the
+latest saved run and fail on regressions:
+
+    pytest benchmarks --benchmark-compare --benchmark-compare-fail=mean:15%
+"""
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from resume_parser import parse_pdf, parse_docx
+from text_processor import normalize_text, extract_sections, extract_skills, extract_experience
+from scoring import match_score
+
+
+def test_parse_pdf(benchmark, pdf_path):
+    text = benchmark(parse_pdf, pdf_path)
+    assert 'Work Experience' in text
+
+
+def test_parse_docx(benchmark, docx_path):
+    text = benchmark(parse_docx, docx_path)
+    assert 'Work Experience' in text
+
+
+def test_normalize_text(benchmark, resume_text):
+    benchmark(normalize_text, resume_text)
+
+
+def test_extract_sections(benchmark, resume_text):
+    benchmark(extract_sections, resume_text)
+
+
+def test_extract_skills(benchmark, resume_text):
+    sections = extract_sections(resume_text)
+    skills = benchmark(extract_skills, resume_text, sections)
+    assert skills
+
+
+def test_extract_experience(benchmark, resume_text):
+    sections = extract_sections(resume_text)
+    benchmark(extract_experience, resume_text, sections)
+
+
+def test_extract_candidate_info(benchmark, flask_app, resume_text):
+    from app import extract_candidate_info
+    info = benchmark(extract_candidate_info, resume_text)
+    assert info['email']
+
+
+def test_match_score(benchmark, resume_text):
+    resume_skills = extract_skills(resume_text, extract_sections(resume_text))
+    job_skills = resume_skills[::2] + ['kubernetes', 'terraform', 'go']
+    benchmark(match_score, resume_skills, job_skills)
+
+
+def test_calculate_match_score(benchmark, flask_app, resume_text):
+    from models import db, JobDescription, Resume
+
+    db.create_all()
+    resume_skills = extract_skills(resume_text, extract_sections(resume_text))
+    job = JobDescription(title='Benchmark', description='Synthetic job')
+    job.set_required_skills(resume_skills[::2] + ['kubernetes', 'terraform'])
+    resume = Resume(filename='resume.txt', raw_text=resume_text, job_description=job)
+    resume.set_skills(resume_skills)
+    db.session.add_all([job, resume])
+    db.session.flush()
+    try:
+        score = benchmark(resume.calculate_match_score)
+        assert 0 < score <= 100
+    finally:
+        db.session.rollback()
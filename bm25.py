@@ -0,0 +1,202 @@
+import re
+import math
+import heapq
+import logging
+from collections import Counter
+from collections.abc import Mapping
+
+from sqlalchemy import case, event, func, insert, delete, select
+
+from models import db, Resume, BM25Term, BM25Document, BM25Posting, insert_ignore
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Standard Okapi BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Words like c++, c#, node.js and asp.net stay single tokens
+TOKEN_PATTERN = re.compile(r'[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*')
+
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'have', 'in', 'is', 'it',
+    'its', 'of', 'on', 'or', 'that', 'the', 'this', 'to', 'was', 'were', 'will', 'with', 'we', 'you',
+    'our', 'your', 'their', 'they', 'i', 'my', 'me', 'he', 'she', 'his', 'her', 'not', 'but', 'all',
+    'can', 'etc', 'also', 'such', 'than', 'other', 'who', 'which', 'what', 'when', 'where', 'how'
+}
+
+MAX_TERM_LENGTH = 64
+# Query terms scored per ranking, the highest weighted first
+MAX_QUERY_TERMS = 32
+
+
+def tokenize(text):
+    """Split text into lowercase index terms, dropping stopwords"""
+    return [
+        token for token in TOKEN_PATTERN.findall(text.lower())
+        if token not in STOPWORDS and len(token) <= MAX_TERM_LENGTH
+    ]
+
+
+def _term_ids(connection, terms):
+    """
+    Return term -> id for the given terms, inserting any new ones
+
+    Runs inside the resume INSERT's flush, so a term another upload adds at
+    the same moment must not raise: colliding inserts are skipped and the
+    winner's id is read back with a locking read, which also sees rows
+    committed after this transaction's MySQL snapshot.
+    """
+    if not terms:
+        return {}
+    ids = dict(connection.execute(select(BM25Term.term, BM25Term.id).where(BM25Term.term.in_(terms))).all())
+    missing = sorted(set(terms) - ids.keys())
+    if missing:
+        connection.execute(insert_ignore(BM25Term, connection), [{'term': term} for term in missing])
+        ids.update(connection.execute(
+            select(BM25Term.term, BM25Term.id).where(BM25Term.term.in_(missing)).with_for_update(read=True)
+        ).all())
+    return ids
+
+
+def index_document(connection, resume_id, job_description_id, text):
+    """Add one resume's text to the inverted index"""
+    tokens = tokenize(text or '')
+    counts = Counter(tokens)
+    term_ids = _term_ids(connection, list(counts))
+
+    connection.execute(insert(BM25Document).values(
+        resume_id=resume_id,
+        job_description_id=job_description_id,
+        length=len(tokens)
+    ))
+    if counts:
+        connection.execute(insert(BM25Posting), [
+            {'term_id': term_ids[term], 'resume_id': resume_id, 'tf': tf} for term, tf in counts.items()
+        ])
+
+
+def remove_document(connection, resume_id):
+    """Drop one resume from the inverted index"""
+    connection.execute(delete(BM25Posting).where(BM25Posting.resume_id == resume_id))
+    connection.execute(delete(BM25Document).where(BM25Document.resume_id == resume_id))
+
+
+# Keep the index in step with every code path that inserts or deletes resumes
+@event.listens_for(Resume, 'after_insert')
+def _index_inserted_resume(mapper, connection, resume):
+    index_document(connection, resume.id, resume.job_description_id, resume.raw_text)
+
+
+@event.listens_for(Resume, 'before_delete')
+def _unindex_deleted_resume(mapper, connection, resume):
+    remove_document(connection, resume.id)
+
+
+def rank(query_text, k=10, job_id=None):
+    """
+    Rank indexed resumes against a query text (typically a job description)
+
+    Args:
+        query_text (str): Text to rank resumes against
+        k (int): Number of results to return
+        job_id (int): Only rank resumes uploaded for this job
+
+    Returns:
+        list: (resume_id, score) tuples, best first
+    """
+    return rank_terms(tokenize(query_text or ''), k=k, job_id=job_id)
+
+
+def rank_terms(query_terms, k=10, job_id=None, max_terms=MAX_QUERY_TERMS):
+    """
+    Rank indexed resumes against already tokenized query terms, such as the
+    term vector of a job profile
+
+    Only the max_terms query terms of highest weight (query frequency times
+    idf) are scored, so a long job description doesn't pull in the postings
+    of every common word it contains. The scores are summed in the database,
+    which returns just the top k resumes.
+
+    Args:
+        query_terms: Query tokens, or a mapping of term -> query frequency
+        k (int): Number of results to return
+        job_id (int): Only rank resumes uploaded for this job
+        max_terms (int): Query terms scored
+
+    Returns:
+        list: (resume_id, score) tuples, best first
+    """
+    query_counts = Counter(query_terms) if not isinstance(query_terms, Mapping) else Counter(dict(query_terms))
+    if not query_counts:
+        return []
+
+    documents = db.session.query(func.count(BM25Document.resume_id), func.avg(BM25Document.length))
+    if job_id:
+        documents = documents.filter(BM25Document.job_description_id == job_id)
+    doc_count, avg_length = documents.one()
+    if not doc_count:
+        return []
+    avg_length = float(avg_length) or 1.0
+
+    term_ids = dict(db.session.query(BM25Term.id, BM25Term.term).filter(BM25Term.term.in_(query_counts)).all())
+    if not term_ids:
+        return []
+
+    # Document frequencies are counted from the postings index, so nothing
+    # has to be updated in place when documents come and go
+    frequencies = db.session.query(BM25Posting.term_id, func.count(BM25Posting.resume_id)).filter(
+        BM25Posting.term_id.in_(term_ids)
+    )
+    if job_id:
+        frequencies = frequencies.join(BM25Document, BM25Document.resume_id == BM25Posting.resume_id).filter(
+            BM25Document.job_description_id == job_id
+        )
+    idf = {
+        term_id: math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+        for term_id, df in frequencies.group_by(BM25Posting.term_id).all()
+    }
+    if not idf:
+        return []
+    idf = dict(heapq.nlargest(
+        max_terms, idf.items(), key=lambda item: (query_counts[term_ids[item[0]]] * item[1], term_ids[item[0]])
+    ))
+
+    # K1 * (1 - B + B * length / avg_length) with the constants folded in Python
+    norm = K1 * (1 - B) + (K1 * B / avg_length) * BM25Document.length
+    score = func.sum(
+        case(idf, value=BM25Posting.term_id) * BM25Posting.tf * (K1 + 1) / (BM25Posting.tf + norm)
+    ).label('score')
+    ranked = select(BM25Posting.resume_id, score).join(
+        BM25Document, BM25Document.resume_id == BM25Posting.resume_id
+    ).where(BM25Posting.term_id.in_(idf))
+    if job_id:
+        ranked = ranked.where(BM25Document.job_description_id == job_id)
+    ranked = ranked.group_by(BM25Posting.resume_id).order_by(score.desc(), BM25Posting.resume_id).limit(k)
+
+    return [(resume_id, float(total)) for resume_id, total in db.session.execute(ranked)]
+
+
+def rebuild_index(batch_size=500):
+    """
+    Index every stored resume that is not in the BM25 index yet
+
+    Returns:
+        int: Number of resumes indexed
+    """
+    indexed = select(BM25Document.resume_id)
+    count = 0
+    while True:
+        rows = db.session.query(Resume.id, Resume.job_description_id, Resume.raw_text).filter(
+            Resume.id.notin_(indexed)
+        ).order_by(Resume.id).limit(batch_size).all()
+        if not rows:
+            break
+        connection = db.session.connection()
+        for resume_id, job_description_id, raw_text in rows:
+            index_document(connection, resume_id, job_description_id, raw_text)
+        db.session.commit()
+        count += len(rows)
+        logger.debug(f"BM25 indexed {count} resumes")
+    return count
@@ -0,0 +1,237 @@
+import os
+import time
+import logging
+import threading
+from collections import defaultdict
+
+from sqlalchemy import delete, insert, or_
+
+from models import db, JobDescription, JobMatch, JobProfile, Resume, RESUME_LIST_COLUMNS, decode_skill_ids
+from job_matchers import job_matchers
+from skill_vocabulary import skill_vocabulary
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Pairs scoring below this are not stored; the table only serves strong matches
+CROSS_MATCH_MIN_SCORE = float(os.environ.get('CROSS_MATCH_MIN_SCORE', 50))
+# Resumes scored per batch when backfilling, and open jobs loaded per query
+CROSS_MATCH_BATCH_SIZE = 2000
+
+
+def open_jobs_filter():
+    """Condition selecting jobs that take part in cross-job matching"""
+    return or_(JobDescription.is_open.is_(None), JobDescription.is_open.is_(True))
+
+
+class _OpenJobs:
+    """
+    Matchers of every open job, with an index from each skill id to the open
+    jobs it satisfies a required skill of
+
+    Only the jobs a resume's skill ids reach can score above zero, so a
+    resume is scored by those matchers alone. The index is rebuilt when the
+    set of open jobs, any of their versions or the skill vocabulary changes.
+    """
+
+    def __init__(self):
+        self._key = None
+        self._jobs = ([], {})
+        self._lock = threading.Lock()
+
+    def get(self):
+        """
+        Returns:
+            tuple: (JobMatcher list of the open jobs, dict of skill id to
+                the indexes in that list of the jobs it can match)
+        """
+        versions = tuple(db.session.query(JobDescription.id, JobDescription.version).filter(
+            open_jobs_filter()
+        ).order_by(JobDescription.id).all())
+        key = (versions, skill_vocabulary.generation)
+        with self._lock:
+            if key == self._key:
+                return self._jobs
+            matchers = {matcher.job_id: matcher for matcher in self._jobs[0]}
+
+        stale = [job_id for job_id, version in versions if getattr(matchers.get(job_id), 'version', None) != version]
+        for start in range(0, len(stale), CROSS_MATCH_BATCH_SIZE):
+            # Only the columns a matcher is built from
+            for job in JobDescription.query.options(
+                db.load_only(JobDescription.id, JobDescription.version, JobDescription.required_skills),
+                db.joinedload(JobDescription.profile).load_only(JobProfile.version, JobProfile.skills)
+            ).filter(JobDescription.id.in_(stale[start:start + CROSS_MATCH_BATCH_SIZE])):
+                matchers[job.id] = job_matchers.get(job)
+
+        matchers = [matchers[job_id] for job_id, _ in versions if job_id in matchers]
+        postings = defaultdict(list)
+        for index, matcher in enumerate(matchers):
+            matcher.catch_up()
+            for skill_id in matcher.satisfiers:
+                postings[skill_id].append(index)
+        jobs = (matchers, dict(postings))
+        with self._lock:
+            self._key, self._jobs = key, jobs
+        return jobs
+
+
+_open_jobs = _OpenJobs()
+
+
+def score_resume(resume_skills, resume_ids, matchers, postings):
+    """
+    Score one resume against the open jobs
+
+    Args:
+        resume_skills (list): The resume's skill list
+        resume_ids (frozenset): Its decoded skill ids
+        matchers, postings: _OpenJobs.get() output
+
+    Returns:
+        dict: Score of every job with a non-zero score, by job id
+    """
+    if resume_ids and skill_vocabulary.knows(resume_ids):
+        candidates = {index for skill_id in resume_ids for index in postings.get(skill_id, ())}
+        scores = {matchers[index].job_id: matchers[index].score_ids(resume_ids) for index in candidates}
+    else:
+        # Skills not committed (or loaded) yet can't be looked up by id
+        scores = {matcher.job_id: matcher.score_skills(resume_skills) for matcher in matchers}
+    return {job_id: score for job_id, score in scores.items() if score}
+
+
+def _store_scores(rows, min_score):
+    """
+    Insert the strong matches of (resume id, {job id: score}) rows
+
+    Returns:
+        int: Number of matches stored
+    """
+    matches = [
+        {'resume_id': resume_id, 'job_description_id': job_id, 'score': float(score)}
+        for resume_id, scores in rows
+        for job_id, score in scores.items() if score >= min_score
+    ]
+    if matches:
+        db.session.execute(insert(JobMatch), matches)
+    return len(matches)
+
+
+def match_resumes(resumes, min_score=CROSS_MATCH_MIN_SCORE):
+    """
+    Score resumes against every open job and store the strong matches
+
+    Each resume is scored by the matchers of the jobs its skill ids can
+    satisfy, the same JobMatcher objects that score uploads against their
+    own job, so adding jobs only costs the ones a resume's skills reach.
+    Earlier matches of these resumes are replaced. The caller commits.
+
+    Args:
+        resumes (list): Flushed Resume rows
+        min_score (float): Lowest score stored
+
+    Returns:
+        int: Number of (resume, job) matches stored
+    """
+    resumes = [resume for resume in resumes if resume.id is not None]
+    if not resumes:
+        return 0
+    resume_ids = {resume.id: decode_skill_ids(resume.skill_ids) for resume in resumes}
+    if not skill_vocabulary.knows(frozenset().union(*resume_ids.values())):
+        skill_vocabulary.refresh()
+    matchers, postings = _open_jobs.get()
+    if not matchers:
+        return 0
+
+    db.session.execute(delete(JobMatch).where(JobMatch.resume_id.in_(list(resume_ids))))
+    return _store_scores([
+        (resume.id, score_resume(resume.get_skills(), resume_ids[resume.id], matchers, postings))
+        for resume in resumes
+    ], min_score)
+
+
+def backfill_job(job_id, batch_size=CROSS_MATCH_BATCH_SIZE, min_score=CROSS_MATCH_MIN_SCORE):
+    """
+    (Re)compute one job's matches against every stored resume and commit
+
+    Resumes are read in keyset-paginated batches of id and skills only and
+    scored by the job's matcher.
+
+    Returns:
+        dict: 'job_id', resumes 'scored', matches 'stored' and 'seconds'
+    """
+    job = db.session.get(JobDescription, job_id)
+    if job is None:
+        raise ValueError(f"Job description {job_id} not found")
+
+    start = time.perf_counter()
+    matcher = job_matchers.get(job)
+    db.session.execute(delete(JobMatch).where(JobMatch.job_description_id == job_id))
+    scored = stored = 0
+    last_id = 0
+    # Closed jobs and jobs without skills keep no matches
+    while matcher.skills and job.is_open is not False:
+        rows = db.session.query(Resume.id, Resume.skill_ids, Resume.extracted_skills).filter(
+            Resume.id > last_id
+        ).order_by(Resume.id).limit(batch_size).all()
+        if not rows:
+            break
+        stored += _store_scores([
+            (resume_id, {job_id: matcher.score(Resume.decode_skills(skills), decode_skill_ids(skill_ids))})
+            for resume_id, skill_ids, skills in rows
+        ], min_score)
+        db.session.commit()
+        scored += len(rows)
+        last_id = rows[-1].id
+    db.session.commit()
+
+    seconds = time.perf_counter() - start
+    logger.info(f"Cross-matched {scored} resumes against job {job_id} in {seconds:.2f}s: {stored} matches")
+    return {'job_id': job_id, 'scored': scored, 'stored': stored, 'seconds': round(seconds, 3)}
+
+
+def rebuild_matches(batch_size=CROSS_MATCH_BATCH_SIZE, min_score=CROSS_MATCH_MIN_SCORE):
+    """
+    Recompute the whole match table: every resume against every open job
+
+    Returns:
+        int: Number of matches stored
+    """
+    # Resume ids the vocabulary hasn't loaded would be scored from their skill lists
+    skill_vocabulary.refresh()
+    matchers, postings = _open_jobs.get()
+    db.session.execute(delete(JobMatch))
+    stored = 0
+    last_id = 0
+    while matchers:
+        rows = db.session.query(Resume.id, Resume.skill_ids, Resume.extracted_skills).filter(
+            Resume.id > last_id
+        ).order_by(Resume.id).limit(batch_size).all()
+        if not rows:
+            break
+        stored += _store_scores([
+            (resume_id, score_resume(Resume.decode_skills(skills), decode_skill_ids(skill_ids), matchers, postings))
+            for resume_id, skill_ids, skills in rows
+        ], min_score)
+        db.session.commit()
+        last_id = rows[-1].id
+        logger.debug(f"Cross-matched resumes up to id {last_id}")
+    db.session.commit()
+    return stored
+
+
+def strong_candidates_elsewhere(job_id, limit=10):
+    """
+    Best stored matches for a job among resumes uploaded for other jobs
+
+    Returns:
+        list: (Resume, score) tuples, best first
+    """
+    return db.session.query(Resume, JobMatch.score).options(
+        db.load_only(*RESUME_LIST_COLUMNS),
+        db.joinedload(Resume.job_description).load_only(JobDescription.id, JobDescription.title)
+    ).join(
+        JobMatch, JobMatch.resume_id == Resume.id
+    ).filter(
+        JobMatch.job_description_id == job_id,
+        or_(Resume.job_description_id.is_(None), Resume.job_description_id != job_id)
+    ).order_by(JobMatch.score.desc(), JobMatch.resume_id).limit(limit).all()
@@ -0,0 +1,79 @@
+import io
+import csv
+import json
+import logging
+
+from sqlalchemy import select
+
+from models import db, Resume, RESUME_RANK
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Rows fetched per round trip from the server-side cursor
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_FIELDS = ['rank', 'resume_id', 'candidate_name', 'email', 'phone', 'filename', 'match_score', 'skills', 'created_at']
+
+
+def iter_ranked_candidates(job_id, batch_size=EXPORT_BATCH_SIZE):
+    """
+    Yield every resume of a job as a plain dict, best match first
+
+    Only the exported columns are selected, as tuples rather than ORM
+    objects, and rows are streamed from a server-side cursor in batches, so
+    memory stays flat however many candidates the job has.
+
+    Yields:
+        dict: One row per candidate, keyed by EXPORT_FIELDS
+    """
+    statement = select(
+        Resume.id, Resume.candidate_name, Resume.email, Resume.phone, Resume.filename,
+        Resume.match_score, Resume.extracted_skills, Resume.created_at
+    ).where(
+        Resume.job_description_id == job_id
+    ).order_by(
+        RESUME_RANK.desc(), Resume.id.desc()
+    ).execution_options(stream_results=True, yield_per=batch_size)
+
+    rank = 0
+    for resume_id, name, email, phone, filename, score, skills, created_at in db.session.execute(statement):
+        rank += 1
+        yield {
+            'rank': rank,
+            'resume_id': resume_id,
+            'candidate_name': name,
+            'email': email,
+            'phone': phone,
+            'filename': filename,
+            'match_score': score,
+            'skills': Resume.decode_skills(skills),
+            'created_at': created_at.isoformat() if created_at else None
+        }
+
+
+def csv_lines(rows):
+    """Encode rows as CSV text, header first, skills joined by ';'"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+    writer.writeheader()
+    for row in rows:
+        writer.writerow({**row, 'skills': ';'.join(row['skills'])})
+        # Hand each line to the response as soon as it is written
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def jsonl_lines(rows):
+    """Encode rows as JSON lines"""
+    for row in rows:
+        yield json.dumps(row) + '\n'
+
+
+EXPORT_FORMATS = {
+    'csv': (csv_lines, 'text/csv'),
+    'jsonl': (jsonl_lines, 'application/x-ndjson'),
+}
@@ -0,0 +1,134 @@
+import re
+import logging
+
+from sqlalchemy import func, inspect, literal_column, text
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.sql import column, table
+
+from models import db, Resume, RESUME_LIST_COLUMNS
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Resume columns covered by the full-text index
+FULLTEXT_COLUMNS = ('candidate_name', 'raw_text')
+MYSQL_INDEX_NAME = 'ft_resumes_text'
+SQLITE_FTS_TABLE = 'resumes_fts'
+
+# Words of a search query; everything else (quotes, operators) is dropped
+WORD_PATTERN = re.compile(r'\w[\w+#.]*\w|\w', re.UNICODE)
+MAX_QUERY_WORDS = 32
+
+_fts = table(SQLITE_FTS_TABLE, column('rowid'))
+
+# SQLite has no native full-text index on a regular table, so an external
+# content FTS5 table mirrors the resume columns and triggers keep it in sync
+_SQLITE_DDL = [
+    f"CREATE VIRTUAL TABLE {SQLITE_FTS_TABLE} USING fts5("
+    f"{', '.join(FULLTEXT_COLUMNS)}, content='resumes', content_rowid='id')",
+    f"CREATE TRIGGER resumes_fts_insert AFTER INSERT ON resumes BEGIN "
+    f"INSERT INTO {SQLITE_FTS_TABLE}(rowid, {', '.join(FULLTEXT_COLUMNS)}) "
+    f"VALUES (new.id, {', '.join('new.' + name for name in FULLTEXT_COLUMNS)}); END",
+    f"CREATE TRIGGER resumes_fts_delete AFTER DELETE ON resumes BEGIN "
+    f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, {', '.join(FULLTEXT_COLUMNS)}) "
+    f"VALUES ('delete', old.id, {', '.join('old.' + name for name in FULLTEXT_COLUMNS)}); END",
+    f"CREATE TRIGGER resumes_fts_update AFTER UPDATE OF {', '.join(FULLTEXT_COLUMNS)} ON resumes BEGIN "
+    f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, {', '.join(FULLTEXT_COLUMNS)}) "
+    f"VALUES ('delete', old.id, {', '.join('old.' + name for name in FULLTEXT_COLUMNS)}); "
+    f"INSERT INTO {SQLITE_FTS_TABLE}(rowid, {', '.join(FULLTEXT_COLUMNS)}) "
+    f"VALUES (new.id, {', '.join('new.' + name for name in FULLTEXT_COLUMNS)}); END",
+    # Index the resumes stored before the table existed
+    f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}) VALUES ('rebuild')",
+]
+
+
+def ensure_fulltext_index(db):
+    """
+    Create the native full-text index over resume text if it is missing
+
+    MySQL gets a FULLTEXT index on the resumes table, which the server keeps
+    current on every insert, update and delete. SQLite gets an FTS5 table
+    synced by triggers. Other databases are left alone and searched with LIKE.
+
+    Returns:
+        bool: Whether an index was created
+    """
+    dialect = db.engine.dialect.name
+    inspector = inspect(db.engine)
+    if dialect == 'mysql':
+        if any(index['name'] == MYSQL_INDEX_NAME for index in inspector.get_indexes('resumes')):
+            return False
+        statements = [f"CREATE FULLTEXT INDEX {MYSQL_INDEX_NAME} ON resumes ({', '.join(FULLTEXT_COLUMNS)})"]
+    elif dialect == 'sqlite':
+        if SQLITE_FTS_TABLE in inspector.get_table_names():
+            return False
+        statements = _SQLITE_DDL
+    else:
+        logger.warning(f"No native full-text index for {dialect}; resume search will scan with LIKE")
+        return False
+
+    with db.engine.begin() as conn:
+        for statement in statements:
+            conn.execute(text(statement))
+    logger.info(f"Created the {dialect} full-text index on resumes")
+    return True
+
+
+def query_words(query):
+    """Split a search query into plain words, dropping any search syntax"""
+    return WORD_PATTERN.findall(query or '')[:MAX_QUERY_WORDS]
+
+
+def _search_query(words):
+    """
+    Build the ranked resume query for the current database
+
+    Returns:
+        Query: (Resume, score) rows with higher scores more relevant, unordered
+    """
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'mysql':
+        # Natural language mode ranks any-word matches by relevance
+        relevance = match(Resume.candidate_name, Resume.raw_text, against=' '.join(words)).in_natural_language_mode()
+        return db.session.query(Resume, relevance.label('score')).filter(relevance > 0)
+    if dialect == 'sqlite':
+        # Quoted terms are literal in FTS5, and OR mirrors MySQL's natural language mode
+        fts_query = ' OR '.join('"{}"'.format(word.replace('"', '""')) for word in words)
+        fts_table = literal_column(SQLITE_FTS_TABLE)
+        # bm25() is lower for better matches
+        relevance = -func.bm25(fts_table)
+        return db.session.query(Resume, relevance.label('score')).join(
+            _fts, _fts.c.rowid == Resume.id
+        ).filter(fts_table.op('MATCH')(fts_query))
+
+    conditions = [Resume.raw_text.ilike(f'%{word}%') for word in words]
+    relevance = sum(db.case((condition, 1), else_=0) for condition in conditions)
+    return db.session.query(Resume, relevance.label('score')).filter(db.or_(*conditions))
+
+
+def search_resumes(query, job_id=None, page=1, per_page=20):
+    """
+    Full-text search over stored resume text, most relevant first
+
+    Args:
+        query (str): Free-text query; resumes matching any word are returned
+        job_id (int): Only search resumes uploaded for this job
+        page (int): 1-based page number
+        per_page (int): Results per page
+
+    Returns:
+        tuple: (list of (Resume, score) tuples, total number of matches)
+    """
+    words = query_words(query)
+    if not words:
+        return [], 0
+
+    results = _search_query(words)
+    if job_id:
+        results = results.filter(Resume.job_description_id == job_id)
+
+    total = results.with_entities(func.count(Resume.id)).scalar()
+    rows = results.options(db.load_only(*RESUME_LIST_COLUMNS)).order_by(
+        literal_column('score').desc(), Resume.id.desc()
+    ).offset((page - 1) * per_page).limit(per_page).all()
+    return rows, total
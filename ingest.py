@@ -0,0 +1,118 @@
+import os
+import shutil
+import logging
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+from werkzeug.utils import secure_filename
+
+from resume_parser import parse_resume
+from text_processor import extract_skills_experience
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Processes used to extract the pages of long PDFs uploaded one at a time
+PDF_PAGE_WORKERS = int(os.environ.get('PDF_PAGE_WORKERS', 0)) or None
+
+# Guard against archives that expand far beyond the upload limit
+MAX_ARCHIVE_MEMBERS = 1000
+MAX_ARCHIVE_UNCOMPRESSED_BYTES = 200 * 1024 * 1024
+
+
+def read_resume_text(source, workers=PDF_PAGE_WORKERS, file_type=None):
+    """
+    Read the text of a resume
+
+    Args:
+        source: Path to a PDF, DOCX or TXT resume, its bytes, or a binary
+            file-like object
+        workers (int): Processes used for page-parallel PDF extraction
+        file_type (str): 'pdf', 'docx' or 'txt', for sources without a file name
+
+    Returns:
+        str: Extracted text content
+    """
+    return parse_resume(source, workers=workers, file_type=file_type)
+
+
+def process_resume_file(file_path):
+    """
+    Parse a resume file and extract its skills and experience
+
+    Args:
+        file_path (str): Path to the resume file
+
+    Returns:
+        dict: 'text' and 'extracted' on success, 'error' on failure
+    """
+    try:
+        # Already running inside a pool worker, so parse pages serially
+        text_content = read_resume_text(file_path, workers=1)
+        return {'text': text_content, 'extracted': extract_skills_experience(text_content)}
+    except Exception as e:
+        logger.error(f"Error processing {file_path}: {str(e)}")
+        return {'error': str(e)}
+
+
+def process_resume_files(file_paths, workers=None, chunksize=4):
+    """
+    Parse and extract a list of resume files across a process pool
+
+    Args:
+        file_paths (list): Paths to the resume files
+        workers (int): Number of worker processes (defaults to the CPU count)
+        chunksize (int): Number of files sent to a worker per task
+
+    Returns:
+        list: Result of process_resume_file for each path, in input order
+    """
+    if not file_paths:
+        return []
+
+    workers = min(workers or os.cpu_count() or 1, len(file_paths))
+    if workers == 1:
+        return [process_resume_file(path) for path in file_paths]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(process_resume_file, file_paths, chunksize=chunksize))
+
+
+def extract_archive(archive, target_dir, allowed_file):
+    """
+    Extract the resume files of a ZIP archive into a directory
+
+    Directories, hidden files and entries whose extension is not allowed are
+    skipped. Entries are flattened to their base name so nothing can be
+    written outside target_dir.
+
+    Args:
+        archive (file-like or str): ZIP archive
+        target_dir (str): Directory to extract into
+        allowed_file (callable): Predicate deciding whether a filename is accepted
+
+    Returns:
+        list: (original filename, extracted path) tuples
+    """
+    extracted = []
+    with zipfile.ZipFile(archive) as zf:
+        members = [info for info in zf.infolist() if not info.is_dir()]
+        if len(members) > MAX_ARCHIVE_MEMBERS:
+            raise ValueError(f"Archive contains more than {MAX_ARCHIVE_MEMBERS} files")
+        if sum(info.file_size for info in members) > MAX_ARCHIVE_UNCOMPRESSED_BYTES:
+            raise ValueError("Archive is too large once uncompressed")
+
+        for index, info in enumerate(members):
+            name = os.path.basename(info.filename)
+            if not name or name.startswith('.') or info.filename.startswith('__MACOSX/'):
+                continue
+            if not allowed_file(name):
+                logger.debug(f"Skipping archive entry with unsupported type: {info.filename}")
+                continue
+
+            path = os.path.join(target_dir, f"{index:05d}_{secure_filename(name)}")
+            with zf.open(info) as source, open(path, 'wb') as target:
+                shutil.copyfileobj(source, target)
+            extracted.append((name, path))
+
+    return extracted
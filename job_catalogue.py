@@ -0,0 +1,272 @@
+"""
+Batch keyword extraction over job catalogue CSVs and bulk job seeding.
+
+Runs the keyword extraction of resume_exractor.ipynb (a case-insensitive
+substring test per keyword) over CSVs of any size, one chunk at a time, and
+writes CSV or Parquet:
+
+    python job_catalogue.py original_data/resume_data.csv extracted.csv
+    python job_catalogue.py big_catalogue.csv extracted.parquet --column "Job description"
+
+seed_jobs() bulk-inserts JobDescription rows with the extracted skills as
+required skills; the app exposes it as `flask seed-jobs`.
+"""
+import os
+import json
+import logging
+import argparse
+from datetime import datetime
+from functools import lru_cache
+
+from sqlalchemy import insert
+
+from models import db, JobDescription
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+JOB_CSV_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'original_data', 'resume_data.csv')
+JOB_CSV_ENCODING = 'cp1252'
+TEXT_COLUMN = 'Job description'
+TITLE_COLUMN = 'Job'
+
+# Rows read, extracted and written at a time
+CHUNK_SIZE = 10000
+# Job rows per INSERT batch when seeding
+SEED_BATCH_SIZE = 5000
+
+# Keyword lists of the notebook's extract(), in its output order
+SKILL_KEYWORDS = [
+    "AutoCAD", "Revit", "SketchUp", "3D modeling", "zoning laws",
+    "architectural drawings", "project management", "technical documentation",
+    "sustainable design", "client interaction", "project presentations",
+    "building codes", "permitting processes", "structural engineering principles",
+    "construction methods", "visualization tools", "communication skills",
+    "presentation abilities", "analytical skills", "problem-solving skills",
+    "adaptability", "collaboration", "teamwork", "independent work",
+    "Core Java", "Spring Boot", "Spring MVC", "Spring Security",
+    "SQL", "PowerPoint", "Visio", "Jira", "Java", "Python", "PHP",
+    "Micronaut", "Django", "Flask", "PostgreSQL", "Oracle", "AWS DynamoDB",
+    "SOA", "MVC", "backend development", "application architecture",
+    "data architecture", "infrastructure architecture", "Agile/Scrum",
+    "cost estimation", "survey data analysis", "CAD software", "transportation system design",
+    "hydraulic system design", "public infrastructure management",
+    "Hadoop", "ElasticSearch", "penetration testing", "firewalls", "SIEM",
+    "NAC", "encryption", "IDPS", "RMF", "NIST", "NISPOM", "STIGviewer",
+    "OpenSCAP", "network vulnerability assessment", "customer service",
+    "training and mentoring", "Microsoft Office Suite", "time management",
+    "UX/UI design", "C#", "TypeScript", "JavaScript", "HTML5", "CSS3",
+    "SASS", "PowerShell", "T-SQL", "Azure", "cloud computing",
+    "Microsoft 365", "database management"
+]
+
+EDUCATION_KEYWORDS = [
+    "Bachelor", "Master", "B.Sc", "M.Sc", "PhD", "professional degree in architecture"
+]
+
+
+class KeywordMatcher:
+    """
+    Case-insensitive substring search for a fixed keyword list over many texts
+
+    A chunk of texts is lowercased and joined into one UTF-8 byte array.
+    Positions starting with the first two bytes of any keyword are sorted
+    by that byte pair once, then every keyword narrows its bucket one byte
+    at a time with NumPy comparisons. The cost is a few passes over the
+    chunk rather than one Python-level scan per keyword per row, and the
+    result is exactly `keyword.lower() in text.lower()`.
+    """
+
+    def __init__(self, keywords):
+        # Imported here so the app can import this module without NumPy or pandas
+        import numpy as np
+
+        self.keywords = list(keywords)
+        self._keys = [keyword.lower().encode('utf-8') for keyword in self.keywords]
+        if any(len(key) < 2 for key in self._keys):
+            raise ValueError("Keywords must be at least two bytes long")
+        self._pair_codes = np.array([(key[0] << 8) | key[1] for key in self._keys], dtype=np.int64)
+        self._is_first_pair = np.zeros(1 << 16, dtype=bool)
+        self._is_first_pair[self._pair_codes] = True
+
+    def hits(self, texts):
+        """
+        Args:
+            texts (list): Strings (None counts as empty)
+
+        Returns:
+            numpy.ndarray: (len(texts), len(keywords)) boolean matrix
+        """
+        import numpy as np
+
+        encoded = [(text or '').lower().encode('utf-8') for text in texts]
+        hits = np.zeros((len(encoded), len(self._keys)), dtype=bool)
+        if not encoded:
+            return hits
+
+        # Rows are separated by a NUL byte, which no keyword contains
+        data = np.frombuffer(b'\x00'.join(encoded) + b'\x00', dtype=np.uint8)
+        lengths = np.fromiter((len(item) + 1 for item in encoded), dtype=np.int64, count=len(encoded))
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+
+        # uint16 pair codes keep the stable argsort a radix sort
+        pairs = (data[:-1].astype(np.uint16) << 8) | data[1:]
+        positions = np.flatnonzero(self._is_first_pair[pairs])
+        positions = positions[np.argsort(pairs[positions], kind='stable')]
+        bounds = np.searchsorted(pairs[positions], np.stack([self._pair_codes, self._pair_codes + 1]))
+
+        for column, key in enumerate(self._keys):
+            candidates = positions[bounds[0, column]:bounds[1, column]]
+            for offset in range(2, len(key)):
+                if not len(candidates):
+                    break
+                candidates = candidates[data[np.minimum(candidates + offset, len(data) - 1)] == key[offset]]
+            if len(candidates):
+                hits[np.searchsorted(starts, candidates, side='right') - 1, column] = True
+        return hits
+
+    def extract(self, texts, hits=None):
+        """Return the keywords found in each text, in keyword order"""
+        import numpy as np
+
+        hits = self.hits(texts) if hits is None else hits
+        return [[self.keywords[column] for column in np.flatnonzero(row)] for row in hits]
+
+
+@lru_cache(maxsize=None)
+def keyword_matchers():
+    """
+    Returns:
+        tuple: (skill, education, both) KeywordMatchers, built on first use;
+            the combined one lowercases and scans each chunk only once
+    """
+    return (
+        KeywordMatcher(SKILL_KEYWORDS),
+        KeywordMatcher(EDUCATION_KEYWORDS),
+        KeywordMatcher(SKILL_KEYWORDS + EDUCATION_KEYWORDS),
+    )
+
+
+def extract_frame(frame, column=TEXT_COLUMN):
+    """
+    Add the notebook's 'skills' and 'education' list columns to a DataFrame
+
+    Returns:
+        pandas.DataFrame: The frame with both columns appended
+    """
+    import pandas as pd
+
+    skill_keywords, education_keywords, catalogue_keywords = keyword_matchers()
+    texts = frame[column].fillna('').astype(str).tolist()
+    hits = catalogue_keywords.hits(texts)
+    skills = skill_keywords.extract(texts, hits[:, :len(SKILL_KEYWORDS)])
+    education = education_keywords.extract(texts, hits[:, len(SKILL_KEYWORDS):])
+    return frame.assign(
+        skills=pd.Series(skills, index=frame.index, dtype=object),
+        education=pd.Series(education, index=frame.index, dtype=object)
+    )
+
+
+def iter_extracted_chunks(input_path, column=TEXT_COLUMN, encoding=JOB_CSV_ENCODING, chunksize=CHUNK_SIZE):
+    """Read a CSV in chunks and yield each chunk with its extracted columns"""
+    import pandas as pd
+
+    for chunk in pd.read_csv(input_path, encoding=encoding, chunksize=chunksize):
+        yield extract_frame(chunk, column=column)
+
+
+def _write_parquet(chunks, output_path):
+    # pyarrow is only needed for Parquet output
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk, preserve_index=True)
+            if writer is None:
+                writer = pq.ParquetWriter(output_path, table.schema)
+            writer.write_table(table.cast(writer.schema))
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def process_csv(input_path, output_path, column=TEXT_COLUMN, encoding=JOB_CSV_ENCODING, chunksize=CHUNK_SIZE):
+    """
+    Extract skills and education from every row of a CSV and write the result
+
+    CSV output matches the notebook's df.to_csv() (index column, list
+    columns written as Python lists); a .parquet output path writes Parquet
+    with native list columns.
+
+    Returns:
+        int: Number of rows written
+    """
+    rows = 0
+
+    def counted(chunks):
+        nonlocal rows
+        for chunk in chunks:
+            rows += len(chunk)
+            yield chunk
+            logger.debug(f"Extracted {rows} rows from {input_path}")
+
+    chunks = counted(iter_extracted_chunks(input_path, column=column, encoding=encoding, chunksize=chunksize))
+    if output_path.lower().endswith('.parquet'):
+        _write_parquet(chunks, output_path)
+    else:
+        with open(output_path, 'w', newline='', encoding='utf-8') as output:
+            for index, chunk in enumerate(chunks):
+                chunk.to_csv(output, header=index == 0)
+    return rows
+
+
+def seed_jobs(csv_path=JOB_CSV_PATH, encoding=JOB_CSV_ENCODING, batch_size=SEED_BATCH_SIZE, is_open=True):
+    """
+    Bulk-insert a job CSV ("Job", "Job description") as JobDescription rows
+
+    Required skills are the extracted skill keywords. Each batch inserts
+    its jobs with one executemany INSERT, then commits. Job profiles and
+    cross-job matches are not computed; run `flask build-job-profiles` and
+    `flask cross-match` afterwards.
+
+    Returns:
+        int: Number of jobs inserted
+    """
+    import pandas as pd
+
+    title_length = JobDescription.title.type.length
+    count = 0
+    for chunk in iter_extracted_chunks(csv_path, encoding=encoding, chunksize=batch_size):
+        chunk = chunk[chunk[TEXT_COLUMN].notna()]
+        now = datetime.utcnow()
+        db.session.execute(insert(JobDescription), [{
+            'title': (str(title) if pd.notna(title) else 'Untitled job')[:title_length],
+            'description': description,
+            'required_skills': json.dumps(skills) if skills else None,
+            'version': 1,
+            'is_open': is_open,
+            'created_at': now
+        } for title, description, skills in zip(chunk[TITLE_COLUMN], chunk[TEXT_COLUMN], chunk['skills'])])
+        db.session.commit()
+        count += len(chunk)
+        logger.info(f"Seeded {count} job descriptions from {csv_path}")
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Extract skill and education keywords from a job CSV")
+    parser.add_argument('input', help="Input CSV")
+    parser.add_argument('output', help="Output file; .parquet writes Parquet, anything else CSV")
+    parser.add_argument('--column', default=TEXT_COLUMN, help="Text column to extract from")
+    parser.add_argument('--encoding', default=JOB_CSV_ENCODING, help="Input encoding")
+    parser.add_argument('--chunksize', type=int, default=CHUNK_SIZE, help="Rows processed at a time")
+    args = parser.parse_args(argv)
+
+    rows = process_csv(args.input, args.output, column=args.column, encoding=args.encoding, chunksize=args.chunksize)
+    print(f"Wrote {rows} rows to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
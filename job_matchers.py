@@ -0,0 +1,208 @@
+import os
+import sys
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+from models import db, JobDescription, Resume
+from scoring import normalize_skills, match_normalized
+from skill_canonical import skills_match
+from skill_vocabulary import skill_vocabulary
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Approximate memory budget for compiled job matchers
+JOB_MATCHER_CACHE_BYTES = int(os.environ.get('JOB_MATCHER_CACHE_BYTES', 32 * 1024 * 1024))
+# Jobs compiled at startup, picked by resumes received in the recent window
+JOB_MATCHER_WARM_JOBS = int(os.environ.get('JOB_MATCHER_WARM_JOBS', 20))
+JOB_MATCHER_WARM_WINDOW = timedelta(days=7)
+
+
+class JobMatcher:
+    """
+    A job's required skills, prepared once for scoring many resumes
+
+    Holds the canonical skill list and, for each of its skills, the ids of
+    the vocabulary skills that satisfy it, so a resume's skill ids are
+    scored with one set test per required skill. The id sets grow with the
+    shared skill vocabulary: skills loaded after the matcher was built are
+    checked against its required skills on the next score.
+    """
+
+    def __init__(self, job_id, version, skills):
+        self.job_id = job_id
+        self.version = version
+        self.skills = normalize_skills(skills)
+        self._lock = threading.Lock()
+        self._satisfiers = {}
+        self._generation = 0
+        if self.skills:
+            skill_vocabulary.refresh()
+            self._generation = skill_vocabulary.generation
+            self._satisfiers = {skill: skill_vocabulary.matching_ids(skill) for skill in set(self.skills)}
+        self.satisfiers = frozenset().union(*self._satisfiers.values())
+        self.size = self._measure()
+
+    def __repr__(self):
+        return f'<JobMatcher job={self.job_id} v{self.version}>'
+
+    def _measure(self):
+        """Approximate bytes held, the skill list and its id sets included"""
+        return (
+            sys.getsizeof(self) + sys.getsizeof(self.skills) + sys.getsizeof(self._satisfiers)
+            + sum(sys.getsizeof(skill) for skill in self.skills)
+            + sum(sys.getsizeof(ids) for ids in self._satisfiers.values())
+            + sys.getsizeof(self.satisfiers)
+        )
+
+    @classmethod
+    def from_job(cls, job):
+        # The precomputed profile already holds the merged canonical skills
+        return cls(job.id, job.version, job.get_scoring_skills())
+
+    def catch_up(self):
+        """
+        Add the vocabulary skills loaded since the matcher was built
+
+        Returns:
+            bool: Whether any required skill gained satisfying ids
+        """
+        if self._generation == skill_vocabulary.generation:
+            return False
+        with self._lock:
+            added = skill_vocabulary.added_since(self._generation)
+            self._generation += len(added)
+            grown = {}
+            for skill_id in added:
+                canonical = skill_vocabulary.canonical[skill_id]
+                for skill in self._satisfiers:
+                    if skills_match(skill, canonical):
+                        grown.setdefault(skill, set()).add(skill_id)
+            for skill, ids in grown.items():
+                self._satisfiers[skill] = self._satisfiers[skill] | ids
+            if grown:
+                self.satisfiers = frozenset().union(*self._satisfiers.values())
+                self.size = self._measure()
+        return bool(grown)
+
+    def score_ids(self, resume_ids):
+        """Score a decoded set of resume skill ids the vocabulary has loaded, 0-100"""
+        if not resume_ids or not self.skills:
+            return 0
+        self.catch_up()
+        if resume_ids.isdisjoint(self.satisfiers):
+            return 0
+        matched = sum(1 for skill in self.skills if not resume_ids.isdisjoint(self._satisfiers[skill]))
+        return (matched / len(self.skills)) * 100
+
+    def score_skills(self, resume_skills):
+        """Score a list of resume skills with the exact-or-partial rule, 0-100"""
+        return match_normalized(normalize_skills(resume_skills), self.skills)
+
+    def score(self, resume_skills, resume_ids=frozenset()):
+        """
+        Score a resume, using its skill ids when the vocabulary knows them all
+
+        Both give the same score. Resumes stored before the skill index
+        existed only have their skill list, and skills inserted by a
+        transaction that hasn't committed yet are not in the vocabulary.
+        """
+        if resume_ids:
+            if not skill_vocabulary.knows(resume_ids):
+                skill_vocabulary.refresh()
+            if skill_vocabulary.knows(resume_ids):
+                return self.score_ids(resume_ids)
+        return self.score_skills(resume_skills)
+
+
+class JobMatcherCache:
+    """
+    Process-wide LRU of JobMatcher objects keyed by job id and version
+
+    A job's version changes whenever its required skills do, so a stale
+    entry is rebuilt on the next lookup even if another process made the
+    edit. The least recently used matchers are evicted once their estimated
+    size, id sets included, exceeds the memory budget.
+    """
+
+    def __init__(self, max_bytes=JOB_MATCHER_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, job):
+        """Return the matcher for a JobDescription, compiling it on a miss"""
+        with self._lock:
+            entry = self._entries.get(job.id)
+            if entry is not None and entry[0].version == job.version:
+                self._entries.move_to_end(job.id)
+                self.hits += 1
+            else:
+                entry = None
+                self.misses += 1
+
+        if entry is not None:
+            matcher, charged = entry
+            # Id sets grow with the vocabulary; keep the byte count in step
+            if matcher.size != charged:
+                self._put(matcher)
+            return matcher
+
+        matcher = JobMatcher.from_job(job)
+        if job.id is not None:
+            self._put(matcher)
+        return matcher
+
+    def _put(self, matcher):
+        with self._lock:
+            previous = self._entries.pop(matcher.job_id, None)
+            if previous is not None:
+                self.bytes -= previous[1]
+            size = matcher.size
+            self._entries[matcher.job_id] = (matcher, size)
+            self.bytes += size
+            while self.bytes > self.max_bytes and len(self._entries) > 1:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.bytes -= evicted_size
+
+    def invalidate(self, job_id):
+        """Drop a job's matcher, e.g. after the job was edited or deleted"""
+        with self._lock:
+            entry = self._entries.pop(job_id, None)
+            if entry is not None:
+                self.bytes -= entry[1]
+
+    def warm(self, limit=JOB_MATCHER_WARM_JOBS, window=JOB_MATCHER_WARM_WINDOW):
+        """
+        Compile matchers for the jobs that received the most resumes recently
+
+        Returns:
+            int: Number of matchers compiled
+        """
+        since = datetime.utcnow() - window
+        active = db.session.query(Resume.job_description_id).filter(
+            Resume.job_description_id.isnot(None),
+            Resume.created_at >= since
+        ).group_by(Resume.job_description_id).order_by(
+            db.func.count(Resume.id).desc()
+        ).limit(limit).subquery()
+        jobs = JobDescription.query.filter(JobDescription.id.in_(db.select(active))).all()
+        for job in jobs:
+            self.get(job)
+        logger.debug(f"Warmed {len(jobs)} job matchers")
+        return len(jobs)
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries), 'bytes': self.bytes}
+
+
+# Process-wide cache shared by the scoring paths
+job_matchers = JobMatcherCache()
@@ -0,0 +1,96 @@
+import json
+import logging
+from collections import Counter
+
+from models import db, JobDescription, JobProfile
+from scoring import normalize_skills
+from skill_canonical import canonicalizer
+from text_processor import extract_sections, extract_skills
+from bm25 import tokenize
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+def extract_description_skills(description):
+    """
+    Extract the skills a job description asks for
+
+    Runs the resume skill extraction (skills sections, vocabulary matches,
+    bullet lists and "experience with" phrases) over the description and
+    keeps the candidates that resolve to a known skill, since job postings
+    are mostly bullets and sentences rather than skill lists.
+
+    Returns:
+        list: Canonical skill names, sorted
+    """
+    description = description or ''
+    candidates = extract_skills(description, extract_sections(description))
+    return sorted({canonicalizer.canonicalize(skill) for skill in candidates if canonicalizer.is_known(skill)})
+
+
+def merge_skills(manual_skills, auto_skills):
+    """Canonical manual skills followed by extracted ones, without duplicates"""
+    return list(dict.fromkeys(skill for skill in normalize_skills(manual_skills) + list(auto_skills) if skill))
+
+
+def build_job_profile(job):
+    """
+    Compute and attach the scoring profile of a job; the caller commits
+
+    The profile holds the skills extracted from the description, those
+    merged with the manual required skills (canonical names, the list every
+    resume is scored against) and the description's term vector. If the
+    merged skills of a stored job change, its version is bumped so cached
+    matchers and cross-job matching pick the change up, unless it was
+    already bumped since the job was loaded (set_required_skills does so
+    when an edit changes the manual skills).
+
+    Args:
+        job (JobDescription): Job with its description and required skills set
+
+    Returns:
+        JobProfile: The job's profile
+    """
+    auto_skills = extract_description_skills(job.description)
+    skills = merge_skills(job.get_required_skills(), auto_skills)
+
+    version_changed = db.inspect(job).attrs.version.history.has_changes()
+    if job.id is not None and not version_changed and skills != normalize_skills(job.get_scoring_skills()):
+        job.version = (job.version or 0) + 1
+    job.version = job.version or 1
+
+    profile = job.profile or JobProfile()
+    profile.version = job.version
+    profile.auto_skills = json.dumps(auto_skills) if auto_skills else None
+    profile.skills = json.dumps(skills) if skills else None
+    profile.term_vector = json.dumps(dict(Counter(tokenize(job.description or '')).most_common()))
+    job.profile = profile
+
+    logger.debug(f"Built profile for job '{job.title}': {len(skills)} skills, {len(auto_skills)} from the description")
+    return profile
+
+
+def rebuild_job_profiles(batch_size=200):
+    """
+    Build profiles for jobs that have none or whose profile is out of date
+
+    Returns:
+        list: Ids of the jobs whose scoring skills changed, which need
+            rescoring and cross-job matching again
+    """
+    stale = db.session.query(JobDescription.id).outerjoin(JobProfile).filter(
+        db.or_(JobProfile.job_description_id.is_(None), JobProfile.version != JobDescription.version)
+    ).order_by(JobDescription.id).all()
+    job_ids = [job_id for job_id, in stale]
+
+    changed = []
+    for start in range(0, len(job_ids), batch_size):
+        for job in JobDescription.query.filter(JobDescription.id.in_(job_ids[start:start + batch_size])):
+            version = job.version
+            build_job_profile(job)
+            if job.version != version:
+                changed.append(job.id)
+        db.session.commit()
+        logger.debug(f"Built {min(start + batch_size, len(job_ids))} of {len(job_ids)} job profiles")
+    return changed
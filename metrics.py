@@ -0,0 +1,159 @@
+import time
+import threading
+from contextlib import contextmanager
+
+# Default latency buckets in seconds, from 1ms up to 30s
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+# Every metric created through this module, in registration order
+REGISTRY = []
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labelnames, values, extra=()):
+    pairs = list(zip(labelnames, values)) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonically increasing value, optionally split by labels"""
+
+    kind = 'counter'
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def inc(self, amount=1, **labels):
+        key = tuple(str(labels.get(name, '')) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            values = dict(self._values)
+        return [(self.name, _format_labels(self.labelnames, key), value) for key, value in sorted(values.items())]
+
+
+class Histogram:
+    """Distribution of observed values in cumulative buckets, optionally split by labels"""
+
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+        self._series = {}
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def observe(self, value, **labels):
+        key = tuple(str(labels.get(name, '')) for name in self.labelnames)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = {'counts': [0] * len(self.buckets), 'sum': 0.0, 'count': 0}
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series['counts'][index] += 1
+                    break
+            series['sum'] += value
+            series['count'] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the wall-clock duration of the with-block in seconds"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def samples(self):
+        with self._lock:
+            series = {key: {'counts': list(s['counts']), 'sum': s['sum'], 'count': s['count']} for key, s in self._series.items()}
+
+        samples = []
+        for key, s in sorted(series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, s['counts']):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, [('le', _format_value(bound))])
+                samples.append((f'{self.name}_bucket', labels, cumulative))
+            labels = _format_labels(self.labelnames, key)
+            samples.append((f'{self.name}_sum', labels, s['sum']))
+            samples.append((f'{self.name}_count', labels, s['count']))
+        return samples
+
+
+def render_prometheus(extra_counters=None):
+    """
+    Render every registered metric in the Prometheus text exposition format
+
+    Args:
+        extra_counters (dict): Additional name -> (help, value) counters,
+            e.g. statistics owned by another component
+
+    Returns:
+        str: Exposition text
+    """
+    lines = []
+    for metric in REGISTRY:
+        lines.append(f'# HELP {metric.name} {metric.documentation}')
+        lines.append(f'# TYPE {metric.name} {metric.kind}')
+        for name, labels, value in metric.samples():
+            lines.append(f'{name}{labels} {_format_value(value)}')
+    for name, (documentation, value) in sorted((extra_counters or {}).items()):
+        lines.append(f'# HELP {name} {documentation}')
+        lines.append(f'# TYPE {name} counter')
+        lines.append(f'{name} {_format_value(value)}')
+    return '\n'.join(lines) + '\n'
+
+
+# Resume ingestion metrics
+UPLOAD_STAGE_SECONDS = Histogram(
+    'resume_upload_stage_seconds',
+    'Time spent in each stage of processing an uploaded resume',
+    labelnames=('stage',)
+)
+UPLOAD_SECONDS = Histogram(
+    'resume_upload_seconds',
+    'End-to-end time to process an uploaded resume',
+    labelnames=('file_type',)
+)
+UPLOADS_TOTAL = Counter(
+    'resume_uploads_total',
+    'Resumes uploaded, by file type and outcome',
+    labelnames=('file_type', 'status')
+)
+UPLOAD_BYTES_TOTAL = Counter(
+    'resume_upload_bytes_total',
+    'Bytes of resume files uploaded, by file type',
+    labelnames=('file_type',)
+)
+PDF_PAGES_TOTAL = Counter(
+    'resume_pdf_pages_total',
+    'PDF pages extracted'
+)
+PDF_PAGES = Histogram(
+    'resume_pdf_pages',
+    'Pages extracted per PDF',
+    buckets=(1, 2, 3, 5, 10, 20, 50, 100)
+)
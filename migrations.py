@@ -0,0 +1,215 @@
+import logging
+
+from sqlalchemy import inspect, text
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Indexes superseded by a model index with a different definition, by table
+REPLACED_INDEXES = {
+    # Replaced by ix_resumes_job_rank, which ranks unscored resumes explicitly
+    'resumes': ['ix_resumes_job_score'],
+}
+
+# Columns whose model type changed, by table
+RETYPED_COLUMNS = {
+    # Single-precision FLOAT on MySQL made keyset cursors skip or repeat ties
+    'resumes': ['match_score'],
+}
+
+# Columns removed from a model, by table
+REMOVED_COLUMNS = {
+    # Job skills are resolved to ids by the job matchers, never read from here
+    'job_descriptions': ['skill_ids'],
+    'job_profiles': ['skill_ids'],
+}
+
+
+def add_missing_columns(db):
+    """
+    Add model columns that are missing from existing tables
+
+    db.create_all() only creates tables that don't exist yet, so columns added
+    to a model later never reach an existing database. New columns are
+    nullable, so adding them is a plain ALTER TABLE ... ADD COLUMN.
+
+    Returns:
+        list: "table.column" names that were added
+    """
+    inspector = inspect(db.engine)
+    existing_tables = set(inspector.get_table_names())
+    added = []
+
+    with db.engine.begin() as conn:
+        for table in db.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_columns = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+                column_type = column.type.compile(dialect=db.engine.dialect)
+                conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+                added.append(f'{table.name}.{column.name}')
+
+    for name in added:
+        logger.info(f"Added missing column {name}")
+    return added
+
+
+def index_names(conn, inspector, table_name):
+    """
+    Names of the indexes on a table
+
+    SQLite reflection leaves expression indexes out, so on SQLite the names
+    are read from sqlite_master instead.
+    """
+    if conn.dialect.name == 'sqlite':
+        return set(conn.execute(
+            text("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :table"),
+            {'table': table_name}
+        ).scalars())
+    return {index['name'] for index in inspector.get_indexes(table_name)}
+
+
+def add_missing_indexes(db):
+    """
+    Create model indexes that are missing from existing tables
+
+    Returns:
+        list: Names of the indexes that were created
+    """
+    inspector = inspect(db.engine)
+    existing_tables = set(inspector.get_table_names())
+    added = []
+
+    with db.engine.begin() as conn:
+        for table in db.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_indexes = index_names(conn, inspector, table.name)
+            for index in table.indexes:
+                if index.name in existing_indexes:
+                    continue
+                index.create(bind=conn)
+                added.append(index.name)
+
+    for name in added:
+        logger.info(f"Created missing index {name}")
+    return added
+
+
+def drop_replaced_indexes(db):
+    """
+    Drop indexes that a redefined model index replaced under a new name
+
+    Returns:
+        list: Names of the indexes that were dropped
+    """
+    inspector = inspect(db.engine)
+    existing_tables = set(inspector.get_table_names())
+    dropped = []
+
+    with db.engine.begin() as conn:
+        for table_name, names in REPLACED_INDEXES.items():
+            if table_name not in existing_tables:
+                continue
+            existing_indexes = index_names(conn, inspector, table_name)
+            for name in names:
+                if name not in existing_indexes:
+                    continue
+                if conn.dialect.name == 'mysql':
+                    conn.execute(text(f'DROP INDEX {name} ON {table_name}'))
+                else:
+                    conn.execute(text(f'DROP INDEX {name}'))
+                dropped.append(name)
+
+    for name in dropped:
+        logger.info(f"Dropped replaced index {name}")
+    return dropped
+
+
+def alter_column_type_sql(dialect, table_name, column):
+    """
+    Statement changing a column to its model type, or None where not needed
+
+    SQLite has no column types to change: a REAL column already holds
+    double-precision values.
+    """
+    column_type = column.type.compile(dialect=dialect)
+    if dialect.name == 'mysql':
+        nullable = 'NULL' if column.nullable else 'NOT NULL'
+        return f'ALTER TABLE {table_name} MODIFY COLUMN {column.name} {column_type} {nullable}'
+    if dialect.name == 'postgresql':
+        return f'ALTER TABLE {table_name} ALTER COLUMN {column.name} TYPE {column_type}'
+    return None
+
+
+def alter_retyped_columns(db):
+    """
+    Change existing columns whose model type changed to the new type
+
+    Returns:
+        list: "table.column" names that were altered
+    """
+    inspector = inspect(db.engine)
+    existing_tables = set(inspector.get_table_names())
+    dialect = db.engine.dialect
+    altered = []
+
+    with db.engine.begin() as conn:
+        for table_name, names in RETYPED_COLUMNS.items():
+            if table_name not in existing_tables:
+                continue
+            table = db.metadata.tables[table_name]
+            existing_types = {column['name']: column['type'] for column in inspector.get_columns(table_name)}
+            for name in names:
+                existing_type = existing_types.get(name)
+                column = table.columns[name]
+                if existing_type is None or existing_type.compile(dialect=dialect) == column.type.compile(dialect=dialect):
+                    continue
+                statement = alter_column_type_sql(dialect, table_name, column)
+                if statement is None:
+                    continue
+                conn.execute(text(statement))
+                altered.append(f'{table_name}.{name}')
+
+    for name in altered:
+        logger.info(f"Changed the type of column {name}")
+    return altered
+
+
+def drop_removed_columns(db):
+    """
+    Drop columns that were removed from a model
+
+    Returns:
+        list: "table.column" names that were dropped
+    """
+    inspector = inspect(db.engine)
+    existing_tables = set(inspector.get_table_names())
+    dropped = []
+
+    with db.engine.begin() as conn:
+        for table_name, names in REMOVED_COLUMNS.items():
+            if table_name not in existing_tables:
+                continue
+            existing_columns = {column['name'] for column in inspector.get_columns(table_name)}
+            for name in names:
+                if name not in existing_columns:
+                    continue
+                conn.execute(text(f'ALTER TABLE {table_name} DROP COLUMN {name}'))
+                dropped.append(f'{table_name}.{name}')
+
+    for name in dropped:
+        logger.info(f"Dropped removed column {name}")
+    return dropped
+
+
+def upgrade_schema(db):
+    """Bring an existing database up to date with the models"""
+    db.create_all()
+    return (
+        add_missing_columns(db) + add_missing_indexes(db) + drop_replaced_indexes(db)
+        + alter_retyped_columns(db) + drop_removed_columns(db)
+    )
@@ -1,10 +1,64 @@
 from datetime import datetime
 import json
+import struct
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql, sqlite
 import re
 
+
 db = SQLAlchemy()
 
+
+def insert_ignore(model, bind):
+    """
+    Build an INSERT for model that skips rows colliding with a unique key
+
+    Get-or-create lookups race between their SELECT and INSERT; with this
+    the loser inserts nothing and re-selects the winner's row instead of
+    failing. Uses INSERT IGNORE on MySQL and ON CONFLICT DO NOTHING on
+    PostgreSQL and SQLite.
+
+    Args:
+        model: Mapped class to insert into
+        bind: Engine, Connection or Session the statement runs on
+
+    Returns:
+        Insert: Statement to execute with a list of row dicts
+    """
+    dialect = bind.get_bind().dialect.name if hasattr(bind, 'get_bind') else bind.dialect.name
+    if dialect == 'mysql':
+        return insert(model).prefix_with('IGNORE')
+    if dialect == 'postgresql':
+        return postgresql.insert(model).on_conflict_do_nothing()
+    if dialect == 'sqlite':
+        return sqlite.insert(model).on_conflict_do_nothing()
+    return insert(model)
+
+
+def encode_skill_ids(skill_ids):
+    """
+    Pack Skill ids into a sorted array of little-endian uint32s
+
+    The size depends on how many skills there are, not on how large their
+    ids grow, so the blob stays small however big the skills table gets.
+    """
+    skill_ids = sorted(set(skill_ids))
+    return struct.pack(f'<{len(skill_ids)}I', *skill_ids) if skill_ids else None
+
+
+def decode_skill_ids(data):
+    """Unpack a stored skill id array into a frozenset usable with & and len()"""
+    return frozenset(struct.unpack(f'<{len(data) // 4}I', data)) if data else frozenset()
+
+# Normalized resume <-> skill association, indexed both ways for candidate lookups
+resume_skills = db.Table(
+    'resume_skills',
+    db.Column('resume_id', db.Integer, db.ForeignKey('resumes.id', ondelete='CASCADE'), primary_key=True),
+    db.Column('skill_id', db.Integer, db.ForeignKey('skills.id', ondelete='CASCADE'), primary_key=True),
+    db.Index('ix_resume_skills_skill_id', 'skill_id', 'resume_id')
+)
+
 class JobDescription(db.Model):
     __tablename__ = 'job_descriptions'
     
@@ -13,30 +67,92 @@ class JobDescription(db.Model):
     company = db.Column(db.String(100), nullable=True)
     description = db.Column(db.Text, nullable=False)
     required_skills = db.Column(db.Text, nullable=True)  # Stored as JSON
+    version = db.Column(db.Integer, nullable=True, default=1)  # Bumped whenever required_skills changes
+    is_open = db.Column(db.Boolean, nullable=True, default=True)  # Closed jobs are left out of cross-job matching
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
     # Relationship with Resume
     resumes = db.relationship('Resume', back_populates='job_description', cascade='all, delete-orphan')
+    job_matches = db.relationship('JobMatch', cascade='all, delete-orphan')
+    profile = db.relationship('JobProfile', uselist=False, back_populates='job_description', cascade='all, delete-orphan')
     
     def __repr__(self):
         return f'<JobDescription {self.title}>'
     
+    @property
+    def current_profile(self):
+        """The job profile, or None when it is missing or predates the current version"""
+        profile = self.profile
+        if profile is not None and profile.version == self.version:
+            return profile
+        return None
+    
+    def get_scoring_skills(self):
+        """Return the skills resumes are scored against: the profile's when current, else the manual list"""
+        profile = self.current_profile
+        return profile.get_skills() if profile is not None else self.get_required_skills()
+    
     def get_required_skills(self):
-        """Return the required skills as a list"""
-        if self.required_skills:
-            return json.loads(self.required_skills)
-        return []
+        """Return the required skills as a list, decoded once per stored value"""
+        cached = getattr(self, '_required_skills_cache', None)
+        if cached is None or cached[0] is not self.required_skills:
+            cached = (self.required_skills, json.loads(self.required_skills) if self.required_skills else [])
+            self._required_skills_cache = cached
+        return cached[1]
     
     def set_required_skills(self, skills):            #saves it back in the database in the right format
         """Set required skills from a list"""
-        if skills:
-            self.required_skills = json.dumps(skills)
-        else:
-            self.required_skills = None
+        required_skills = json.dumps(skills) if skills else None
+        if self.id is not None and required_skills != self.required_skills:
+            self.version = (self.version or 0) + 1
+        self.required_skills = required_skills
+        self._required_skills_cache = None
+
+
+class Skill(db.Model):
+    __tablename__ = 'skills'
+    
+    MAX_NAME_LENGTH = 255
+    
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(MAX_NAME_LENGTH), nullable=False, unique=True, index=True)
+    
+    def __repr__(self):
+        return f'<Skill {self.name}>'
+    
+    @staticmethod
+    def normalize(name):
+        """Return the canonical form a skill name is stored and searched under"""
+        return ' '.join(name.lower().split())[:Skill.MAX_NAME_LENGTH]
+    
+    @classmethod
+    def get_or_create_many(cls, names):
+        """Return Skill rows for the given names, inserting any that don't exist yet"""
+        names = {cls.normalize(name) for name in names} - {''}
+        if not names:
+            return []
+        
+        with db.session.no_autoflush:
+            found = {skill.name: skill for skill in cls.query.filter(cls.name.in_(names))}
+            missing = names - found.keys()
+            if missing:
+                # Insert straight away so every skill has an id before the owner is flushed;
+                # names another transaction inserted since the SELECT are skipped
+                db.session.execute(insert_ignore(cls, db.session), [{'name': name} for name in sorted(missing)])
+                # A locking read sees rows committed after this transaction's snapshot (MySQL)
+                found.update(
+                    (skill.name, skill) for skill in cls.query.filter(cls.name.in_(missing)).with_for_update(read=True)
+                )
+        return list(found.values())
 
 
 class Resume(db.Model):
     __tablename__ = 'resumes'
+    __table_args__ = (
+        # Serves "top candidates for a job" and keyset pagination through them,
+        # in RESUME_RANK order; the expression must match RESUME_RANK exactly
+        db.Index('ix_resumes_job_rank', 'job_description_id', db.text('(COALESCE(match_score, -1)) DESC'), db.text('id DESC')),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     filename = db.Column(db.String(255), nullable=False)
@@ -44,32 +160,50 @@ class Resume(db.Model):
     email = db.Column(db.String(100), nullable=True)
     phone = db.Column(db.String(20), nullable=True)
     extracted_skills = db.Column(db.Text, nullable=True)  # Stored as JSON
-    experience = db.Column(db.Text, nullable=True)
-    raw_text = db.Column(db.Text, nullable=True)
-    match_score = db.Column(db.Float, nullable=True)  # Score against job description
+    # Large text columns are only loaded when accessed, never by list views
+    experience = db.deferred(db.Column(db.Text, nullable=True))
+    raw_text = db.deferred(db.Column(db.Text, nullable=True))
+    skill_ids = db.Column(db.LargeBinary, nullable=True)  # Sorted Skill ids, see encode_skill_ids
+    # Score against job description. Double precision, since keyset pages
+    # compare it for equality with the score of the last row a client saw
+    match_score = db.Column(db.Double, nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
     # Foreign Key
     job_description_id = db.Column(db.Integer, db.ForeignKey('job_descriptions.id'))
     
-    # Relationship
+    # Relationships
     job_description = db.relationship('JobDescription', back_populates='resumes')
+    skills = db.relationship('Skill', secondary=resume_skills)
+    job_matches = db.relationship('JobMatch', cascade='all, delete-orphan')
     
     def __repr__(self):
         return f'<Resume {self.filename}>'
     
     def get_skills(self):
-        """Return the extracted skills as a list"""
-        if self.extracted_skills:
-            return json.loads(self.extracted_skills)
+        """Return the extracted skills as a list, decoded once per stored value"""
+        cached = getattr(self, '_skills_cache', None)
+        if cached is None or cached[0] is not self.extracted_skills:
+            cached = (self.extracted_skills, self.decode_skills(self.extracted_skills))
+            self._skills_cache = cached
+        return cached[1]
+    
+    @staticmethod
+    def decode_skills(extracted_skills):
+        """Decode the JSON stored in extracted_skills without loading a Resume"""
+        if extracted_skills:
+            return json.loads(extracted_skills)
         return []
     
     def set_skills(self, skills):
-        """Set extracted skills from a list"""
+        """Set extracted skills from a list and keep the skill index in sync"""
         if skills:
             self.extracted_skills = json.dumps(skills)
         else:
             self.extracted_skills = None
+        self._skills_cache = None
+        self.skills = Skill.get_or_create_many(skills or [])
+        self.skill_ids = encode_skill_ids(skill.id for skill in self.skills)
     
     
 
@@ -83,45 +217,178 @@ class Resume(db.Model):
             self.match_score = 0
             return 0
         
+        # Imported here because job_matchers depends on this module
+        from job_matchers import job_matchers
         resume_skills = self.get_skills()
-        job_skills = self.job_description.get_required_skills()
+        matcher = job_matchers.get(self.job_description)
         
         logger.debug(f"Resume skills: {resume_skills}")
-        logger.debug(f"Job skills: {job_skills}")
+        logger.debug(f"Job skills: {matcher.skills}")
         
-        if not resume_skills or not job_skills:
+        if not resume_skills or not matcher.skills:
             logger.debug("Empty skills list detected")
             self.match_score = 0
             return 0
         
-        # Convert to lowercase for better matching
-        resume_skills_lower = [skill.lower().strip() for skill in resume_skills]
-        job_skills_lower = [skill.lower().strip() for skill in job_skills]
-        
-        # Improved matching - check if resume skills contain any part of job skills
-        matches = []
-        for job_skill in job_skills_lower:
-            # Direct match
-            if job_skill in resume_skills_lower:
-                matches.append(job_skill)
-                continue
-                
-            # Partial match - look for job skill within resume skills
-            for resume_skill in resume_skills_lower:
-                if (job_skill in resume_skill) or (resume_skill in job_skill):
-                    matches.append(job_skill)
-                    break
-        
-        matching_skills = len(matches)
-        logger.debug(f"Matching skills found: {matching_skills}")
-        logger.debug(f"Matches: {matches}")
-        
-        # Calculate score based on percentage of matching skills
-        if len(job_skills) > 0:
-            score = (matching_skills / len(job_skills)) * 100
-        else:
-            score = 0
+        score = matcher.score(resume_skills, decode_skill_ids(self.skill_ids))
         
         logger.debug(f"Match score: {score}%")    
         self.match_score = score
-        return score
\ No newline at end of file
+        return score
+
+
+# Sort key of ranked candidate lists: the match score, with unscored (NULL)
+# resumes last. A NULL score never satisfies a keyset comparison and sorts
+# first or last depending on the database, so lists and cursors use this.
+UNSCORED_RANK = -1
+RESUME_RANK = db.func.coalesce(Resume.match_score, db.literal_column(str(UNSCORED_RANK)))
+
+# Columns shown wherever resumes are listed; the large text columns are left out
+RESUME_LIST_COLUMNS = (
+    Resume.id, Resume.filename, Resume.candidate_name, Resume.email, Resume.phone,
+    Resume.extracted_skills, Resume.match_score, Resume.created_at, Resume.job_description_id
+)
+
+
+class IngestTask(db.Model):
+    __tablename__ = 'ingest_tasks'
+    
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    filename = db.Column(db.String(255), nullable=False)
+    file_path = db.Column(db.String(500), nullable=False)  # Spooled upload awaiting processing
+    status = db.Column(db.String(20), nullable=False, default=QUEUED, index=True)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    
+    # Foreign Keys
+    job_description_id = db.Column(db.Integer, db.ForeignKey('job_descriptions.id', ondelete='SET NULL'), nullable=True)
+    resume_id = db.Column(db.Integer, db.ForeignKey('resumes.id', ondelete='SET NULL'), nullable=True)
+    
+    # Relationships
+    job_description = db.relationship('JobDescription')
+    resume = db.relationship('Resume')
+    
+    def __repr__(self):
+        return f'<IngestTask {self.id} {self.status}>'
+    
+    def to_dict(self):
+        """Return the task status as a JSON-serialisable dict"""
+        return {
+            'id': self.id,
+            'filename': self.filename,
+            'status': self.status,
+            'attempts': self.attempts,
+            'error': self.error,
+            'job_id': self.job_description_id,
+            'resume_id': self.resume_id,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        }
+
+
+class CacheEntry(db.Model):
+    __tablename__ = 'cache_entries'
+    
+    key = db.Column(db.String(128), primary_key=True)  # "<level>:<sha256>[:<version>]"
+    value = db.Column(db.Text(length=2**24), nullable=False)
+    size = db.Column(db.Integer, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    last_used_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    
+    def __repr__(self):
+        return f'<CacheEntry {self.key}>'
+
+
+class JobMatch(db.Model):
+    __tablename__ = 'job_matches'
+    __table_args__ = (
+        # Serves "best candidates for a job" across every job they applied to
+        db.Index('ix_job_matches_job_score', 'job_description_id', db.text('score DESC'), 'resume_id'),
+    )
+    
+    resume_id = db.Column(db.Integer, db.ForeignKey('resumes.id', ondelete='CASCADE'), primary_key=True)
+    job_description_id = db.Column(db.Integer, db.ForeignKey('job_descriptions.id', ondelete='CASCADE'), primary_key=True)
+    score = db.Column(db.Float, nullable=False)
+    
+    def __repr__(self):
+        return f'<JobMatch resume={self.resume_id} job={self.job_description_id} {self.score:.1f}>'
+
+
+class JobProfile(db.Model):
+    __tablename__ = 'job_profiles'
+    
+    job_description_id = db.Column(db.Integer, db.ForeignKey('job_descriptions.id', ondelete='CASCADE'), primary_key=True)
+    version = db.Column(db.Integer, nullable=False)  # JobDescription.version the profile was built from
+    auto_skills = db.Column(db.Text, nullable=True)  # JSON: skills extracted from the description
+    skills = db.Column(db.Text, nullable=True)  # JSON: canonical manual + extracted skills
+    term_vector = db.Column(db.Text, nullable=True)  # JSON: description term -> frequency
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    job_description = db.relationship('JobDescription', back_populates='profile')
+    
+    def __repr__(self):
+        return f'<JobProfile job={self.job_description_id} v{self.version}>'
+    
+    def get_skills(self):
+        """Return the merged skills as a list"""
+        return json.loads(self.skills) if self.skills else []
+    
+    def get_auto_skills(self):
+        """Return the skills extracted from the description as a list"""
+        return json.loads(self.auto_skills) if self.auto_skills else []
+    
+    def get_term_vector(self):
+        """Return the description's term frequencies as a dict"""
+        return json.loads(self.term_vector) if self.term_vector else {}
+
+
+class UploadResult(db.Model):
+    __tablename__ = 'upload_results'
+    
+    id = db.Column(db.String(32), primary_key=True)  # Random token kept in the user's session
+    payload = db.Column(db.Text(length=2**24), nullable=False)  # JSON extraction results
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+    
+    def __repr__(self):
+        return f'<UploadResult {self.id}>'
+
+
+class BM25Term(db.Model):
+    __tablename__ = 'bm25_terms'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    term = db.Column(db.String(64), nullable=False, unique=True, index=True)
+    
+    def __repr__(self):
+        return f'<BM25Term {self.term}>'
+
+
+class BM25Document(db.Model):
+    __tablename__ = 'bm25_documents'
+    
+    resume_id = db.Column(db.Integer, db.ForeignKey('resumes.id', ondelete='CASCADE'), primary_key=True)
+    job_description_id = db.Column(db.Integer, nullable=True, index=True)
+    length = db.Column(db.Integer, nullable=False)  # Number of tokens in the document
+    
+    def __repr__(self):
+        return f'<BM25Document {self.resume_id}>'
+
+
+class BM25Posting(db.Model):
+    __tablename__ = 'bm25_postings'
+    
+    term_id = db.Column(db.Integer, db.ForeignKey('bm25_terms.id'), primary_key=True)
+    resume_id = db.Column(db.Integer, db.ForeignKey('resumes.id', ondelete='CASCADE'), primary_key=True, index=True)
+    tf = db.Column(db.Integer, nullable=False)  # Occurrences of the term in the document
+    
+    def __repr__(self):
+        return f'<BM25Posting {self.term_id}:{self.resume_id}>'
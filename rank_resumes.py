@@ -0,0 +1,180 @@
+"""
+Rank a directory of resumes against a job description without the web app.
+
+Resumes are parsed, extracted and scored across a process pool with the same
+code the app uses (parse_resume, extract_skills_experience and the match score
+of Resume.calculate_match_score), but nothing touches the database:
+
+    python rank_resumes.py --job job.txt RESUME_DIR -o ranked.csv
+    python rank_resumes.py --job-row 12 RESUME_DIR -o ranked.jsonl
+
+A job file is either plain text (the description) or JSON with "title",
+"description" and optionally "required_skills". Without an explicit skill
+list the required skills are the known skills found in the description.
+"""
+import os
+import sys
+import csv
+import json
+import logging
+import argparse
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+
+from ingest import process_resume_file
+from job_catalogue import JOB_CSV_PATH, JOB_CSV_ENCODING, TEXT_COLUMN, TITLE_COLUMN
+from scoring import match_score
+from text_processor import COMMON_SKILLS_MATCHER, extract_candidate_info
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+RESUME_EXTENSIONS = {'pdf', 'docx', 'txt'}
+
+OUTPUT_FIELDS = ['rank', 'file', 'match_score', 'candidate_name', 'email', 'phone', 'skills', 'error']
+
+
+def load_job(job_file=None, job_row=None, csv_path=JOB_CSV_PATH, skills=None):
+    """
+    Load a job description from a text/JSON file or a row of resume_data.csv
+
+    Args:
+        job_file (str): Plain text or JSON job description
+        job_row (int): Zero-based row of the job CSV ("Job", "Job description")
+        csv_path (str): Job CSV to read job_row from
+        skills (list): Required skills overriding those of the job
+
+    Returns:
+        dict: 'title', 'description' and 'required_skills'
+    """
+    if job_file:
+        with open(job_file, 'r', errors='replace') as f:
+            content = f.read()
+        if job_file.lower().endswith('.json'):
+            job = json.loads(content)
+        else:
+            job = {'title': os.path.splitext(os.path.basename(job_file))[0], 'description': content}
+    elif job_row is not None:
+        with open(csv_path, 'r', encoding=JOB_CSV_ENCODING, newline='') as f:
+            for index, row in enumerate(csv.DictReader(f)):
+                if index == job_row:
+                    job = {'title': row[TITLE_COLUMN], 'description': row[TEXT_COLUMN]}
+                    break
+            else:
+                raise ValueError(f"{csv_path} has no row {job_row}")
+    else:
+        raise ValueError("A job file or a job row is required")
+
+    required_skills = skills or job.get('required_skills')
+    if not required_skills:
+        required_skills = sorted(COMMON_SKILLS_MATCHER.match(job.get('description') or ''))
+    return {
+        'title': job.get('title') or 'Untitled job',
+        'description': job.get('description') or '',
+        'required_skills': required_skills
+    }
+
+
+def find_resume_files(directory):
+    """Return the PDF, DOCX and TXT files under a directory, sorted by path"""
+    paths = []
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = [name for name in dirs if not name.startswith('.')]
+        for name in files:
+            if not name.startswith('.') and name.rsplit('.', 1)[-1].lower() in RESUME_EXTENSIONS:
+                paths.append(os.path.join(root, name))
+    return sorted(paths)
+
+
+def rank_resume_file(file_path, job_skills):
+    """
+    Parse, extract and score one resume; runs inside a pool worker
+
+    Returns:
+        dict: Output row without its rank
+    """
+    result = process_resume_file(file_path)
+    if 'error' in result:
+        return {'file': file_path, 'match_score': 0, 'error': result['error']}
+
+    skills = result['extracted']['skills']['identified']
+    candidate_info = extract_candidate_info(result['text'])
+    return {
+        'file': file_path,
+        'match_score': round(match_score(skills, job_skills), 2),
+        'candidate_name': candidate_info['name'],
+        'email': candidate_info['email'],
+        'phone': candidate_info['phone'],
+        'skills': skills
+    }
+
+
+def rank_resume_files(file_paths, job_skills, workers=None, chunksize=16):
+    """
+    Score resume files against a job's skills across all cores
+
+    Returns:
+        list: Output rows, best match first, with a 1-based 'rank'
+    """
+    score_file = partial(rank_resume_file, job_skills=job_skills)
+    workers = min(workers or os.cpu_count() or 1, max(len(file_paths), 1))
+    if workers == 1:
+        rows = [score_file(path) for path in file_paths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            rows = list(executor.map(score_file, file_paths, chunksize=chunksize))
+
+    rows.sort(key=lambda row: (-row['match_score'], row['file']))
+    for rank, row in enumerate(rows, start=1):
+        row['rank'] = rank
+    return rows
+
+
+def write_rows(rows, output, output_format):
+    """Write ranked rows as CSV (skills joined by ';') or JSON lines"""
+    if output_format == 'jsonl':
+        for row in rows:
+            output.write(json.dumps({field: row.get(field) for field in OUTPUT_FIELDS}) + '\n')
+        return
+
+    writer = csv.DictWriter(output, fieldnames=OUTPUT_FIELDS)
+    writer.writeheader()
+    for row in rows:
+        writer.writerow({**row, 'skills': ';'.join(row.get('skills') or [])})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rank a directory of resumes against a job description")
+    parser.add_argument('resume_dir', help="Directory searched recursively for PDF, DOCX and TXT resumes")
+    job_source = parser.add_mutually_exclusive_group(required=True)
+    job_source.add_argument('--job', help="Job description file (plain text or JSON)")
+    job_source.add_argument('--job-row', type=int, help="Zero-based row of the job CSV to rank against")
+    parser.add_argument('--job-csv', default=JOB_CSV_PATH, help="Job CSV used with --job-row")
+    parser.add_argument('--skills', help="Comma-separated required skills, overriding the job's")
+    parser.add_argument('-o', '--output', help="Output file (defaults to stdout)")
+    parser.add_argument('--format', choices=('csv', 'jsonl'), help="Output format (defaults to the output file's extension, else csv)")
+    parser.add_argument('--workers', type=int, help="Worker processes (defaults to the CPU count)")
+    args = parser.parse_args(argv)
+
+    skills = [skill.strip() for skill in args.skills.split(',') if skill.strip()] if args.skills else None
+    job = load_job(job_file=args.job, job_row=args.job_row, csv_path=args.job_csv, skills=skills)
+    if not job['required_skills']:
+        parser.error("The job has no required skills; pass --skills")
+
+    file_paths = find_resume_files(args.resume_dir)
+    print(f"Ranking {len(file_paths)} resumes against '{job['title']}' "
+          f"({len(job['required_skills'])} required skills)", file=sys.stderr)
+    rows = rank_resume_files(file_paths, job['required_skills'], workers=args.workers)
+
+    output_format = args.format or ('jsonl' if args.output and args.output.endswith('.jsonl') else 'csv')
+    if args.output:
+        with open(args.output, 'w', newline='') as output:
+            write_rows(rows, output, output_format)
+    else:
+        write_rows(rows, sys.stdout, output_format)
+
+
+if __name__ == '__main__':
+    # The parsing modules log every document at DEBUG level
+    logging.getLogger().setLevel(logging.WARNING)
+    main()
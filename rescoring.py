@@ -0,0 +1,66 @@
+import time
+import logging
+
+from sqlalchemy import update
+
+from models import db, JobDescription, Resume, decode_skill_ids
+from job_matchers import job_matchers
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Resumes read and written per round trip
+RESCORE_BATCH_SIZE = 1000
+
+
+def rescore_job(job_id, batch_size=RESCORE_BATCH_SIZE):
+    """
+    Recompute match_score for every resume uploaded against a job
+
+    Only the id and skills columns are read, in keyset-paginated batches;
+    scores come from the skill id sets, and each batch is written back with
+    one executemany UPDATE instead of an ORM flush per row.
+
+    Args:
+        job_id (int): Job description whose resumes should be rescored
+        batch_size (int): Rows per read and write batch
+
+    Returns:
+        dict: 'rescored' row count, 'seconds' elapsed and 'rows_per_second'
+    """
+    job = db.session.get(JobDescription, job_id)
+    if job is None:
+        raise ValueError(f"Job description {job_id} not found")
+    # Normalized skills and the ids satisfying each are prepared once, before the loop
+    matcher = job_matchers.get(job)
+
+    start = time.perf_counter()
+    rescored = 0
+    last_id = 0
+    while True:
+        rows = db.session.query(Resume.id, Resume.skill_ids, Resume.extracted_skills).filter(
+            Resume.job_description_id == job_id,
+            Resume.id > last_id
+        ).order_by(Resume.id).limit(batch_size).all()
+        if not rows:
+            break
+
+        updates = [
+            {'id': resume_id, 'match_score': matcher.score(Resume.decode_skills(skills_json), decode_skill_ids(skill_ids))}
+            for resume_id, skill_ids, skills_json in rows
+        ]
+        db.session.execute(update(Resume), updates)
+        db.session.commit()
+
+        rescored += len(rows)
+        last_id = rows[-1].id
+
+    seconds = time.perf_counter() - start
+    stats = {
+        'job_id': job_id,
+        'rescored': rescored,
+        'seconds': round(seconds, 3),
+        'rows_per_second': round(rescored / seconds, 1) if seconds > 0 else None
+    }
+    logger.info(f"Rescored {rescored} resumes for job {job_id} in {seconds:.2f}s")
+    return stats
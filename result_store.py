@@ -0,0 +1,76 @@
+import os
+import json
+import uuid
+import logging
+from datetime import datetime, timedelta
+
+from models import db, UploadResult
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# How long an upload's results stay available on /results and /download
+RESULT_TTL = timedelta(seconds=int(os.environ.get('RESULT_TTL_SECONDS', 24 * 60 * 60)))
+
+
+def purge_expired_results(now=None):
+    """
+    Delete stored results whose TTL has passed
+
+    Returns:
+        int: Number of results deleted
+    """
+    now = now or datetime.utcnow()
+    deleted = UploadResult.query.filter(UploadResult.expires_at <= now).delete(synchronize_session=False)
+    if deleted:
+        logger.debug(f"Purged {deleted} expired upload results")
+    return deleted
+
+
+def save_result(payload, ttl=RESULT_TTL):
+    """
+    Store an upload's results server-side and commit
+
+    Expired results are purged in the same transaction, so the table only
+    holds results that can still be viewed.
+
+    Args:
+        payload (dict): JSON-serialisable results
+        ttl (timedelta): How long the results stay available
+
+    Returns:
+        str: Result id to keep in the session
+    """
+    now = datetime.utcnow()
+    result_id = uuid.uuid4().hex
+    purge_expired_results(now)
+    db.session.add(UploadResult(
+        id=result_id,
+        payload=json.dumps(payload),
+        created_at=now,
+        expires_at=now + ttl
+    ))
+    db.session.commit()
+    return result_id
+
+
+def load_result(result_id):
+    """
+    Load stored results by id
+
+    Returns:
+        dict: The stored payload, or None if it is unknown or has expired
+    """
+    if not result_id:
+        return None
+    result = db.session.get(UploadResult, result_id)
+    if result is None or result.expires_at <= datetime.utcnow():
+        return None
+    return json.loads(result.payload)
+
+
+def delete_result(result_id):
+    """Delete stored results by id and commit"""
+    if result_id:
+        UploadResult.query.filter_by(id=result_id).delete(synchronize_session=False)
+        db.session.commit()
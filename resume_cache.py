@@ -0,0 +1,294 @@
+import os
+import json
+import hashlib
+import logging
+import threading
+from collections import OrderedDict, Counter
+from datetime import datetime
+
+from flask import has_app_context
+from sqlalchemy import bindparam, delete, func, insert, select, update
+
+from ingest import read_resume_text, process_resume_files
+from models import db, CacheEntry
+from resume_parser import PARSER_VERSION, source_extension
+from text_processor import extract_skills_experience, EXTRACTOR_VERSION
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Entries kept in process memory, and total bytes kept in the database tier
+MEMORY_CACHE_ENTRIES = 512
+DB_CACHE_MAX_BYTES = 256 * 1024 * 1024
+# Fraction of the byte budget freed when the database tier overflows
+DB_EVICTION_FRACTION = 0.1
+# Stores between exact recounts of the database tier's size
+DB_SIZE_SYNC_PUTS = 100
+# Hits collected before their last_used_at is written back
+DB_TOUCH_BATCH_SIZE = 100
+
+TEXT_LEVEL = 'text'
+EXTRACTION_LEVEL = 'extract'
+
+
+def sha256_hex(data):
+    """Return the SHA-256 hex digest of bytes or text"""
+    if isinstance(data, str):
+        data = data.encode('utf-8', errors='surrogatepass')
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_sha256(file_path, block_size=1024 * 1024):
+    """Return the SHA-256 hex digest of a file's contents"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ContentCache:
+    """
+    Two-tier cache for parsed resume text and extraction results.
+
+    Level one maps the SHA-256 of a file's bytes, its file type and
+    PARSER_VERSION to its extracted text; level two maps the SHA-256 of that
+    text plus EXTRACTOR_VERSION to the extraction dict. Lookups go to an
+    in-process LRU first and fall back to the cache_entries table, which is
+    trimmed by least recent use once it grows past max_db_bytes. The
+    database tier is skipped outside an application context (e.g. inside
+    pool workers).
+
+    The table is read and written on connections of its own, so a cache
+    lookup never commits or rolls back the caller's session. Hits are
+    recorded in memory and written back as one batched UPDATE of
+    last_used_at, and the table's total size is tracked per process and
+    only re-summed every DB_SIZE_SYNC_PUTS stores.
+    """
+
+    def __init__(self, max_entries=MEMORY_CACHE_ENTRIES, max_db_bytes=DB_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_db_bytes = max_db_bytes
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._touched = {}
+        self._db_bytes = None
+        self._puts_since_sync = 0
+        self.counters = Counter()
+
+    def _memory_get(self, key):
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+            return value
+
+    def _memory_put(self, key, value):
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _touch(self, key):
+        """Record a hit; last_used_at is written back in batches"""
+        with self._lock:
+            self._touched[key] = datetime.utcnow()
+            return len(self._touched) >= DB_TOUCH_BATCH_SIZE
+
+    def _write_touched(self, conn):
+        with self._lock:
+            touched, self._touched = self._touched, {}
+        if touched:
+            conn.execute(
+                update(CacheEntry).where(CacheEntry.key == bindparam('entry_key')).values(
+                    last_used_at=bindparam('used_at')
+                ),
+                [{'entry_key': key, 'used_at': used_at} for key, used_at in touched.items()]
+            )
+
+    def get(self, level, key):
+        """
+        Look up a serialized value, promoting database hits into memory
+
+        Returns:
+            str: The cached value, or None on a miss
+        """
+        value = self._memory_get(key)
+        if value is not None:
+            self.counters[f'{level}_memory_hits'] += 1
+            if has_app_context() and self._touch(key):
+                self.flush()
+            return value
+
+        if has_app_context():
+            try:
+                with db.engine.connect() as conn:
+                    value = conn.execute(select(CacheEntry.value).where(CacheEntry.key == key)).scalar()
+                if value is not None:
+                    self.counters[f'{level}_db_hits'] += 1
+                    self._memory_put(key, value)
+                    if self._touch(key):
+                        self.flush()
+                    return value
+            except Exception as e:
+                logger.error(f"Cache lookup failed for {key}: {str(e)}")
+
+        self.counters[f'{level}_misses'] += 1
+        return None
+
+    def put(self, level, key, value):
+        """Store a serialized value in both tiers"""
+        self._memory_put(key, value)
+        if not has_app_context():
+            return
+
+        try:
+            with db.engine.begin() as conn:
+                conn.execute(delete(CacheEntry).where(CacheEntry.key == key))
+                conn.execute(insert(CacheEntry).values(
+                    key=key, value=value, size=len(value), created_at=datetime.utcnow(), last_used_at=datetime.utcnow()
+                ))
+                self._write_touched(conn)
+            self._evict_db(len(value))
+        except Exception as e:
+            logger.error(f"Cache store failed for {key}: {str(e)}")
+
+    def flush(self):
+        """Write the recorded hits' last_used_at back to the database"""
+        try:
+            with db.engine.begin() as conn:
+                self._write_touched(conn)
+        except Exception as e:
+            logger.error(f"Cache last-used update failed: {str(e)}")
+
+    def _evict_db(self, added_bytes):
+        # Other processes store entries too, so the running total is re-summed now and then
+        self._puts_since_sync += 1
+        if self._db_bytes is not None:
+            self._db_bytes += added_bytes
+        if self._db_bytes is None or self._puts_since_sync >= DB_SIZE_SYNC_PUTS or self._db_bytes > self.max_db_bytes:
+            with db.engine.connect() as conn:
+                self._db_bytes = conn.execute(select(func.coalesce(func.sum(CacheEntry.size), 0))).scalar()
+            self._puts_since_sync = 0
+        if self._db_bytes <= self.max_db_bytes:
+            return
+
+        # Free a slice of the budget at once so eviction is not run on every put
+        target = self.max_db_bytes * (1 - DB_EVICTION_FRACTION)
+        total = self._db_bytes
+        freed_keys = []
+        with db.engine.begin() as conn:
+            rows = conn.execute(select(CacheEntry.key, CacheEntry.size).order_by(CacheEntry.last_used_at))
+            for key, size in rows:
+                if total <= target:
+                    break
+                freed_keys.append(key)
+                total -= size
+            rows.close()
+            conn.execute(delete(CacheEntry).where(CacheEntry.key.in_(freed_keys)))
+
+        self._db_bytes = total
+        self.counters['db_evictions'] += len(freed_keys)
+        logger.debug(f"Evicted {len(freed_keys)} cache entries")
+
+    @staticmethod
+    def text_key(file_hash, file_type):
+        return f'{TEXT_LEVEL}:{file_hash}:{file_type}:{PARSER_VERSION}'
+
+    @staticmethod
+    def extraction_key(text):
+        return f'{EXTRACTION_LEVEL}:{sha256_hex(text)}:{EXTRACTOR_VERSION}'
+
+    def get_text(self, file_hash, file_type):
+        return self.get(TEXT_LEVEL, self.text_key(file_hash, file_type))
+
+    def put_text(self, file_hash, file_type, text):
+        self.put(TEXT_LEVEL, self.text_key(file_hash, file_type), text)
+
+    def get_extraction(self, text):
+        value = self.get(EXTRACTION_LEVEL, self.extraction_key(text))
+        return json.loads(value) if value is not None else None
+
+    def put_extraction(self, text, extracted_data):
+        self.put(EXTRACTION_LEVEL, self.extraction_key(text), json.dumps(extracted_data))
+
+    def stats(self):
+        """Return hit/miss counters and the current memory tier size"""
+        stats = dict(self.counters)
+        stats['memory_entries'] = len(self._memory)
+        return stats
+
+    def clear_memory(self):
+        with self._lock:
+            self._memory.clear()
+
+
+# Process-wide cache used by the upload paths
+content_cache = ContentCache()
+
+
+def parse_resume_cached(source, file_type=None):
+    """
+    Return the text of a resume, reusing the cached text of identical bytes
+
+    Args:
+        source: Path to a PDF, DOCX or TXT resume, or its bytes
+        file_type (str): 'pdf', 'docx' or 'txt'; required for bytes
+
+    Returns:
+        str: Extracted text content
+    """
+    file_hash = file_sha256(source) if isinstance(source, (str, os.PathLike)) else sha256_hex(source)
+    file_type = source_extension(source, file_type)
+    text_content = content_cache.get_text(file_hash, file_type)
+    if text_content is None:
+        text_content = read_resume_text(source, file_type=file_type)
+        content_cache.put_text(file_hash, file_type, text_content)
+    return text_content
+
+
+def extract_skills_experience_cached(text):
+    """
+    Return extract_skills_experience(text), reusing results for identical text
+
+    Returns:
+        dict: A fresh copy of the extraction results, safe to mutate
+    """
+    extracted_data = content_cache.get_extraction(text)
+    if extracted_data is None:
+        extracted_data = extract_skills_experience(text)
+        content_cache.put_extraction(text, extracted_data)
+    return extracted_data
+
+
+def process_resume_files_cached(file_paths, workers=None):
+    """
+    Cache-aware version of ingest.process_resume_files
+
+    Cached files are answered in the calling process; only the misses are
+    sent to the worker pool, and their results are stored on the way back.
+
+    Returns:
+        list: Result dicts ('text' and 'extracted', or 'error') in input order
+    """
+    results = [None] * len(file_paths)
+    misses = []
+    for index, path in enumerate(file_paths):
+        file_hash = file_sha256(path)
+        text_content = content_cache.get_text(file_hash, source_extension(path))
+        extracted_data = content_cache.get_extraction(text_content) if text_content is not None else None
+        if extracted_data is not None:
+            results[index] = {'text': text_content, 'extracted': extracted_data}
+        else:
+            misses.append((index, file_hash))
+
+    if misses:
+        fresh = process_resume_files([file_paths[index] for index, _ in misses], workers=workers)
+        for (index, file_hash), result in zip(misses, fresh):
+            if 'error' not in result:
+                content_cache.put_text(file_hash, source_extension(file_paths[index]), result['text'])
+                content_cache.put_extraction(result['text'], result['extracted'])
+            results[index] = result
+
+    return results
@@ -1,39 +1,92 @@
 import os
 import logging
-from io import StringIO
+from io import BytesIO
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+
+import metrics
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
-def parse_resume(file_path):
+# Limits that keep very long documents from dominating latency and memory
+MAX_PDF_PAGES = int(os.environ.get('RESUME_MAX_PAGES', 50))
+MAX_TEXT_CHARS = int(os.environ.get('RESUME_MAX_CHARS', 200000))
+# Below this many pages a process pool costs more than it saves
+PARALLEL_PAGE_THRESHOLD = 16
+# Bump whenever parsing output changes so cached text is not reused
+PARSER_VERSION = 1
+
+def _is_path(source):
+    return isinstance(source, (str, os.PathLike))
+
+@contextmanager
+def open_binary(source):
+    """
+    Open a resume source for binary reading
+    
+    Paths are opened and closed here; bytes are wrapped in a buffer; file-like
+    objects are rewound and handed back without being closed.
+    """
+    if _is_path(source):
+        with open(source, 'rb') as file:
+            yield file
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        yield BytesIO(source)
+    else:
+        source.seek(0)
+        yield source
+
+def source_extension(source, file_type=None):
+    """Return the lowercase file type of a path or named file object, e.g. 'pdf'"""
+    if file_type:
+        return file_type.lower().lstrip('.')
+    name = os.fspath(source) if _is_path(source) else getattr(source, 'filename', None) or getattr(source, 'name', None)
+    if not isinstance(name, str) or '.' not in name:
+        raise ValueError("Cannot determine the file type of an in-memory resume; pass file_type")
+    return name.rsplit('.', 1)[-1].lower()
+
+def parse_resume(source, max_pages=None, max_chars=None, workers=None, file_type=None):
     """
     Parse a resume file and extract its text content.
     
     Args:
-        file_path (str): Path to the resume file (PDF or DOCX)
+        source: Path to the resume file, its bytes, or a binary file-like
+            object (PDF, DOCX or TXT); in-memory sources are parsed without
+            touching disk
+        max_pages (int): Page cap for PDFs (defaults to MAX_PDF_PAGES)
+        max_chars (int): Character cap (defaults to MAX_TEXT_CHARS)
+        workers (int): Processes to use for page-parallel PDF extraction
+        file_type (str): 'pdf', 'docx' or 'txt'; required for bytes and for
+            file objects without a name
         
     Returns:
         str: Extracted text content from the resume
     """
-    logger.debug(f"Starting to parse resume: {file_path}")
+    logger.debug(f"Starting to parse resume: {source if _is_path(source) else type(source).__name__}")
     
     # Check if file exists
-    if not os.path.exists(file_path):
-        logger.error(f"File not found: {file_path}")
-        raise FileNotFoundError(f"File not found: {file_path}")
+    if _is_path(source) and not os.path.exists(source):
+        logger.error(f"File not found: {source}")
+        raise FileNotFoundError(f"File not found: {source}")
         
     # Get file extension
-    file_extension = file_path.split('.')[-1].lower()
+    file_extension = source_extension(source, file_type)
     logger.debug(f"Detected file extension: {file_extension}")
+    max_chars = MAX_TEXT_CHARS if max_chars is None else max_chars
     
     try:
         if file_extension == 'pdf':
             logger.debug("Processing as PDF")
-            return parse_pdf(file_path)
+            return parse_pdf(source, max_pages=max_pages, max_chars=max_chars, workers=workers)
         elif file_extension == 'docx':
             logger.debug("Processing as DOCX")
-            return parse_docx(file_path)
+            result = parse_docx(source)
+            return result[:max_chars] if max_chars else result
+        elif file_extension == 'txt':
+            logger.debug("Processing as plain text")
+            return parse_txt(source, max_chars=max_chars)
         else:
             logger.error(f"Unsupported file format: {file_extension}")
             raise ValueError(f"Unsupported file format: {file_extension}")
@@ -41,43 +94,51 @@ def parse_resume(file_path):
         logger.error(f"Error parsing resume: {str(e)}", exc_info=True)
         raise
 
-def parse_pdf(file_path):
+def parse_txt(source, max_chars=None):
+    """
+    Read a plain text resume, replacing undecodable bytes
+    
+    Args:
+        source: Path, bytes or binary file-like object
+        max_chars (int): Maximum number of characters to return (defaults to MAX_TEXT_CHARS)
+        
+    Returns:
+        str: Text content
+    """
+    max_chars = MAX_TEXT_CHARS if max_chars is None else max_chars
+    if _is_path(source):
+        with open(source, 'r', errors='replace') as f:
+            return f.read(max_chars) if max_chars else f.read()
+    with open_binary(source) as file:
+        data = file.read()
+    text = data.decode('utf-8', errors='replace')
+    return text[:max_chars] if max_chars else text
+
+def parse_pdf(file_path, max_pages=None, max_chars=None, workers=None):
     """
     Parse PDF files using PyPDF2
     
     Args:
-        file_path (str): Path to the PDF file
+        file_path: Path to the PDF file, its bytes, or a binary file-like object
+        max_pages (int): Maximum number of pages to read (defaults to MAX_PDF_PAGES)
+        max_chars (int): Maximum number of characters to return (defaults to MAX_TEXT_CHARS)
+        workers (int): Extract pages across this many processes once the
+            document has at least PARALLEL_PAGE_THRESHOLD pages
         
     Returns:
         str: Extracted text content
     """
+    max_chars = MAX_TEXT_CHARS if max_chars is None else max_chars
     try:
-        # Import PyPDF2 here to avoid unnecessary imports when parsing DOCX
-        import PyPDF2
-        logger.debug("PyPDF2 import successful")
-        
-        logger.debug(f"Opening PDF file: {file_path}")
-        text = StringIO()
-        with open(file_path, 'rb') as file:
-            logger.debug("Creating PDF reader")
-            pdf_reader = PyPDF2.PdfReader(file)
-            
-            # Log PDF info
-            logger.debug(f"PDF pages: {len(pdf_reader.pages)}")
-            
-            # Extract text from each page
-            for page_num in range(len(pdf_reader.pages)):
-                logger.debug(f"Processing page {page_num+1}/{len(pdf_reader.pages)}")
-                page = pdf_reader.pages[page_num]
-                extracted_text = page.extract_text()
-                text.write(extracted_text)
-                
-                # Log a sample of extracted text for debugging
-                if page_num == 0:  # Only log first page
-                    sample = extracted_text[:100] + "..." if len(extracted_text) > 100 else extracted_text
-                    logger.debug(f"Sample text from page 1: {sample}")
+        if workers and workers > 1:
+            pages = _parse_pdf_parallel(file_path, max_pages, max_chars, workers)
+        else:
+            pages = extract_pdf_pages(file_path, max_pages=max_pages, max_chars=max_chars)
+        metrics.PDF_PAGES_TOTAL.inc(len(pages))
+        metrics.PDF_PAGES.observe(len(pages))
         
-        result = text.getvalue()
+        result = ''.join(pages)
+        result = result[:max_chars] if max_chars else result
         logger.debug(f"Total text extracted: {len(result)} characters")
         return result
     except ImportError:
@@ -87,12 +148,104 @@ def parse_pdf(file_path):
         logger.error(f"Error parsing PDF: {str(e)}", exc_info=True)
         raise
 
+def extract_pdf_pages(file_path, max_pages=None, max_chars=None):
+    """
+    Extract the text of a PDF page by page, up to the page and character caps
+    
+    Pages past max_pages are never extracted, and extraction stops at the
+    page that reaches max_chars.
+    
+    Args:
+        file_path: Path to the PDF file, its bytes, or a binary file-like object
+        max_pages (int): Maximum number of pages to read (defaults to MAX_PDF_PAGES)
+        max_chars (int): Stop once the pages extracted hold this many characters
+        
+    Returns:
+        list: Text of each extracted page, in order
+    """
+    # Import PyPDF2 here to avoid unnecessary imports when parsing DOCX
+    import PyPDF2
+    
+    max_pages = MAX_PDF_PAGES if max_pages is None else max_pages
+    with open_binary(file_path) as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        page_count = len(pdf_reader.pages)
+        logger.debug(f"PDF pages: {page_count}")
+        if max_pages and page_count > max_pages:
+            logger.debug(f"Reading only the first {max_pages} pages")
+            page_count = max_pages
+        
+        pages = []
+        chars = 0
+        for page_num in range(page_count):
+            extracted_text = pdf_reader.pages[page_num].extract_text() or ''
+            
+            # Log a sample of extracted text for debugging
+            if page_num == 0:  # Only log first page
+                sample = extracted_text[:100] + "..." if len(extracted_text) > 100 else extracted_text
+                logger.debug(f"Sample text from page 1: {sample}")
+            
+            pages.append(extracted_text)
+            chars += len(extracted_text)
+            if max_chars and chars >= max_chars:
+                logger.debug(f"Character cap of {max_chars} reached after page {page_num+1}")
+                break
+        return pages
+
+def count_pdf_pages(file_path):
+    """Return the number of pages in a PDF"""
+    import PyPDF2
+    with open_binary(file_path) as file:
+        return len(PyPDF2.PdfReader(file).pages)
+
+def _extract_pdf_page_range(file_path, start, stop):
+    """Extract pages [start, stop) of a PDF; runs inside a pool worker"""
+    import PyPDF2
+    with open_binary(file_path) as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        return [pdf_reader.pages[page_num].extract_text() or '' for page_num in range(start, stop)]
+
+def _parse_pdf_parallel(file_path, max_pages, max_chars, workers):
+    """
+    Extract page ranges of a long PDF across a process pool, in page order
+    
+    Every page up to max_pages is extracted; the pages past the one that
+    reaches max_chars are dropped afterwards.
+    """
+    max_pages = MAX_PDF_PAGES if max_pages is None else max_pages
+    page_count = count_pdf_pages(file_path)
+    if max_pages:
+        page_count = min(page_count, max_pages)
+    
+    if page_count < PARALLEL_PAGE_THRESHOLD:
+        return extract_pdf_pages(file_path, max_pages=page_count, max_chars=max_chars)
+    
+    # Pool workers cannot share a file object, so in-memory PDFs are sent as bytes
+    if not _is_path(file_path) and not isinstance(file_path, bytes):
+        with open_binary(file_path) as file:
+            file_path = file.read()
+    
+    # Contiguous page ranges, one per worker
+    step = -(-page_count // workers)
+    ranges = [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+    logger.debug(f"Extracting {page_count} PDF pages across {len(ranges)} processes")
+    with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+        futures = [executor.submit(_extract_pdf_page_range, file_path, start, stop) for start, stop in ranges]
+        pages = [page for future in futures for page in future.result()]
+    
+    chars = 0
+    for page_num, page in enumerate(pages):
+        chars += len(page)
+        if max_chars and chars >= max_chars:
+            return pages[:page_num + 1]
+    return pages
+
 def parse_docx(file_path):
     """
     Parse DOCX files using python-docx
     
     Args:
-        file_path (str): Path to the DOCX file
+        file_path: Path to the DOCX file, its bytes, or a binary file-like object
         
     Returns:
         str: Extracted text content
@@ -102,8 +255,9 @@ def parse_docx(file_path):
         import docx
         logger.debug("python-docx import successful")
         
-        logger.debug(f"Opening DOCX file: {file_path}")
-        doc = docx.Document(file_path)
+        logger.debug("Opening DOCX file")
+        with open_binary(file_path) as file:
+            doc = docx.Document(file)
         
         # Log document info
         logger.debug(f"Document paragraphs: {len(doc.paragraphs)}")
@@ -0,0 +1,62 @@
+import logging
+
+from skill_canonical import canonical_skill, ngrams
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+def normalize_skills(skills):
+    """Map a list of skills to their canonical names for comparison"""
+    return [canonical_skill(skill) for skill in skills]
+
+
+def match_score(resume_skills, job_skills):
+    """
+    Score a resume's skills against a job's required skills
+
+    Both sides are canonicalized first ("js" and "javascript" are the same
+    skill). A required skill counts as matched when the resume lists it or
+    when either skill is a whole-word run of the other (e.g. "react" and
+    "react native", but not "go" and "google").
+
+    Args:
+        resume_skills (list): Skills extracted from the resume
+        job_skills (list): Skills required by the job
+
+    Returns:
+        float: Percentage of required skills matched, 0-100
+    """
+    if not resume_skills or not job_skills:
+        return 0
+    return match_normalized(normalize_skills(resume_skills), normalize_skills(job_skills))
+
+
+def match_normalized(resume_skills_lower, job_skills_lower):
+    """
+    match_score for skill lists that are already canonicalized
+
+    Lets callers that score many resumes against one job normalize the
+    job's skills once.
+    """
+    if not resume_skills_lower or not job_skills_lower:
+        return 0
+
+    resume_skill_set = set(resume_skills_lower)
+    # Resume skills padded with spaces, so "job skill is a whole-word run of
+    # a resume skill" is one substring search instead of a loop
+    resume_text = '\x00'.join(f' {skill} ' for skill in resume_skill_set)
+
+    matching_skills = 0
+    for job_skill in job_skills_lower:
+        # Direct match, or the job skill is part of a resume skill
+        if f' {job_skill} ' in resume_text:
+            matching_skills += 1
+            continue
+
+        # Partial match - a resume skill is part of the job skill
+        if not resume_skill_set.isdisjoint(ngrams(job_skill.split())):
+            matching_skills += 1
+
+    return (matching_skills / len(job_skills_lower)) * 100
+
@@ -0,0 +1,248 @@
+import re
+import logging
+import threading
+from collections import Counter, defaultdict
+
+from text_processor import COMMON_SKILLS
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Canonical skill -> other spellings that mean the same skill
+SKILL_SYNONYMS = {
+    "javascript": ["js", "ecmascript", "java script"],
+    "typescript": ["ts"],
+    "python": ["python3", "python 3", "python2"],
+    "go": ["golang", "go lang"],
+    "r": ["r programming", "r language", "rstats"],
+    "c++": ["cpp", "c plus plus"],
+    "c#": ["csharp", "c sharp"],
+    "objective-c": ["objc", "objective c"],
+    "node.js": ["node", "nodejs", "node js"],
+    "react": ["react.js", "reactjs", "react js"],
+    "react native": ["react-native"],
+    "vue": ["vue.js", "vuejs"],
+    "angular": ["angularjs", "angular.js"],
+    "next.js": ["nextjs"],
+    "nuxt.js": ["nuxtjs"],
+    "express": ["express.js", "expressjs"],
+    "asp.net": ["asp net", "aspnet"],
+    "postgresql": ["postgres", "psql", "postgre sql"],
+    "mongodb": ["mongo", "mongo db"],
+    "ms sql server": ["sql server", "mssql", "microsoft sql server"],
+    "elasticsearch": ["elastic search"],
+    "kubernetes": ["k8s"],
+    "aws": ["amazon web services"],
+    "gcp": ["google cloud", "google cloud platform"],
+    "azure": ["microsoft azure"],
+    "ci/cd": ["cicd", "ci cd", "continuous integration"],
+    "machine learning": ["ml"],
+    "deep learning": ["dl"],
+    "nlp": ["natural language processing"],
+    "ai": ["artificial intelligence"],
+    "scikit-learn": ["sklearn", "scikit learn"],
+    "power bi": ["powerbi"],
+    "rest api": ["rest", "restful api", "restful apis", "rest apis"],
+    "microsoft office": ["ms office", "office 365"],
+    "excel": ["ms excel", "microsoft excel"],
+    "tailwind css": ["tailwind", "tailwindcss"],
+    "spring boot": ["springboot"],
+    "ssl/tls": ["ssl", "tls"],
+}
+
+# Shortest string matched fuzzily; shorter ones ("r", "go", "c#") must match exactly
+MIN_FUZZY_LENGTH = 4
+# Trigram Jaccard similarity needed to map an unknown spelling to a known skill
+MIN_SIMILARITY = 0.6
+# Edits allowed between the words of a fuzzy match, by word length
+SHORT_WORD_LENGTH = 6
+MAX_SHORT_WORD_EDITS = 1
+MAX_WORD_EDITS = 2
+# Memoized canonical names kept per canonicalizer
+MAX_MEMO_ENTRIES = 65536
+
+
+def normalize_skill(name):
+    """Lowercase a skill and collapse its whitespace"""
+    return ' '.join(name.lower().split())
+
+
+def trigrams(text):
+    """Character trigrams of a string padded with two leading and one trailing space"""
+    padded = f'  {text} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SkillCanonicalizer:
+    """
+    Maps skill spellings to canonical skill names
+
+    Known spellings (canonical names and synonyms) resolve with one dict
+    lookup. Other strings are matched against the known spellings through an
+    inverted trigram index, so only spellings sharing a trigram with the
+    input are compared. A spelling is accepted above MIN_SIMILARITY and only
+    if it has as many words as the input and each word pair is equal or a
+    likely misspelling (see words_match), so "assembly line" stays a skill
+    of its own rather than becoming "assembly" and "scalar" does not become
+    "scala". Anything else is its own
+    canonical form. Results are memoized per canonicalizer and dropped
+    whenever a skill is added.
+    """
+
+    def __init__(self, skills=(), synonyms=None):
+        self._canonical = {}
+        self._spellings = []
+        self._spelling_trigrams = []
+        self._index = defaultdict(list)
+        self._memo = {}
+        self._lock = threading.Lock()
+        for skill in skills:
+            self.add(skill)
+        for skill, aliases in (synonyms or {}).items():
+            self.add(skill, aliases)
+
+    def __len__(self):
+        return len(self._canonical)
+
+    def add(self, skill, aliases=()):
+        """Register a canonical skill and the spellings that map to it"""
+        canonical = normalize_skill(skill)
+        with self._lock:
+            for spelling in [canonical] + [normalize_skill(alias) for alias in aliases]:
+                if spelling in self._canonical:
+                    self._canonical[spelling] = canonical
+                    continue
+                self._canonical[spelling] = canonical
+                spelling_id = len(self._spellings)
+                self._spellings.append(spelling)
+                grams = trigrams(spelling)
+                self._spelling_trigrams.append(len(grams))
+                for gram in grams:
+                    self._index[gram].append(spelling_id)
+            self._memo = {}
+
+    def closest(self, skill):
+        """
+        Return the known spelling most similar to skill, or None
+
+        Args:
+            skill (str): Normalized skill
+
+        Returns:
+            tuple: (spelling, similarity) or None when nothing reaches MIN_SIMILARITY
+        """
+        grams = trigrams(skill)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._index.get(gram, ()))
+
+        best = None
+        for spelling_id, count in shared.items():
+            similarity = count / (len(grams) + self._spelling_trigrams[spelling_id] - count)
+            if similarity < MIN_SIMILARITY or (best is not None and similarity <= best[1]):
+                continue
+            if words_match(skill, self._spellings[spelling_id]):
+                best = (self._spellings[spelling_id], similarity)
+        return best
+
+    def canonicalize(self, skill):
+        """Return the canonical name of a skill spelling"""
+        memo = self._memo
+        canonical = memo.get(skill)
+        if canonical is not None:
+            return canonical
+
+        normalized = normalize_skill(skill)
+        canonical = self._canonical.get(normalized)
+        if canonical is None:
+            canonical = normalized
+            if len(normalized) >= MIN_FUZZY_LENGTH:
+                closest = self.closest(normalized)
+                if closest is not None:
+                    canonical = self._canonical[closest[0]]
+                    logger.debug(f"Canonicalized skill '{normalized}' as '{canonical}'")
+
+        if len(memo) >= MAX_MEMO_ENTRIES:
+            memo.clear()
+        memo[skill] = canonical
+        return canonical
+
+    def is_known(self, skill):
+        """Whether a spelling canonicalizes to a registered skill"""
+        return self.canonicalize(skill) in self._canonical
+
+
+def edit_distance(first, second):
+    """Edits (insertions, deletions, substitutions, adjacent swaps) turning first into second"""
+    previous, current = None, list(range(len(second) + 1))
+    for i in range(1, len(first) + 1):
+        before, previous, current = previous, current, [i] + [0] * len(second)
+        for j in range(1, len(second) + 1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (first[i - 1] != second[j - 1]),
+            )
+            if i > 1 and j > 1 and first[i - 1] == second[j - 2] and first[i - 2] == second[j - 1]:
+                current[j] = min(current[j], before[j - 2] + 1)
+    return current[-1]
+
+
+def is_misspelling(word, other):
+    """
+    Whether two different words are close enough to be one word misspelt
+
+    The words need MIN_FUZZY_LENGTH characters, must be at most
+    MAX_SHORT_WORD_EDITS edits apart up to SHORT_WORD_LENGTH characters and
+    MAX_WORD_EDITS beyond, and neither may be the other with characters
+    added to its start or end: "scalar", "electrons" and "swifty" are other
+    words (or forms) than "scala", "electron" and "swift", not typos of them.
+    """
+    shorter, longer = sorted((word, other), key=len)
+    if len(shorter) < MIN_FUZZY_LENGTH or longer.startswith(shorter) or longer.endswith(shorter):
+        return False
+    max_edits = MAX_SHORT_WORD_EDITS if len(longer) <= SHORT_WORD_LENGTH else MAX_WORD_EDITS
+    return len(longer) - len(shorter) <= max_edits and edit_distance(word, other) <= max_edits
+
+
+def words_match(skill, spelling):
+    """
+    Whether a fuzzy match of skill to spelling holds word by word
+
+    Both must have the same number of words, and each word must equal the
+    one at the same position or be a misspelling of it (see is_misspelling):
+    "machine lerning" matches "machine learning"; "assembly line" does not
+    match "assembly" and "sketchup" does not match "sketch".
+    """
+    words, spelling_words = skill.split(), spelling.split()
+    if len(words) != len(spelling_words):
+        return False
+    return all(word == other or is_misspelling(word, other) for word, other in zip(words, spelling_words))
+
+
+def ngrams(tokens):
+    """Every contiguous run of tokens, joined by spaces"""
+    return {' '.join(tokens[start:stop]) for start in range(len(tokens)) for stop in range(start + 1, len(tokens) + 1)}
+
+
+def skills_match(job_skill, resume_skill):
+    """
+    Whether a canonical resume skill satisfies a canonical job skill
+
+    Skills match when they are equal or when one is a whole-word run of the
+    other ("react" and "react native"), never on a bare substring ("go" and
+    "google").
+    """
+    if job_skill == resume_skill:
+        return True
+    shorter, longer = sorted((job_skill, resume_skill), key=len)
+    return f' {shorter} ' in f' {longer} '
+
+
+# Process-wide canonicalizer seeded with the extraction vocabulary
+canonicalizer = SkillCanonicalizer(COMMON_SKILLS, SKILL_SYNONYMS)
+
+
+def canonical_skill(name):
+    """Return the canonical name of a skill spelling"""
+    return canonicalizer.canonicalize(name)
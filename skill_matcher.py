@@ -0,0 +1,133 @@
+import logging
+from collections import deque
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+def _is_word_char(char):
+    """Return True for characters matched by the regex ``\\w`` class"""
+    return char.isalnum() or char == '_'
+
+
+class SkillMatcher:
+    """
+    Multi-keyword matcher built on an Aho-Corasick automaton.
+
+    The automaton is compiled once from a vocabulary and then finds every
+    vocabulary term in a text with a single left-to-right pass, so the cost
+    of a search depends on the length of the text rather than on the size
+    of the vocabulary.
+
+    A hit only counts when it is not glued to another word character on
+    either side, which mirrors the ``\\b...\\b`` regex the skill loop used to
+    build per skill while still allowing terms such as "c++" or "c#" that
+    end in punctuation.
+    """
+
+    def __init__(self, vocabulary):
+        """
+        Compile the automaton for a vocabulary
+
+        Args:
+            vocabulary (iterable): Skill terms to look for (case-insensitive)
+        """
+        # Each state is a dict of transitions; outputs[state] lists the
+        # vocabulary terms ending in that state (including via failure links)
+        self._goto = [{}]
+        self._fail = [0]
+        self._outputs = [[]]
+        self.terms = []
+
+        seen = set()
+        for term in vocabulary:
+            key = term.lower().strip()
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            self._add_term(key)
+            self.terms.append(key)
+
+        self._build_failure_links()
+        logger.debug(f"Compiled skill matcher: {len(self.terms)} terms, {len(self._goto)} states")
+
+    def __len__(self):
+        return len(self.terms)
+
+    def _add_term(self, term):
+        state = 0
+        for char in term:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            state = next_state
+        self._outputs[state].append(term)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                # Merge outputs so each state reports every term ending there
+                self._outputs[next_state] = self._outputs[next_state] + self._outputs[self._fail[next_state]]
+
+    def find_all(self, text):
+        """
+        Find every vocabulary hit in the text
+
+        Args:
+            text (str): Text to scan
+
+        Returns:
+            list: (skill, start, end) tuples ordered by end offset, where
+                text[start:end] is the matched span
+        """
+        text = text.lower()
+        text_length = len(text)
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+
+        hits = []
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if not outputs[state]:
+                continue
+
+            end = index + 1
+            if end < text_length and _is_word_char(text[end]) and _is_word_char(char):
+                continue
+            for term in outputs[state]:
+                start = end - len(term)
+                if start > 0 and _is_word_char(text[start - 1]) and _is_word_char(term[0]):
+                    continue
+                if end < text_length and _is_word_char(text[end]) and _is_word_char(term[-1]):
+                    continue
+                hits.append((term, start, end))
+
+        return hits
+
+    def match(self, text):
+        """
+        Return the set of vocabulary terms present in the text
+
+        Args:
+            text (str): Text to scan
+
+        Returns:
+            set: Matched skill terms
+        """
+        return {term for term, _, _ in self.find_all(text)}
@@ -0,0 +1,211 @@
+import re
+import logging
+
+from sqlalchemy import and_, or_, not_, false, select
+
+from models import db, JobDescription, Resume, Skill, resume_skills, RESUME_LIST_COLUMNS
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+OPERATORS = {'AND', 'OR', 'NOT'}
+
+# Quoted phrases, parentheses, or runs of anything else
+TOKEN_PATTERN = re.compile(r'"([^"]*)"|(\()|(\))|([^\s()"]+)')
+
+
+class QuerySyntaxError(ValueError):
+    """Raised when a boolean skill query cannot be parsed"""
+
+
+def tokenize(query):
+    """
+    Split a boolean skill query into tokens
+
+    Consecutive bare words form a single multi-word skill ("machine learning"),
+    AND/OR/NOT are operators in any case, and double quotes force a literal
+    skill name.
+
+    Returns:
+        list: ('op', 'AND'|'OR'|'NOT'), ('lparen', '('), ('rparen', ')') or
+            ('skill', name) tuples
+    """
+    tokens = []
+    words = []
+
+    def flush_words():
+        if words:
+            tokens.append(('skill', ' '.join(words)))
+            words.clear()
+
+    for quoted, lparen, rparen, word in TOKEN_PATTERN.findall(query):
+        if word and word.upper() in OPERATORS:
+            flush_words()
+            tokens.append(('op', word.upper()))
+        elif word:
+            words.append(word)
+        else:
+            flush_words()
+            if lparen:
+                tokens.append(('lparen', lparen))
+            elif rparen:
+                tokens.append(('rparen', rparen))
+            elif quoted.strip():
+                tokens.append(('skill', quoted))
+
+    if query.count('"') % 2:
+        raise QuerySyntaxError("Unbalanced quotes in query")
+    flush_words()
+    return tokens
+
+
+class _Parser:
+    """
+    Recursive-descent parser producing a nested tuple tree:
+
+        expr := term (OR term)*
+        term := factor (AND factor)*
+        factor := NOT factor | '(' expr ')' | skill
+    """
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.position = 0
+
+    def peek(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else (None, None)
+
+    def advance(self):
+        token = self.peek()
+        self.position += 1
+        return token
+
+    def parse(self):
+        if not self.tokens:
+            raise QuerySyntaxError("Query is empty")
+        tree = self.expr()
+        if self.position != len(self.tokens):
+            raise QuerySyntaxError(f"Unexpected token: {self.peek()[1]}")
+        return tree
+
+    def expr(self):
+        operands = [self.term()]
+        while self.peek() == ('op', 'OR'):
+            self.advance()
+            operands.append(self.term())
+        return ('or', operands) if len(operands) > 1 else operands[0]
+
+    def term(self):
+        operands = [self.factor()]
+        while self.peek() == ('op', 'AND'):
+            self.advance()
+            operands.append(self.factor())
+        return ('and', operands) if len(operands) > 1 else operands[0]
+
+    def factor(self):
+        kind, value = self.advance()
+        if kind == 'op' and value == 'NOT':
+            return ('not', self.factor())
+        if kind == 'lparen':
+            tree = self.expr()
+            if self.advance()[0] != 'rparen':
+                raise QuerySyntaxError("Missing closing parenthesis")
+            return tree
+        if kind == 'skill':
+            return ('skill', Skill.normalize(value))
+        if kind is None:
+            raise QuerySyntaxError("Query ended unexpectedly")
+        raise QuerySyntaxError(f"Unexpected token: {value}")
+
+
+def parse_query(query):
+    """
+    Parse a boolean skill query such as "python AND (django OR flask) AND NOT php"
+
+    Returns:
+        tuple: Expression tree of ('and'|'or', [children]), ('not', child)
+            and ('skill', name) nodes
+    """
+    return _Parser(tokenize(query)).parse()
+
+
+def _skill_names(tree):
+    if tree[0] == 'skill':
+        return {tree[1]}
+    if tree[0] == 'not':
+        return _skill_names(tree[1])
+    return set().union(*(_skill_names(child) for child in tree[1]))
+
+
+def build_condition(tree, skill_ids):
+    """
+    Translate a parsed query into a SQL condition on Resume.id
+
+    Each skill becomes a semi-join against the resume_skills index, so the
+    database never has to scan resumes to evaluate the query.
+
+    Args:
+        tree (tuple): Output of parse_query
+        skill_ids (dict): Normalized skill name -> skill id
+
+    Returns:
+        ColumnElement: Condition usable in Resume.query.filter()
+    """
+    kind = tree[0]
+    if kind == 'skill':
+        skill_id = skill_ids.get(tree[1])
+        if skill_id is None:
+            return false()
+        return Resume.id.in_(select(resume_skills.c.resume_id).where(resume_skills.c.skill_id == skill_id))
+    if kind == 'not':
+        return not_(build_condition(tree[1], skill_ids))
+    children = [build_condition(child, skill_ids) for child in tree[1]]
+    return and_(*children) if kind == 'and' else or_(*children)
+
+
+def search_candidates(query, job_id=None):
+    """
+    Build a Resume query for a boolean skill expression
+
+    Args:
+        query (str): Boolean skill query
+        job_id (int): Restrict results to resumes uploaded for this job
+
+    Returns:
+        Query: Resumes matching the expression, best match score first
+    """
+    tree = parse_query(query)
+    names = _skill_names(tree)
+    skill_ids = dict(db.session.query(Skill.name, Skill.id).filter(Skill.name.in_(names)).all())
+
+    candidates = Resume.query.options(db.load_only(*RESUME_LIST_COLUMNS)).filter(build_condition(tree, skill_ids))
+    if job_id:
+        candidates = candidates.filter(Resume.job_description_id == job_id)
+    return candidates.order_by(Resume.match_score.desc(), Resume.id)
+
+
+def rebuild_skill_index(batch_size=500):
+    """
+    Populate skills/resume_skills and the skill id arrays from the JSON skill
+    lists of existing jobs and resumes
+
+    Returns:
+        int: Number of resumes indexed
+    """
+    for job in JobDescription.query.all():
+        job.set_required_skills(job.get_required_skills())
+    db.session.commit()
+
+    count = 0
+    last_id = 0
+    while True:
+        batch = Resume.query.filter(Resume.id > last_id).order_by(Resume.id).limit(batch_size).all()
+        if not batch:
+            break
+        for resume in batch:
+            resume.set_skills(resume.get_skills())
+        db.session.commit()
+        count += len(batch)
+        last_id = batch[-1].id
+        logger.debug(f"Indexed skills for {count} resumes")
+    return count
@@ -0,0 +1,120 @@
+import logging
+import threading
+from collections import defaultdict
+
+from sqlalchemy import func, select
+
+from models import db, Skill
+from skill_canonical import canonical_skill, ngrams, skills_match
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class SkillVocabulary:
+    """
+    In-process view of the skills table used for skill id scoring.
+
+    Every skill has an integer id, and resumes store their skills as a
+    sorted array of those ids (see encode_skill_ids). A job matcher
+    resolves each required skill once into the ids of every vocabulary
+    skill that satisfies it under scoring.match_score's rule (synonyms like
+    "js" and "javascript", whole-word runs like "react" and "react
+    native"), so scoring a resume never compares strings. Those id sets are
+    built from indexes of canonical names and their words rather than a
+    scan of the vocabulary, and are owned by the matchers: ids loaded later
+    are listed in load order so a matcher can extend its sets with them.
+    """
+
+    def __init__(self):
+        self.names = {}
+        self.canonical = {}
+        self.max_id = 0
+        self.loaded = []
+        self._by_canonical = defaultdict(set)
+        self._by_word = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.names)
+
+    @property
+    def generation(self):
+        """Number of skills loaded so far; ids past it are added_since(generation)"""
+        return len(self.loaded)
+
+    def knows(self, skill_ids):
+        """Whether every id in skill_ids has been loaded"""
+        return self.names.keys() >= skill_ids
+
+    def refresh(self):
+        """
+        Load skills committed since the last refresh
+
+        Skills are read on a connection of their own, so rows another
+        transaction (or the caller's) inserted but may still roll back are
+        never cached under an id the database could hand out again.
+
+        Ids are assigned when a skill is inserted but become visible when its
+        transaction commits, so a lower id can appear after a higher one was
+        loaded. The table's row count catches that: if it is larger than what
+        an id > max_id query finds, the missing ids are loaded too.
+
+        Returns:
+            int: Number of skills loaded
+        """
+        with db.engine.connect() as conn:
+            count, top = conn.execute(select(func.count(Skill.id), func.max(Skill.id))).one()
+            if count == len(self.names) and (top or 0) == self.max_id:
+                return 0
+
+            rows = conn.execute(
+                select(Skill.id, Skill.name).where(Skill.id > self.max_id).order_by(Skill.id)
+            ).all()
+            if count > len(self.names) + len(rows):
+                # Ids committed out of order below max_id
+                rows = [row for row in conn.execute(select(Skill.id, Skill.name).order_by(Skill.id)) if row.id not in self.names]
+
+        with self._lock:
+            rows = [(skill_id, name) for skill_id, name in rows if skill_id not in self.names]
+            for skill_id, name in rows:
+                canonical = canonical_skill(name)
+                self.names[skill_id] = name
+                self.canonical[skill_id] = canonical
+                self._by_canonical[canonical].add(skill_id)
+                for word in canonical.split():
+                    self._by_word[word].add(skill_id)
+                self.loaded.append(skill_id)
+                self.max_id = max(self.max_id, skill_id)
+
+        if rows:
+            logger.debug(f"Skill vocabulary refreshed: {len(rows)} new, {len(self.names)} total")
+        return len(rows)
+
+    def added_since(self, generation):
+        """Ids of the skills loaded after the given generation, in load order"""
+        return self.loaded[generation:]
+
+    def matching_ids(self, skill):
+        """
+        Ids of the loaded skills that satisfy a canonical required skill
+
+        Returns:
+            frozenset: Ids of the skill itself, its synonyms and every skill
+                that is a whole-word run of it or that it is a whole-word run of
+        """
+        with self._lock:
+            # Skills that are whole-word runs of this one, itself and synonyms included
+            matches = set().union(*(self._by_canonical.get(run, ()) for run in ngrams(skill.split())))
+            # Skills this one is a whole-word run of contain all of its words
+            postings = sorted((self._by_word.get(word, set()) for word in skill.split()), key=len)
+            if postings:
+                matches.update(
+                    skill_id for skill_id in postings[0].intersection(*postings[1:])
+                    if skills_match(skill, self.canonical[skill_id])
+                )
+        return frozenset(matches)
+
+
+# Process-wide vocabulary shared by the scoring paths
+skill_vocabulary = SkillVocabulary()
@@ -176,6 +176,72 @@ function setupFormSubmission() {
             logMessage(`Submitting file: ${fileInfo.name}, size: ${Math.round(fileInfo.size / 1024)}KB, type: ${fileInfo.type}`);
         }
         
+        // Resumes matched against a job are queued for the background worker;
+        // without a job the form posts normally and shows the parsed results
+        if (this.dataset.asyncAction && formData.get('job_id')) {
+            e.preventDefault();
+            submitAsync(this, formData, submitButton);
+            return;
+        }
+        
         logMessage('Form submission proceeding');
     });
 }
+
+// Interval between task status polls, in milliseconds
+const TASK_POLL_INTERVAL = 1000;
+
+function submitAsync(form, formData, submitButton) {
+    const status = document.getElementById('uploadStatus');
+    const originalLabel = submitButton ? submitButton.innerHTML : '';
+    
+    function showStatus(message, isError = false) {
+        if (!status) {
+            return;
+        }
+        status.textContent = message;
+        status.classList.remove('d-none');
+        status.classList.toggle('text-danger', isError);
+        status.classList.toggle('text-info', !isError);
+    }
+    
+    function fail(message) {
+        logMessage(message, 'error');
+        showStatus(message, true);
+        if (submitButton) {
+            submitButton.innerHTML = originalLabel;
+            submitButton.disabled = false;
+        }
+    }
+    
+    function poll(statusUrl) {
+        fetch(statusUrl)
+            .then(response => response.json())
+            .then(task => {
+                logMessage(`Task ${task.id} is ${task.status}`);
+                if (task.status === 'done') {
+                    showStatus('Resume processed, opening the job ranking...');
+                    window.location.href = task.job_url;
+                } else if (task.status === 'failed') {
+                    fail(`Processing failed: ${task.error}`);
+                } else {
+                    showStatus(task.status === 'queued' ? 'Queued, waiting for a worker...' : 'Processing resume...');
+                    setTimeout(() => poll(statusUrl), TASK_POLL_INTERVAL);
+                }
+            })
+            .catch(error => fail(`Could not check the upload status: ${error}`));
+    }
+    
+    logMessage('Queueing upload for background processing');
+    fetch(form.dataset.asyncAction, { method: 'POST', body: formData })
+        .then(response => response.json().then(body => ({ ok: response.ok, body })))
+        .then(({ ok, body }) => {
+            if (!ok) {
+                fail(body.error || 'Upload failed');
+                return;
+            }
+            showStatus('Queued, waiting for a worker...');
+            poll(body.status_url);
+        })
+        .catch(error => fail(`Upload failed: ${error}`));
+}
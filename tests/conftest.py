@@ -0,0 +1,30 @@
+"""
+Shared fixtures for the test suite
+
+Tests run against a throwaway in-memory SQLite database; the app creates
+its tables and indexes when it is imported.
+"""
+import os
+import sys
+import logging
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# The app module connects to DATABASE_URL on import
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+
+
+@pytest.fixture(autouse=True, scope='session')
+def quiet_logging():
+    logging.disable(logging.INFO)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+@pytest.fixture(scope='session')
+def flask_app():
+    from app import app
+    with app.app_context():
+        yield app
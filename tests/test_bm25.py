@@ -0,0 +1,143 @@
+"""
+BM25 ranking over the inverted resume index
+"""
+import pytest
+
+import bm25
+
+TEXTS = {
+    'focused': 'Kubernetes operator. Kubernetes clusters, kubernetes upgrades.',
+    'mentions': 'Java developer who once deployed to kubernetes, plus many other unrelated duties ' * 5,
+    'rare_term': 'Terraform and kubernetes on a small team.',
+    'unrelated': 'Pastry chef with a passion for sourdough.',
+}
+
+
+@pytest.fixture(scope='module')
+def indexed(flask_app):
+    from models import db, JobDescription, Resume
+
+    job = JobDescription(title='BM25 job', description='kubernetes terraform')
+    db.session.add(job)
+    db.session.flush()
+    resumes = {}
+    for name, text in TEXTS.items():
+        resumes[name] = Resume(filename=f'{name}.txt', raw_text=text, job_description=job)
+        db.session.add(resumes[name])
+    db.session.commit()
+    ids = {name: resume.id for name, resume in resumes.items()}
+    yield job.id, ids
+
+    # Deleted through the ORM so the index listener drops their postings
+    db.session.delete(db.session.get(JobDescription, job.id))
+    db.session.commit()
+
+
+def test_tokenize_keeps_tech_terms_and_drops_stopwords():
+    assert bm25.tokenize('The C++ and Node.js, with C# and ASP.NET') == ['c++', 'node.js', 'c#', 'asp.net']
+
+
+def test_term_frequency_and_length_normalization(indexed):
+    job_id, ids = indexed
+    ranked = bm25.rank('kubernetes', k=10, job_id=job_id)
+    order = [resume_id for resume_id, _ in ranked]
+    # Three mentions in a short text beat one mention in a long one
+    assert order.index(ids['focused']) < order.index(ids['mentions'])
+    assert ids['unrelated'] not in order
+
+
+def test_rare_terms_weigh_more(indexed):
+    job_id, ids = indexed
+    ranked = dict(bm25.rank('kubernetes terraform', k=10, job_id=job_id))
+    assert max(ranked, key=ranked.get) == ids['rare_term']
+
+
+def test_k_limits_results_and_unknown_terms_rank_nothing(indexed):
+    job_id, _ = indexed
+    assert len(bm25.rank('kubernetes', k=2, job_id=job_id)) == 2
+    assert bm25.rank('cobol', job_id=job_id) == []
+    assert bm25.rank('', job_id=job_id) == []
+
+
+def reference_scores(query_terms, texts):
+    """Okapi BM25 of each text against the distinct query terms, computed in Python"""
+    import math
+    from collections import Counter
+
+    documents = {name: Counter(bm25.tokenize(text)) for name, text in texts.items()}
+    lengths = {name: sum(counts.values()) for name, counts in documents.items()}
+    avg_length = sum(lengths.values()) / len(lengths)
+    scores = {}
+    for term in set(query_terms):
+        df = sum(term in counts for counts in documents.values())
+        idf = math.log(1 + (len(documents) - df + 0.5) / (df + 0.5))
+        for name, counts in documents.items():
+            tf = counts[term]
+            if tf:
+                norm = bm25.K1 * (1 - bm25.B + bm25.B * lengths[name] / avg_length)
+                scores[name] = scores.get(name, 0) + idf * tf * (bm25.K1 + 1) / (tf + norm)
+    return scores
+
+
+def test_scores_summed_in_the_database_equal_okapi_bm25(indexed):
+    job_id, ids = indexed
+    query = bm25.tokenize('kubernetes terraform java sourdough clusters')
+    ranked = bm25.rank_terms(query, k=10, job_id=job_id)
+
+    expected = reference_scores(query, TEXTS)
+    assert {resume_id: pytest.approx(score) for resume_id, score in ranked} == {
+        ids[name]: pytest.approx(score) for name, score in expected.items()
+    }
+    assert [score for _, score in ranked] == sorted((score for _, score in ranked), reverse=True)
+
+
+def test_only_the_highest_weighted_query_terms_are_scored(indexed):
+    job_id, ids = indexed
+    # A term vector: terraform outweighs kubernetes by query frequency
+    term_vector = {'terraform': 3, 'kubernetes': 1, 'sourdough': 1}
+    ranked = bm25.rank_terms(term_vector, k=10, job_id=job_id, max_terms=1)
+    assert [resume_id for resume_id, _ in ranked] == [ids['rare_term']]
+    assert ranked[0][1] == pytest.approx(reference_scores(['terraform'], TEXTS)['rare_term'])
+
+    # Weights include idf: rare sourdough beats kubernetes, found in three of four
+    ranked = dict(bm25.rank_terms(term_vector, k=10, job_id=job_id, max_terms=2))
+    assert set(ranked) == {ids['rare_term'], ids['unrelated']}
+
+
+def test_deleted_resumes_leave_the_index(flask_app):
+    from models import db, Resume
+
+    resume = Resume(filename='gone.txt', raw_text='quantumwidget engineer')
+    db.session.add(resume)
+    db.session.commit()
+    assert [resume_id for resume_id, _ in bm25.rank('quantumwidget')] == [resume.id]
+
+    db.session.delete(resume)
+    db.session.commit()
+    assert bm25.rank('quantumwidget') == []
+
+
+def test_concurrent_term_insert_does_not_abort_the_resume_insert(flask_app):
+    from sqlalchemy import event
+    from models import db, BM25Term, Resume
+
+    raced = []
+
+    def insert_first(conn, cursor, statement, parameters, context, executemany):
+        # Another upload adds the same new term between our SELECT and INSERT
+        if not raced and statement.startswith('INSERT') and 'bm25_terms' in statement:
+            raced.append(statement)
+            with db.engine.begin() as other:
+                other.execute(BM25Term.__table__.insert(), {'term': 'zeppelinforge'})
+
+    event.listen(db.engine, 'before_cursor_execute', insert_first)
+    try:
+        resume = Resume(filename='race.txt', raw_text='zeppelinforge zeppelinforge')
+        db.session.add(resume)
+        db.session.commit()
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', insert_first)
+    assert raced
+    assert [resume_id for resume_id, _ in bm25.rank('zeppelinforge')] == [resume.id]
+    db.session.delete(resume)
+    db.session.commit()
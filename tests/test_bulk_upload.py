@@ -0,0 +1,127 @@
+"""
+POST /upload/bulk: ZIP expansion, per-file outcomes, savepoints and the size cap
+"""
+import zipfile
+from io import BytesIO
+
+import pytest
+
+from test_cross_matching import scoring  # noqa: F401
+
+SKILLS = ['python', 'sql', 'docker']
+
+
+def resume_text(name, skills):
+    return f"{name}\n{name.lower().replace(' ', '.')}@example.com\n\nSkills\n{', '.join(skills)}\n".encode()
+
+
+def archive(entries):
+    """An in-memory ZIP of name -> bytes"""
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as zf:
+        for name, content in entries.items():
+            zf.writestr(name, content)
+    buffer.seek(0)
+    return buffer
+
+
+@pytest.fixture
+def job(scoring, monkeypatch):
+    import app as app_module
+    from models import db, JobDescription, Skill
+
+    # Parse in this process rather than a pool
+    monkeypatch.setattr(app_module, 'BULK_UPLOAD_WORKERS', 1)
+    job = JobDescription(title='Bulk job', description='Python developer')
+    job.set_required_skills(['python', 'sql'])
+    db.session.add(job)
+    # Scoring reads the vocabulary on a connection of its own, which on the
+    # suite's in-memory database is shared and rolls back on close; commit
+    # the resumes' skills up front so no insert is undone
+    Skill.get_or_create_many(SKILLS)
+    db.session.commit()
+    yield job
+
+    db.session.rollback()
+    db.session.delete(job)
+    db.session.commit()
+
+
+def post(flask_app, job, files):
+    return flask_app.test_client().post('/upload/bulk', data={'job_id': job.id, 'resumes': files},
+                                        content_type='multipart/form-data')
+
+
+def outcomes(response):
+    return {entry['filename']: entry['status'] for entry in response.get_json()['files']}
+
+
+def test_zip_members_are_flattened_and_a_bad_file_is_reported(flask_app, job):
+    from models import Resume
+
+    upload = archive({
+        'batch/alice.txt': resume_text('Alice Smith', ['Python', 'SQL']),
+        'batch/nested/bob.txt': resume_text('Bob Jones', ['Python']),
+        'batch/broken.pdf': b'not a pdf',
+        'batch/notes.md': b'skipped: not a resume type',
+        'batch/.hidden.txt': b'skipped: hidden',
+        '__MACOSX/batch/._alice.txt': b'skipped: resource fork',
+    })
+    response = post(flask_app, job, [
+        (upload, 'resumes.zip'),
+        (BytesIO(resume_text('Carol White', ['Docker'])), 'carol.txt'),
+        (BytesIO(b'nope'), 'photo.png'),
+    ])
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert outcomes(response) == {
+        'alice.txt': 'ok', 'bob.txt': 'ok', 'carol.txt': 'ok', 'broken.pdf': 'error', 'photo.png': 'error'
+    }
+    assert (body['processed'], body['failed']) == (3, 2)
+    errors = {entry['filename']: entry['error'] for entry in body['files'] if entry['status'] == 'error'}
+    assert errors['photo.png'] == 'File type not allowed' and errors['broken.pdf']
+
+    stored = {resume.filename: resume.match_score for resume in Resume.query.filter_by(job_description_id=job.id)}
+    assert stored == {'alice.txt': 100, 'bob.txt': 50, 'carol.txt': 0}
+
+
+def test_a_bad_archive_is_reported_without_losing_the_other_files(flask_app, job):
+    response = post(flask_app, job, [
+        (BytesIO(b'not a zip'), 'broken.zip'),
+        (BytesIO(resume_text('Dan Brown', ['SQL'])), 'dan.txt'),
+    ])
+    assert outcomes(response) == {'broken.zip': 'error', 'dan.txt': 'ok'}
+
+
+def test_a_row_that_fails_to_insert_is_isolated_by_its_savepoint(flask_app, job, monkeypatch):
+    import app as app_module
+    from models import Resume
+
+    build_resume = app_module.build_resume
+
+    def build_invalid_resume(filename, *args):
+        resume = build_resume(filename, *args)
+        if filename == 'erin.txt':
+            resume.filename = None  # Violates NOT NULL when the row is flushed
+        return resume
+
+    monkeypatch.setattr(app_module, 'build_resume', build_invalid_resume)
+    response = post(flask_app, job, [
+        (BytesIO(resume_text(name.title(), ['Python'])), f'{name}.txt') for name in ('dave', 'erin', 'fay')
+    ])
+
+    assert outcomes(response) == {'dave.txt': 'ok', 'erin.txt': 'error', 'fay.txt': 'ok'}
+    assert response.get_json()['processed'] == 2
+    stored = {resume.filename for resume in Resume.query.filter_by(job_description_id=job.id)}
+    assert stored == {'dave.txt', 'fay.txt'}
+
+
+def test_oversized_request_gets_a_json_413(flask_app, job, monkeypatch):
+    import app as app_module
+
+    monkeypatch.setattr(app_module, 'BULK_MAX_CONTENT_LENGTH', 1024 * 1024)
+    response = post(flask_app, job, [(BytesIO(b'x' * (2 * 1024 * 1024)), 'huge.txt')])
+
+    assert response.status_code == 413
+    assert response.get_json() == {'error': 'Upload too large. Maximum size is 1MB per request.'}
@@ -0,0 +1,104 @@
+"""
+Cross-job matching scores resumes with the same matchers as their own job
+"""
+import pytest
+
+JOB_SKILLS = ['python', 'python', 'react', 'sql server', 'machine learning']
+RESUME_SKILLS = [
+    ['python3', 'react native'],
+    ['python', 'ms sql server', 'ml', 'reactjs'],
+    ['google docs', 'sql'],
+    ['python', 'react fibre internals'],
+]
+
+
+@pytest.fixture
+def scoring(flask_app, monkeypatch):
+    """Fresh process-wide scoring state, free of ids other tests rolled back"""
+    import cross_matching
+    import job_matchers
+    from skill_vocabulary import SkillVocabulary
+
+    vocabulary = SkillVocabulary()
+    cache = job_matchers.JobMatcherCache()
+    monkeypatch.setattr(job_matchers, 'skill_vocabulary', vocabulary)
+    monkeypatch.setattr(job_matchers, 'job_matchers', cache)
+    monkeypatch.setattr(cross_matching, 'skill_vocabulary', vocabulary)
+    monkeypatch.setattr(cross_matching, 'job_matchers', cache)
+    monkeypatch.setattr(cross_matching, '_open_jobs', cross_matching._OpenJobs())
+    return vocabulary
+
+
+@pytest.fixture
+def job(scoring):
+    from models import db, JobDescription
+
+    job = JobDescription(title='Cross job', description='python and react')
+    job.set_required_skills(JOB_SKILLS)
+    db.session.add(job)
+    db.session.commit()
+    yield job
+
+    db.session.delete(job)
+    db.session.commit()
+
+
+def uploaded_resumes(job):
+    from models import db, Resume
+
+    resumes = []
+    for index, skills in enumerate(RESUME_SKILLS):
+        resume = Resume(filename=f'cross_{index}.txt', job_description=job)
+        resume.set_skills(skills)
+        db.session.add(resume)
+        resumes.append(resume)
+    # The vocabulary reads skills on a connection of its own, which on the
+    # suite's in-memory database is the session's, so commit before scoring
+    db.session.commit()
+    for resume in resumes:
+        resume.calculate_match_score()
+    return resumes
+
+
+def stored_scores(job_id):
+    from models import JobMatch
+
+    return {match.resume_id: match.score for match in JobMatch.query.filter(JobMatch.job_description_id == job_id)}
+
+
+def test_upload_cross_scores_equal_own_job_scores(job):
+    from cross_matching import match_resumes
+    from models import db
+
+    resumes = uploaded_resumes(job)
+    match_resumes(resumes, min_score=0.01)
+    db.session.commit()
+
+    expected = {resume.id: resume.match_score for resume in resumes if resume.match_score}
+    assert len(expected) == len(RESUME_SKILLS)
+    assert stored_scores(job.id) == pytest.approx(expected)
+
+
+def test_backfill_and_rebuild_agree_with_uploads(job):
+    from cross_matching import backfill_job, rebuild_matches
+    from models import db
+
+    resumes = uploaded_resumes(job)
+    expected = {resume.id: resume.match_score for resume in resumes if resume.match_score}
+
+    backfill_job(job.id, batch_size=2, min_score=0.01)
+    assert stored_scores(job.id) == pytest.approx(expected)
+
+    rebuild_matches(batch_size=2, min_score=0.01)
+    assert stored_scores(job.id) == pytest.approx(expected)
+
+
+def test_ids_the_vocabulary_has_not_loaded_are_scored_from_skill_lists(job):
+    from cross_matching import _open_jobs, score_resume
+    from scoring import match_score
+
+    matchers, postings = _open_jobs.get()
+    # e.g. skills the upload's own transaction inserted
+    unknown = frozenset((10 ** 9,))
+    scores = score_resume(['python', 'reactjs'], unknown, matchers, postings)
+    assert scores[job.id] == pytest.approx(match_score(['python', 'reactjs'], JOB_SKILLS))
@@ -0,0 +1,91 @@
+"""
+Candidate exports: /jobs/<id>/export.csv and /jobs/<id>/export.jsonl
+"""
+import csv
+import io
+import json
+
+import pytest
+
+# (score, skills); None is an unscored resume
+RESUMES = [(70, ['python']), (None, []), (90, ['python', 'sql']), (70, ['sql']), (0, ['excel'])]
+
+
+@pytest.fixture
+def jobs(flask_app):
+    from models import db, JobDescription, Resume
+
+    ranked = JobDescription(title='Export job', description='python')
+    empty = JobDescription(title='Empty job', description='nobody applied')
+    db.session.add_all([ranked, empty])
+    db.session.flush()
+    resumes = []
+    for index, (score, skills) in enumerate(RESUMES):
+        resume = Resume(filename=f'export_{index}.txt', candidate_name=f'Candidate {index}',
+                        email=f'candidate{index}@example.com', match_score=score, job_description=ranked)
+        resume.set_skills(skills)
+        resumes.append(resume)
+    db.session.add_all(resumes)
+    db.session.commit()
+    # Best score first, later uploads first among ties, unscored last
+    expected = [resume.id for resume in sorted(
+        resumes, key=lambda resume: (resume.match_score if resume.match_score is not None else -1, resume.id),
+        reverse=True
+    )]
+    yield ranked, empty, expected
+
+    db.session.delete(ranked)
+    db.session.delete(empty)
+    db.session.commit()
+
+
+def export(flask_app, job, fmt):
+    response = flask_app.test_client().get(f'/jobs/{job.id}/export.{fmt}')
+    assert response.status_code == 200
+    return response
+
+
+def test_csv_rows_follow_the_ranking(flask_app, jobs):
+    from exports import EXPORT_FIELDS
+
+    job, _, expected = jobs
+    response = export(flask_app, job, 'csv')
+    assert response.mimetype == 'text/csv'
+    assert response.headers['Content-Disposition'] == 'attachment; filename="Export_job_candidates.csv"'
+
+    reader = csv.DictReader(io.StringIO(response.get_data(as_text=True)))
+    rows = list(reader)
+    assert reader.fieldnames == EXPORT_FIELDS
+    assert [int(row['resume_id']) for row in rows] == expected
+    assert [row['rank'] for row in rows] == ['1', '2', '3', '4', '5']
+    assert [row['match_score'] for row in rows] == ['90.0', '70.0', '70.0', '0.0', '']
+    assert rows[0]['skills'] == 'python;sql'
+
+
+def test_jsonl_rows_follow_the_ranking(flask_app, jobs):
+    from exports import EXPORT_FIELDS
+
+    job, _, expected = jobs
+    response = export(flask_app, job, 'jsonl')
+    assert response.mimetype == 'application/x-ndjson'
+
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert all(list(row) == EXPORT_FIELDS for row in rows)
+    assert [row['resume_id'] for row in rows] == expected
+    assert [row['rank'] for row in rows] == [1, 2, 3, 4, 5]
+    assert rows[0]['skills'] == ['python', 'sql'] and rows[0]['match_score'] == 90
+    assert rows[-1]['match_score'] is None and rows[-1]['skills'] == []
+    assert rows[0]['email'] == f"candidate{RESUMES.index((90, ['python', 'sql']))}@example.com"
+    assert all(row['created_at'] for row in rows)
+
+
+def test_job_without_resumes(flask_app, jobs):
+    from exports import EXPORT_FIELDS
+
+    _, empty, _ = jobs
+    assert export(flask_app, empty, 'csv').get_data(as_text=True) == ','.join(EXPORT_FIELDS) + '\r\n'
+    assert export(flask_app, empty, 'jsonl').get_data(as_text=True) == ''
+
+
+def test_unknown_job_is_not_found(flask_app):
+    assert flask_app.test_client().get('/jobs/999999/export.csv').status_code == 404
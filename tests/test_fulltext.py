@@ -0,0 +1,98 @@
+"""
+Full-text resume search: the SQLite FTS5 index and the LIKE fallback
+"""
+import pytest
+
+from fulltext import query_words
+
+# Made-up words, so resumes stored by other tests never match
+TEXTS = {
+    'both_often': 'Quextron lead. Quextron pipelines, quextron tuning and zorbulate audits.',
+    'both_once': 'Worked on a quextron rollout and one zorbulate review among many other duties ' * 3,
+    'one_word': 'Zorbulate specialist.',
+    'neither': 'Pastry chef with a passion for sourdough.',
+}
+
+
+@pytest.fixture(scope='module')
+def indexed(flask_app):
+    from models import db, JobDescription, Resume
+
+    jobs = [JobDescription(title=f'Search job {index}', description='search') for index in range(2)]
+    db.session.add_all(jobs)
+    db.session.flush()
+    resumes = {}
+    for index, (name, text) in enumerate(TEXTS.items()):
+        resumes[name] = Resume(filename=f'{name}.txt', raw_text=text, job_description=jobs[index % 2])
+        db.session.add(resumes[name])
+    db.session.commit()
+    yield [job.id for job in jobs], {name: resume.id for name, resume in resumes.items()}
+
+    # Deleted through the ORM so the index listeners drop their rows
+    for job in jobs:
+        db.session.delete(job)
+    db.session.commit()
+
+
+@pytest.fixture(params=['sqlite', 'like'])
+def search(request, indexed, monkeypatch):
+    """search_resumes through FTS5, or through the LIKE scan other databases get"""
+    from fulltext import search_resumes
+    from models import db
+
+    if request.param == 'like':
+        monkeypatch.setattr(db.session.get_bind().dialect, 'name', 'postgresql')
+
+    def run(query, **kwargs):
+        rows, total = search_resumes(query, **kwargs)
+        return [resume.id for resume, _ in rows], total
+    return run
+
+
+def test_query_words_drop_search_syntax():
+    assert query_words('"quextron" AND -node.js* (asp.net)') == ['quextron', 'AND', 'node.js', 'asp.net']
+    assert query_words('  "" ') == []
+
+
+def test_any_word_matches_and_more_matches_rank_higher(indexed, search):
+    _, ids = indexed
+    found, total = search('quextron zorbulate')
+    assert total == 3
+    assert set(found) == {ids['both_often'], ids['both_once'], ids['one_word']}
+    assert found.index(ids['both_often']) < found.index(ids['one_word'])
+
+
+def test_search_is_case_insensitive_and_ignores_syntax(indexed, search):
+    _, ids = indexed
+    assert search('ZORBULATE*')[0] == search('zorbulate')[0]
+    assert search('"sourdough*"')[0] == [ids['neither']]
+    assert search('!!!') == ([], 0)
+
+
+def test_job_filter_and_pages(indexed, search):
+    job_ids, ids = indexed
+    found, total = search('quextron zorbulate', job_id=job_ids[0])
+    assert total == 2
+    assert set(found) == {ids['both_often'], ids['one_word']}
+
+    everything, _ = search('quextron zorbulate', per_page=10)
+    pages = [search('quextron zorbulate', page=page, per_page=2) for page in (1, 2, 3)]
+    assert [total for _, total in pages] == [3, 3, 3]
+    assert [resume_id for found, _ in pages for resume_id in found] == everything
+    assert pages[2][0] == []
+
+
+def test_index_follows_updates_and_deletes(indexed):
+    from fulltext import search_resumes
+    from models import db, Resume
+
+    _, ids = indexed
+    resume = db.session.get(Resume, ids['neither'])
+    resume.raw_text = 'Now a quextron engineer.'
+    db.session.commit()
+    assert ids['neither'] in [resume.id for resume, _ in search_resumes('quextron')[0]]
+    assert search_resumes('sourdough') == ([], 0)
+
+    resume.raw_text = TEXTS['neither']
+    db.session.commit()
+    assert [resume.id for resume, _ in search_resumes('sourdough')[0]] == [ids['neither']]
@@ -0,0 +1,21 @@
+"""
+Parallel resume ingest gives the same results as processing files one by one
+"""
+
+
+def test_pool_results_equal_serial_results_in_order(tmp_path):
+    from ingest import process_resume_file, process_resume_files
+
+    paths = []
+    for index in range(9):
+        path = tmp_path / f'resume_{index}.txt'
+        path.write_text(f'Candidate {index}\n\nSkills\nPython, SQL{", Docker" * (index % 2)}\n\nExperience\n{index} years\n')
+        paths.append(str(path))
+    broken = tmp_path / 'broken.pdf'
+    broken.write_bytes(b'not a pdf')
+    paths.insert(4, str(broken))
+
+    serial = [process_resume_file(path) for path in paths]
+    assert process_resume_files(paths, workers=3, chunksize=2) == serial
+    assert 'error' in serial[4]
+    assert all('extracted' in result for index, result in enumerate(serial) if index != 4)
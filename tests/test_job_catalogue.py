@@ -0,0 +1,98 @@
+"""
+Job catalogue keyword extraction and seeding jobs from a CSV
+"""
+import csv
+import json
+import random
+
+import pytest
+
+from job_catalogue import EDUCATION_KEYWORDS, SKILL_KEYWORDS, KeywordMatcher
+
+
+def expected_hits(keywords, texts):
+    return [[keyword.lower() in (text or '').lower() for keyword in keywords] for text in texts]
+
+
+@pytest.mark.parametrize('keywords, texts', [
+    # Keywords at the start and end of the buffer and of each row
+    (['sql', 'python'], ['SQL first', 'ends with python', 'python', 'sql']),
+    # A keyword split across two rows must not match
+    (['sql', 'ab'], ['my s', 'ql', 'a', 'b', None, '']),
+    # Non-ASCII text and keywords, including lowercasing that changes byte length
+    (['café', 'straße', 'i̇stanbul', 'ÉCOLE'], ['CAFÉ au lait', 'STRASSE', 'Straße', 'İstanbul', 'école', 'cafe']),
+    # Keywords sharing their first two bytes, one a prefix of another
+    (['java', 'javascript', 'ja'], ['JavaScript', 'jav', 'ja', 'JAVA']),
+])
+def test_hits_equal_substring_search(keywords, texts):
+    assert KeywordMatcher(keywords).hits(texts).tolist() == expected_hits(keywords, texts)
+
+
+def test_hits_equal_substring_search_on_random_texts():
+    rng = random.Random(7)
+    alphabet = 'abcAB \nÉéİß/+'
+    for _ in range(200):
+        keywords = list({''.join(rng.choice(alphabet) for _ in range(rng.randint(2, 4))) for _ in range(rng.randint(1, 6))})
+        keywords = [keyword for keyword in keywords if len(keyword.lower().encode('utf-8')) >= 2]
+        texts = [
+            None if rng.random() < 0.05 else ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+            for _ in range(rng.randint(0, 12))
+        ]
+        assert KeywordMatcher(keywords).hits(texts).tolist() == expected_hits(keywords, texts), (keywords, texts)
+
+
+def test_notebook_keywords_over_a_catalogue_chunk():
+    keywords = SKILL_KEYWORDS + EDUCATION_KEYWORDS
+    texts = [
+        'Core Java, Spring Boot and T-SQL; a Bachelor or Master degree',
+        'AutoCAD and Revit drafting with SketchUp. PhD preferred',
+        'UX/UI design in TypeScript and C#',
+        None,
+    ]
+    assert KeywordMatcher(keywords).hits(texts).tolist() == expected_hits(keywords, texts)
+
+
+def test_short_keywords_are_rejected():
+    with pytest.raises(ValueError):
+        KeywordMatcher(['go', 'r'])
+
+
+@pytest.fixture
+def seeded_jobs(flask_app):
+    from models import db, JobDescription
+
+    before = {job_id for job_id, in db.session.query(JobDescription.id)}
+    yield lambda: JobDescription.query.filter(JobDescription.id.notin_(before)).order_by(JobDescription.id).all()
+
+    for job in JobDescription.query.filter(JobDescription.id.notin_(before)):
+        db.session.delete(job)
+    db.session.commit()
+
+
+def test_seed_jobs_inserts_rows_with_extracted_skills(tmp_path, seeded_jobs):
+    from job_catalogue import JOB_CSV_ENCODING, TEXT_COLUMN, TITLE_COLUMN, seed_jobs
+    from models import JobDescription
+
+    path = tmp_path / 'jobs.csv'
+    long_title = 'Principal engineer ' * 10
+    with open(path, 'w', encoding=JOB_CSV_ENCODING, newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow([TITLE_COLUMN, TEXT_COLUMN])
+        writer.writerow(['Backend developer', 'Python and Django services on PostgreSQL'])
+        writer.writerow(['Skipped', ''])
+        writer.writerow(['', 'Café manager: customer service and time management'])
+        writer.writerow([long_title, 'No listed keywords'])
+
+    assert seed_jobs(str(path), batch_size=2, is_open=False) == 3
+
+    jobs = seeded_jobs()
+    title_length = JobDescription.title.type.length
+    assert [job.title for job in jobs] == ['Backend developer', 'Untitled job', long_title[:title_length]]
+    # Substring matches in keyword order, as the notebook extracts them
+    assert [job.get_required_skills() for job in jobs] == [
+        ['SQL', 'Python', 'Django', 'PostgreSQL'], ['customer service', 'time management'], []
+    ]
+    assert jobs[1].description == 'Café manager: customer service and time management'
+    assert jobs[2].required_skills is None
+    assert all(job.version == 1 and job.is_open is False for job in jobs)
+    assert json.loads(jobs[0].required_skills) == jobs[0].get_required_skills()
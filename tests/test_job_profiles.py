@@ -0,0 +1,87 @@
+"""
+Job profiles: merged scoring skills, version bumps and the required-skills fallback
+"""
+import pytest
+
+from test_cross_matching import scoring  # noqa: F401
+
+DESCRIPTION = 'We are hiring a backend engineer. Requirements:\n- Experience with Docker and Kubernetes\n- Strong SQL skills'
+
+
+@pytest.fixture
+def job(scoring, monkeypatch):
+    import app as app_module
+    import job_matchers
+    import rescoring
+    from models import db, JobDescription
+
+    monkeypatch.setattr(app_module, 'job_matchers', job_matchers.job_matchers)
+    monkeypatch.setattr(rescoring, 'job_matchers', job_matchers.job_matchers)
+    job = JobDescription(title='Profiled job', description=DESCRIPTION)
+    job.set_required_skills(['Python', 'JS', 'docker'])
+    db.session.add(job)
+    db.session.commit()
+    yield job
+
+    db.session.delete(job)
+    db.session.commit()
+
+
+def test_profile_merges_required_and_description_skills(job):
+    from job_profiles import build_job_profile
+
+    profile = build_job_profile(job)
+    assert profile.get_auto_skills() == ['docker', 'kubernetes', 'sql']
+    assert profile.get_skills() == ['python', 'javascript', 'docker', 'kubernetes', 'sql']
+    assert job.get_scoring_skills() == profile.get_skills()
+
+
+def test_jobs_without_a_current_profile_score_against_required_skills(job):
+    from job_profiles import build_job_profile
+    from models import db
+
+    assert job.profile is None
+    assert job.get_scoring_skills() == ['Python', 'JS', 'docker']
+
+    build_job_profile(job)
+    db.session.commit()
+    assert job.current_profile is not None
+
+    # A profile built for an older version is ignored until it is rebuilt
+    job.set_required_skills(['Go'])
+    assert job.current_profile is None
+    assert job.get_scoring_skills() == ['Go']
+
+
+def test_building_a_profile_bumps_the_version_only_when_scoring_skills_change(job):
+    from job_profiles import build_job_profile, rebuild_job_profiles
+    from models import db
+
+    assert rebuild_job_profiles() == [job.id]
+    assert job.version == 2
+
+    build_job_profile(job)
+    db.session.commit()
+    assert job.version == 2
+    assert rebuild_job_profiles() == []
+
+
+def test_edit_bumps_the_version_once(flask_app, job):
+    from job_profiles import build_job_profile
+    from models import db
+
+    build_job_profile(job)
+    db.session.commit()
+    version = job.version
+
+    response = flask_app.test_client().post(f'/jobs/{job.id}/edit', data={
+        'title': job.title,
+        'description': 'Build React frontends with TypeScript',
+        'required_skills': 'Python, Go',
+        'is_open': 'on',
+    })
+    assert response.status_code == 302
+
+    db.session.refresh(job)
+    assert job.version == version + 1
+    assert job.current_profile.get_skills() == ['python', 'go', 'react', 'typescript']
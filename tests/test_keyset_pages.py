@@ -0,0 +1,106 @@
+"""
+Keyset pagination through a job's ranked resumes
+
+Walking every page must return each resume exactly once, in rank order,
+with tied scores split across page boundaries and unscored resumes last.
+"""
+import pytest
+
+PAGE_SIZE = 3
+# Ties at 80, 2/3 and 50 straddle page boundaries; None is an unscored
+# resume. 2/3 has no exact single-precision value, so its ties only hold if
+# the column stores the score the cursor carries
+TWO_THIRDS = 200 / 3
+SCORES = [90, 80, 80, 80, 80, 70, TWO_THIRDS, TWO_THIRDS, None, 50, 50, None, None, 0, None]
+
+
+@pytest.fixture(scope='module')
+def ranked(flask_app):
+    from models import db, JobDescription, Resume
+
+    job = JobDescription(title='Keyset job', description='python')
+    db.session.add(job)
+    db.session.flush()
+    resumes = [
+        Resume(filename=f'keyset_{index}.txt', match_score=score, job_description=job)
+        for index, score in enumerate(SCORES)
+    ]
+    db.session.add_all(resumes)
+    db.session.commit()
+    expected = [
+        resume.id for resume in sorted(
+            resumes, key=lambda resume: (resume.match_score if resume.match_score is not None else -1, resume.id),
+            reverse=True
+        )
+    ]
+    yield job.id, expected
+
+    db.session.delete(db.session.get(JobDescription, job.id))
+    db.session.commit()
+
+
+def walk_pages(job_id, page_size=PAGE_SIZE):
+    from app import resume_cursor, top_resumes_page
+
+    pages, cursor = [], {}
+    while True:
+        rows = top_resumes_page(job_id, page_size=page_size, **cursor)
+        pages.append([resume.id for resume in rows[:page_size]])
+        if len(rows) <= page_size:
+            return pages
+        cursor = resume_cursor(rows[page_size - 1])
+
+
+def test_pages_cover_every_resume_in_rank_order(ranked):
+    job_id, expected = ranked
+    pages = walk_pages(job_id)
+    assert [resume_id for page in pages for resume_id in page] == expected
+    assert all(len(page) == PAGE_SIZE for page in pages[:-1])
+
+
+@pytest.mark.parametrize('page_size', [1, 2, 4, len(SCORES), len(SCORES) + 1])
+def test_page_sizes(ranked, page_size):
+    job_id, expected = ranked
+    pages = walk_pages(job_id, page_size=page_size)
+    assert [resume_id for page in pages for resume_id in page] == expected
+    # The last page is never empty unless the job has no resumes
+    assert pages[-1]
+
+
+def test_cursor_of_unscored_resume_continues_past_it(ranked):
+    from app import resume_cursor, top_resumes_page
+    from models import db, Resume
+
+    job_id, expected = ranked
+    unscored = [resume_id for resume_id in expected if db.session.get(Resume, resume_id).match_score is None]
+    cursor = resume_cursor(db.session.get(Resume, unscored[0]))
+    rows = top_resumes_page(job_id, page_size=len(SCORES), **cursor)
+    assert [resume.id for resume in rows] == unscored[1:]
+
+
+def test_view_job_next_link_reaches_unscored_resumes(flask_app, ranked, monkeypatch):
+    import app as app_module
+    from models import db, Resume
+    from test_query_budgets import get
+
+    job_id, expected = ranked
+    monkeypatch.setattr(app_module, 'RESUMES_PAGE_SIZE', len(SCORES) - 2)
+    html = get(flask_app, f'/jobs/{job_id}').get_data(as_text=True)
+    # The first page ends on an unscored resume
+    assert f'after_score={-1}&amp;after_id={expected[-3]}' in html
+
+    html = get(flask_app, f'/jobs/{job_id}?after_score=-1&after_id={expected[-3]}').get_data(as_text=True)
+    filenames = {resume.id: resume.filename for resume in Resume.query.filter(Resume.job_description_id == job_id)}
+    assert [resume_id for resume_id in expected if f'>{filenames[resume_id]}<' in html] == expected[-2:]
+
+
+@pytest.mark.parametrize('dialect, column_type', [('mysql', 'DOUBLE'), ('postgresql', 'DOUBLE PRECISION')])
+def test_rank_column_is_double_precision(dialect, column_type):
+    from importlib import import_module
+
+    from sqlalchemy.schema import CreateTable
+
+    from models import Resume
+
+    ddl = str(CreateTable(Resume.__table__).compile(dialect=import_module(f'sqlalchemy.dialects.{dialect}').dialect()))
+    assert f'match_score {column_type},' in ddl
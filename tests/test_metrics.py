@@ -0,0 +1,65 @@
+"""
+Counters and histograms render in the Prometheus text exposition format
+"""
+import pytest
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    """The metrics module with an empty registry, so only this test's metrics render"""
+    import metrics
+
+    monkeypatch.setattr(metrics, 'REGISTRY', [])
+    return metrics
+
+
+def test_counter_renders_a_sample_per_label_set(metrics):
+    counter = metrics.Counter('uploads_total', 'Uploads by type', labelnames=('file_type', 'status'))
+    counter.inc(file_type='pdf', status='ok')
+    counter.inc(2, file_type='pdf', status='ok')
+    counter.inc(file_type='txt', status='say "hi"\n')
+
+    assert metrics.render_prometheus() == (
+        '# HELP uploads_total Uploads by type\n'
+        '# TYPE uploads_total counter\n'
+        'uploads_total{file_type="pdf",status="ok"} 3\n'
+        'uploads_total{file_type="txt",status="say \\"hi\\"\\n"} 1\n'
+    )
+
+
+def test_histogram_buckets_are_cumulative_and_end_at_inf(metrics):
+    histogram = metrics.Histogram('pages', 'Pages per PDF', buckets=(5, 1, 2))
+    for value in (1, 2, 2, 3, 100):
+        histogram.observe(value)
+
+    assert metrics.render_prometheus() == (
+        '# HELP pages Pages per PDF\n'
+        '# TYPE pages histogram\n'
+        'pages_bucket{le="1"} 1\n'
+        'pages_bucket{le="2"} 3\n'
+        'pages_bucket{le="5"} 4\n'
+        'pages_bucket{le="+Inf"} 5\n'
+        'pages_sum 108.0\n'
+        'pages_count 5\n'
+    )
+
+
+def test_labelled_histogram_and_extra_counters(metrics):
+    histogram = metrics.Histogram('stage_seconds', 'Stage time', labelnames=('stage',), buckets=(0.5,))
+    histogram.observe(0.25, stage='parse')
+    histogram.observe(0.75, stage='index')
+
+    lines = metrics.render_prometheus({'cache_hits_total': ('Cache hits', 7)}).splitlines()
+    assert lines[2:] == [
+        'stage_seconds_bucket{stage="index",le="0.5"} 0',
+        'stage_seconds_bucket{stage="index",le="+Inf"} 1',
+        'stage_seconds_sum{stage="index"} 0.75',
+        'stage_seconds_count{stage="index"} 1',
+        'stage_seconds_bucket{stage="parse",le="0.5"} 1',
+        'stage_seconds_bucket{stage="parse",le="+Inf"} 1',
+        'stage_seconds_sum{stage="parse"} 0.25',
+        'stage_seconds_count{stage="parse"} 1',
+        '# HELP cache_hits_total Cache hits',
+        '# TYPE cache_hits_total counter',
+        'cache_hits_total 7',
+    ]
@@ -0,0 +1,60 @@
+"""
+Schema upgrades of an existing database: added, replaced and removed schema objects
+"""
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+
+@pytest.fixture
+def old_database(flask_app, tmp_path):
+    """A file database created from the models, then rolled back to an older schema"""
+    from models import db
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    db.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(text('DROP INDEX ix_resumes_job_rank'))
+        conn.execute(text('ALTER TABLE resumes DROP COLUMN skill_ids'))
+        conn.execute(text('CREATE INDEX ix_resumes_job_score ON resumes (job_description_id, match_score)'))
+        conn.execute(text('ALTER TABLE job_descriptions ADD COLUMN skill_ids BLOB'))
+        conn.execute(text('ALTER TABLE job_profiles ADD COLUMN skill_ids BLOB'))
+    yield SimpleNamespace(engine=engine, metadata=db.metadata)
+    engine.dispose()
+
+
+def test_upgrade_brings_an_old_schema_up_to_date(old_database):
+    from migrations import (
+        add_missing_columns, add_missing_indexes, alter_retyped_columns, drop_removed_columns, drop_replaced_indexes
+    )
+
+    assert add_missing_columns(old_database) == ['resumes.skill_ids']
+    assert add_missing_indexes(old_database) == ['ix_resumes_job_rank']
+    assert drop_replaced_indexes(old_database) == ['ix_resumes_job_score']
+    # SQLite's REAL already holds doubles
+    assert alter_retyped_columns(old_database) == []
+    assert drop_removed_columns(old_database) == ['job_descriptions.skill_ids', 'job_profiles.skill_ids']
+
+    columns = {column['name'] for column in inspect(old_database.engine).get_columns('job_descriptions')}
+    assert 'skill_ids' not in columns and 'required_skills' in columns
+
+    # A second run has nothing left to do
+    steps = [add_missing_columns, add_missing_indexes, drop_replaced_indexes, alter_retyped_columns, drop_removed_columns]
+    assert [step(old_database) for step in steps] == [[], [], [], [], []]
+
+
+def test_retyped_score_column_statements(flask_app):
+    from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+    from migrations import alter_column_type_sql
+    from models import Resume
+
+    column = Resume.__table__.c.match_score
+    assert alter_column_type_sql(mysql.dialect(), 'resumes', column) == (
+        'ALTER TABLE resumes MODIFY COLUMN match_score DOUBLE NULL'
+    )
+    assert alter_column_type_sql(postgresql.dialect(), 'resumes', column) == (
+        'ALTER TABLE resumes ALTER COLUMN match_score TYPE DOUBLE PRECISION'
+    )
+    assert alter_column_type_sql(sqlite.dialect(), 'resumes', column) is None
@@ -0,0 +1,148 @@
+"""
+Query-count and loaded-bytes budgets for the list views
+
+List pages must issue a fixed number of queries however many rows they show,
+and must not pull the resume text columns (raw_text, experience) or job
+descriptions they never display.
+"""
+import pytest
+from sqlalchemy import event, inspect
+
+JOBS = 5
+RESUMES_PER_JOB = 30
+RAW_TEXT_LENGTH = 5000
+HEAVY_RESUME_COLUMNS = ('raw_text', 'experience')
+
+
+@pytest.fixture(scope='module')
+def seeded(flask_app):
+    from models import db, JobDescription, Resume
+
+    jobs = []
+    for index in range(JOBS):
+        job = JobDescription(title=f'Budget job {index}', company='Acme', description='x' * RAW_TEXT_LENGTH)
+        job.set_required_skills(['python', 'sql', 'docker'])
+        jobs.append(job)
+    db.session.add_all(jobs)
+    db.session.flush()
+
+    for job in jobs:
+        for index in range(RESUMES_PER_JOB):
+            text = f'Candidate {index} resume text. '.ljust(RAW_TEXT_LENGTH, 'x')
+            resume = Resume(
+                filename=f'budget_{job.id}_{index}.pdf', candidate_name=f'Candidate {index}',
+                raw_text=text, experience=text, match_score=index, job_description=job
+            )
+            resume.set_skills(['python', 'docker'] if index % 2 else ['sql'])
+            db.session.add(resume)
+    db.session.commit()
+    job_ids = [job.id for job in jobs]
+    db.session.remove()
+    yield job_ids
+
+    # Deleted through the ORM so the BM25 index listener drops their postings
+    for job in JobDescription.query.filter(JobDescription.id.in_(job_ids)):
+        db.session.delete(job)
+    db.session.commit()
+
+
+class QueryCounter:
+    def __init__(self):
+        self.statements = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def __len__(self):
+        return len(self.statements)
+
+
+@pytest.fixture
+def count_queries(flask_app):
+    from models import db
+
+    counter = QueryCounter()
+    event.listen(db.engine, 'before_cursor_execute', counter)
+    yield counter
+    event.remove(db.engine, 'before_cursor_execute', counter)
+
+
+@pytest.fixture
+def loaded(flask_app):
+    """Every job and resume the ORM loads during a test, kept alive for inspection"""
+    from models import JobDescription, Resume
+
+    instances = []
+
+    def keep(target, context):
+        instances.append(target)
+
+    for model in (JobDescription, Resume):
+        event.listen(model, 'load', keep)
+    yield instances
+    for model in (JobDescription, Resume):
+        event.remove(model, 'load', keep)
+
+
+def loaded_bytes(instances):
+    """Size of the string attributes loaded into the instances"""
+    return sum(
+        len(value) for instance in instances
+        for value in inspect(instance).dict.values() if isinstance(value, str)
+    )
+
+
+def heavy_columns_loaded(instances):
+    from models import Resume
+
+    return [
+        column for instance in instances if isinstance(instance, Resume)
+        for column in HEAVY_RESUME_COLUMNS if column in inspect(instance).dict
+    ]
+
+
+def get(flask_app, url):
+    from models import db
+
+    db.session.remove()
+    with flask_app.test_request_context(url):
+        response = flask_app.full_dispatch_request()
+        assert response.status_code == 200, response.get_data(as_text=True)
+        return response
+
+
+def test_jobs_list_query_budget(flask_app, seeded, count_queries, loaded):
+    response = get(flask_app, '/jobs')
+    # Jobs, then one grouped resume count, whatever the number of jobs
+    assert len(count_queries) <= 2, count_queries.statements
+    assert f'<td>{RESUMES_PER_JOB}</td>' in response.get_data(as_text=True)
+    assert len(loaded) >= len(seeded)
+    assert loaded_bytes(loaded) < RAW_TEXT_LENGTH
+
+
+def test_view_job_query_budget(flask_app, seeded, count_queries, loaded):
+    get(flask_app, f'/jobs/{seeded[0]}')
+    # Job, resume page, total count and the strong candidates from other jobs
+    assert len(count_queries) <= 4, count_queries.statements
+    assert len(loaded) > RESUMES_PER_JOB
+    assert heavy_columns_loaded(loaded) == []
+    # Only the job's own description is large
+    assert loaded_bytes(loaded) < 2 * RAW_TEXT_LENGTH
+
+
+def test_candidate_search_query_budget(flask_app, seeded, count_queries, loaded):
+    response = get(flask_app, '/candidates/search?q=python+AND+docker&limit=100')
+    assert len(count_queries) <= 2, count_queries.statements
+    assert response.get_json()['count'] >= JOBS * RESUMES_PER_JOB // 2
+    assert heavy_columns_loaded(loaded) == []
+    assert loaded_bytes(loaded) < RAW_TEXT_LENGTH
+
+
+def test_skill_lists_decoded_once(flask_app, seeded):
+    from models import db, Resume
+
+    resume = Resume.query.filter(Resume.job_description_id == seeded[0]).first()
+    assert resume.get_skills() is resume.get_skills()
+    resume.set_skills(['go'])
+    assert resume.get_skills() == ['go']
+    db.session.rollback()
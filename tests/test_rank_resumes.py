@@ -0,0 +1,79 @@
+"""
+The offline ranking CLI: job sources, ranking order and output formats
+"""
+import csv
+import io
+import json
+
+import pytest
+
+RESUMES = {
+    'alice.txt': 'Alice Smith\nalice@example.com\n\nSkills\nPython, SQL, Docker\n',
+    'bob.txt': 'Bob Jones\nbob@example.com\n\nSkills\nPython\n',
+    'nested/carol.txt': 'Carol White\ncarol@example.com\n\nSkills\nExcel\n',
+    'broken.pdf': 'not a pdf',
+    '.hidden.txt': 'Skills\nPython, SQL, Docker\n',
+    'notes.md': 'Skills\nPython, SQL, Docker\n',
+}
+
+
+@pytest.fixture
+def resume_dir(tmp_path):
+    directory = tmp_path / 'resumes'
+    for name, content in RESUMES.items():
+        path = directory / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return directory
+
+
+@pytest.fixture
+def job_file(tmp_path):
+    path = tmp_path / 'job.json'
+    path.write_text(json.dumps({'title': 'Backend', 'description': 'Backend role', 'required_skills': ['Python', 'SQL']}))
+    return path
+
+
+def ranked_files(rows):
+    return [(int(row['rank']), row['file'].rsplit('/', 1)[-1], float(row['match_score'])) for row in rows]
+
+
+def test_csv_output_ranks_best_match_first(resume_dir, job_file, capsys):
+    from rank_resumes import main
+
+    main([str(resume_dir), '--job', str(job_file), '--workers', '1'])
+    rows = list(csv.DictReader(io.StringIO(capsys.readouterr().out)))
+
+    assert ranked_files(rows) == [(1, 'alice.txt', 100.0), (2, 'bob.txt', 50.0), (3, 'broken.pdf', 0.0), (4, 'carol.txt', 0.0)]
+    alice, broken = rows[0], rows[2]
+    assert (alice['candidate_name'], alice['email'], alice['skills']) == ('Alice Smith', 'alice@example.com', 'docker;python;sql')
+    assert broken['error'] and not broken['skills']
+
+
+def test_jsonl_output_file_and_skill_override(resume_dir, job_file, tmp_path):
+    from rank_resumes import OUTPUT_FIELDS, main
+
+    output = tmp_path / 'ranked.jsonl'
+    main([str(resume_dir), '--job', str(job_file), '--skills', 'excel', '-o', str(output), '--workers', '2'])
+    rows = [json.loads(line) for line in output.read_text().splitlines()]
+
+    assert all(list(row) == OUTPUT_FIELDS for row in rows)
+    assert ranked_files(rows)[0] == (1, 'carol.txt', 100.0)
+    assert rows[0]['skills'] == ['excel']
+
+
+def test_job_row_is_read_from_the_job_csv(tmp_path):
+    from job_catalogue import JOB_CSV_ENCODING, TEXT_COLUMN, TITLE_COLUMN
+    from rank_resumes import load_job
+
+    path = tmp_path / 'jobs.csv'
+    with open(path, 'w', encoding=JOB_CSV_ENCODING, newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=[TITLE_COLUMN, TEXT_COLUMN])
+        writer.writeheader()
+        writer.writerow({TITLE_COLUMN: 'Analyst', TEXT_COLUMN: 'Excel and SQL reporting'})
+        writer.writerow({TITLE_COLUMN: 'Café developer', TEXT_COLUMN: 'Python services with Docker'})
+
+    job = load_job(job_row=1, csv_path=str(path))
+    assert job == {'title': 'Café developer', 'description': 'Python services with Docker', 'required_skills': ['docker', 'python']}
+    with pytest.raises(ValueError):
+        load_job(job_row=2, csv_path=str(path))
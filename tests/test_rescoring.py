@@ -0,0 +1,96 @@
+"""
+Rescoring a job writes the same scores as scoring each resume against the edited job
+"""
+import pytest
+
+from test_cross_matching import scoring  # noqa: F401
+
+RESUME_SKILLS = [
+    ['python', 'docker'],
+    ['python'],
+    ['go', 'kubernetes'],
+    ['golang'],
+    [],
+]
+
+
+@pytest.fixture
+def job(scoring, monkeypatch):
+    import app as app_module
+    import job_matchers
+    import rescoring
+    from models import db, JobDescription, Resume
+
+    monkeypatch.setattr(app_module, 'job_matchers', job_matchers.job_matchers)
+    monkeypatch.setattr(rescoring, 'job_matchers', job_matchers.job_matchers)
+    job = JobDescription(title='Rescored job', description='Join our growing team')
+    job.set_required_skills(['Python', 'Docker'])
+    db.session.add(job)
+    for index, skills in enumerate(RESUME_SKILLS):
+        resume = Resume(filename=f'rescore_{index}.txt', job_description=job)
+        resume.set_skills(skills)
+        db.session.add(resume)
+    # The vocabulary reads skills on a connection of its own, which on the
+    # suite's in-memory database is the session's and rolls back flushed
+    # scores when closed, so commit and build the matcher before scoring
+    db.session.commit()
+    job_matchers.job_matchers.get(job)
+    for resume in job.resumes:
+        resume.calculate_match_score()
+    db.session.commit()
+    yield job
+
+    db.session.delete(job)
+    db.session.commit()
+
+
+def stored_scores(job):
+    from models import db, Resume
+
+    db.session.expire_all()
+    return [score for score, in db.session.query(Resume.match_score).filter_by(
+        job_description_id=job.id).order_by(Resume.id)]
+
+
+def expected_scores(job):
+    from models import Resume
+
+    return [resume.calculate_match_score() for resume in Resume.query.filter_by(
+        job_description_id=job.id).order_by(Resume.id)]
+
+
+def test_rescore_updates_scores_after_required_skills_change(job):
+    import job_matchers
+    from models import db
+    from rescoring import rescore_job
+
+    before = stored_scores(job)
+    assert before == [100, 50, 0, 0, 0]
+
+    job.set_required_skills(['Go'])
+    db.session.commit()
+    job_matchers.job_matchers.invalidate(job.id)
+
+    stats = rescore_job(job.id, batch_size=2)
+    assert stats['rescored'] == len(RESUME_SKILLS)
+    assert stored_scores(job) == [0, 0, 100, 100, 0]
+    assert stored_scores(job) == expected_scores(job)
+
+
+def test_edit_route_rescores_when_skills_change(flask_app, job):
+    response = flask_app.test_client().post(f'/jobs/{job.id}/edit', data={
+        'title': job.title,
+        'description': job.description,
+        'required_skills': 'Python, Kubernetes',
+        'is_open': 'on',
+    })
+    assert response.status_code == 302
+    assert stored_scores(job) == [50, 50, 50, 0, 0]
+    assert stored_scores(job) == expected_scores(job)
+
+
+def test_rescore_unknown_job():
+    from rescoring import rescore_job
+
+    with pytest.raises(ValueError):
+        rescore_job(10**9)
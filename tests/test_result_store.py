@@ -0,0 +1,63 @@
+"""
+Stored upload results expire after their TTL and are purged on the next save
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+PAYLOAD = {'extracted_data': {'skills': ['python'], 'experience': []}}
+
+
+@pytest.fixture
+def results(flask_app):
+    from models import db, UploadResult
+
+    yield
+    UploadResult.query.delete()
+    db.session.commit()
+
+
+def test_results_load_until_their_ttl_passes(results):
+    from result_store import save_result, load_result
+
+    live = save_result(PAYLOAD, ttl=timedelta(hours=1))
+    expired = save_result(PAYLOAD, ttl=timedelta(seconds=-1))
+
+    assert load_result(live) == PAYLOAD
+    assert load_result(expired) is None
+    assert load_result('unknown') is None
+    assert load_result(None) is None
+
+
+def test_expired_results_are_purged_when_saving(results):
+    from models import db, UploadResult
+    from result_store import save_result, purge_expired_results
+
+    first = save_result(PAYLOAD, ttl=timedelta(minutes=5))
+    second = save_result(PAYLOAD, ttl=timedelta(minutes=30))
+    assert purge_expired_results(datetime.utcnow() + timedelta(minutes=10)) == 1
+    db.session.commit()
+    assert db.session.get(UploadResult, first) is None
+
+    expired = db.session.get(UploadResult, second)
+    expired.expires_at = datetime.utcnow() - timedelta(seconds=1)
+    db.session.commit()
+    third = save_result(PAYLOAD)
+    db.session.expire_all()
+    assert [result.id for result in UploadResult.query] == [third]
+
+
+def test_results_page_redirects_once_results_expire(flask_app, results):
+    from models import db, UploadResult
+    from result_store import save_result
+
+    result_id = save_result(PAYLOAD)
+    client = flask_app.test_client()
+    with client.session_transaction() as session:
+        session['result_id'] = result_id
+    assert client.get('/download').get_json() == PAYLOAD['extracted_data']
+
+    db.session.get(UploadResult, result_id).expires_at = datetime.utcnow() - timedelta(seconds=1)
+    db.session.commit()
+    assert client.get('/download').status_code == 302
+    assert client.get('/results').status_code == 302
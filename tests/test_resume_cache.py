@@ -0,0 +1,104 @@
+"""
+The two-tier content cache: LRU memory tier, batched hit writes, the
+size-bounded database tier and version-keyed invalidation
+"""
+from datetime import datetime
+
+import pytest
+
+
+@pytest.fixture
+def cache_table(flask_app):
+    """An empty cache_entries table, emptied again afterwards"""
+    from models import db, CacheEntry
+
+    def clear():
+        db.session.rollback()
+        CacheEntry.query.delete()
+        db.session.commit()
+
+    clear()
+    yield
+    clear()
+
+
+def stored(key=None):
+    """Rows of cache_entries as key -> (size, last_used_at), or one row's"""
+    from models import db, CacheEntry
+
+    db.session.rollback()
+    rows = {entry.key: (entry.size, entry.last_used_at) for entry in db.session.query(CacheEntry)}
+    return rows.get(key) if key is not None else rows
+
+
+def test_memory_tier_evicts_least_recently_used(cache_table):
+    from resume_cache import ContentCache
+
+    cache = ContentCache(max_entries=2)
+    cache.put('text', 'a', 'alpha')
+    cache.put('text', 'b', 'beta')
+    assert cache.get('text', 'a') == 'alpha'
+    cache.put('text', 'c', 'gamma')
+
+    assert list(cache._memory) == ['a', 'c']
+    # The evicted entry is still answered, from the database tier
+    assert cache.get('text', 'b') == 'beta'
+    assert cache.counters['text_memory_hits'] == 1 and cache.counters['text_db_hits'] == 1
+    assert list(cache._memory) == ['c', 'b']
+
+
+def test_hits_are_written_back_in_batches(cache_table, monkeypatch):
+    import resume_cache
+    from models import db, CacheEntry
+
+    monkeypatch.setattr(resume_cache, 'DB_TOUCH_BATCH_SIZE', 3)
+    cache = resume_cache.ContentCache()
+    for key in 'abc':
+        cache.put('text', key, key * 10)
+    long_ago = datetime(2000, 1, 1)
+    db.session.query(CacheEntry).update({'last_used_at': long_ago})
+    db.session.commit()
+
+    cache.get('text', 'a')
+    cache.get('text', 'b')
+    assert {used for _, used in stored().values()} == {long_ago}
+
+    cache.get('text', 'c')
+    assert all(used > long_ago for _, used in stored().values())
+
+
+def test_database_tier_is_trimmed_by_least_recent_use(cache_table):
+    from resume_cache import ContentCache, DB_EVICTION_FRACTION
+
+    cache = ContentCache(max_db_bytes=1000)
+    keys = [f'entry-{index}' for index in range(10)]
+    for key in keys:
+        cache.put('text', key, 'x' * 150)
+
+    rows = stored()
+    assert sum(size for size, _ in rows.values()) <= 1000
+    assert cache.counters['db_evictions'] == len(keys) - len(rows)
+    # Eviction frees a slice below the budget, so it doesn't run on every put
+    assert len(rows) < 1000 * (1 - DB_EVICTION_FRACTION) / 150 + 1
+    assert keys[0] not in rows and keys[-1] in rows
+    assert set(rows) == set(keys[-len(rows):])
+
+
+def test_version_bumps_invalidate_cached_entries(cache_table, monkeypatch):
+    import resume_cache
+
+    cache = resume_cache.ContentCache()
+    cache.put_text('f' * 64, 'pdf', 'parsed text')
+    cache.put_extraction('parsed text', {'skills': {'identified': ['python']}})
+
+    monkeypatch.setattr(resume_cache, 'PARSER_VERSION', 'next-parser')
+    assert cache.get_text('f' * 64, 'pdf') is None
+    assert cache.get_extraction('parsed text') == {'skills': {'identified': ['python']}}
+
+    monkeypatch.setattr(resume_cache, 'EXTRACTOR_VERSION', 'next-extractor')
+    assert cache.get_extraction('parsed text') is None
+
+    monkeypatch.undo()
+    assert cache.get_text('f' * 64, 'pdf') == 'parsed text'
+    # Different file types of the same bytes are parsed separately
+    assert cache.get_text('f' * 64, 'docx') is None
@@ -0,0 +1,91 @@
+"""
+Resume parsing honours the page and character caps and reads in-memory sources
+"""
+import io
+
+import pytest
+from fpdf import FPDF
+
+
+def make_pdf(page_count):
+    pdf = FPDF()
+    pdf.set_font('helvetica', size=12)
+    for index in range(page_count):
+        pdf.add_page()
+        pdf.cell(text=f'Page {index} python')
+    return bytes(pdf.output())
+
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    path = tmp_path / 'resume.pdf'
+    path.write_bytes(make_pdf(5))
+    return str(path)
+
+
+def test_page_cap_stops_extraction(pdf_path):
+    from resume_parser import extract_pdf_pages, parse_resume
+
+    assert extract_pdf_pages(pdf_path, max_pages=2) == ['Page 0 python', 'Page 1 python']
+    assert parse_resume(pdf_path, max_pages=2) == 'Page 0 pythonPage 1 python'
+    assert len(extract_pdf_pages(pdf_path, max_pages=0)) == 5
+
+
+def test_character_cap_stops_at_the_page_that_reaches_it(pdf_path):
+    from resume_parser import extract_pdf_pages, parse_resume
+
+    assert extract_pdf_pages(pdf_path, max_chars=20) == ['Page 0 python', 'Page 1 python']
+    assert parse_resume(pdf_path, max_chars=20) == 'Page 0 pythonPage 1 '
+
+
+def test_pdf_from_memory_matches_pdf_from_disk(pdf_path):
+    from resume_parser import parse_resume
+
+    with open(pdf_path, 'rb') as file:
+        data = file.read()
+    expected = parse_resume(pdf_path)
+    assert parse_resume(data, file_type='pdf') == expected
+    assert parse_resume(io.BytesIO(data), file_type='.PDF') == expected
+
+    named = io.BytesIO(data)
+    named.name = 'upload.pdf'
+    named.read()
+    assert parse_resume(named) == expected
+
+
+def test_in_memory_source_needs_a_file_type():
+    from resume_parser import parse_resume
+
+    with pytest.raises(ValueError, match='file_type'):
+        parse_resume(make_pdf(1))
+
+
+def test_parallel_extraction_matches_serial(tmp_path):
+    from resume_parser import PARALLEL_PAGE_THRESHOLD, parse_resume
+
+    data = make_pdf(PARALLEL_PAGE_THRESHOLD + 3)
+    serial = parse_resume(data, file_type='pdf')
+    assert serial.startswith('Page 0 python') and serial.endswith(f'Page {PARALLEL_PAGE_THRESHOLD + 2} python')
+    assert parse_resume(data, file_type='pdf', workers=2) == serial
+    assert parse_resume(io.BytesIO(data), file_type='pdf', workers=2) == serial
+    assert parse_resume(data, file_type='pdf', workers=2, max_pages=PARALLEL_PAGE_THRESHOLD) == (
+        parse_resume(data, file_type='pdf', max_pages=PARALLEL_PAGE_THRESHOLD))
+    assert parse_resume(data, file_type='pdf', workers=2, max_chars=40) == serial[:40]
+
+
+def test_txt_and_docx_from_memory():
+    import docx
+    from resume_parser import parse_resume
+
+    text = 'Jane Doe\nSkills: Python, Docker\n'
+    assert parse_resume(text.encode(), file_type='txt') == text
+    assert parse_resume(b'caf\xe9', file_type='txt') == 'caf�'
+    assert parse_resume(text.encode(), file_type='txt', max_chars=8) == 'Jane Doe'
+
+    document = docx.Document()
+    document.add_paragraph('Jane Doe')
+    document.add_paragraph('Skills: Python, Docker')
+    buffer = io.BytesIO()
+    document.save(buffer)
+    assert parse_resume(buffer.getvalue(), file_type='docx') == 'Jane Doe\nSkills: Python, Docker'
+    assert parse_resume(buffer, file_type='docx', max_chars=8) == 'Jane Doe'
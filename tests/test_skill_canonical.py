@@ -0,0 +1,51 @@
+"""
+Skill canonicalization: synonyms, fuzzy spellings and memoization
+"""
+import pytest
+
+from scoring import match_score
+from skill_canonical import SkillCanonicalizer, canonicalizer
+
+
+@pytest.mark.parametrize('spelling, canonical', [
+    ('JS', 'javascript'),
+    ('Postgres', 'postgresql'),
+    ('javscript', 'javascript'),
+    ('machine lerning', 'machine learning'),
+    ('tensorflw', 'tensorflow'),
+])
+def test_synonyms_and_misspellings_resolve(spelling, canonical):
+    assert canonicalizer.canonicalize(spelling) == canonical
+
+
+@pytest.mark.parametrize('spelling', ['assembly line', 'google', 'pythn', 'data scientist'])
+def test_distinct_skills_are_not_folded_into_similar_ones(spelling):
+    assert canonicalizer.canonicalize(spelling) == spelling
+
+
+@pytest.mark.parametrize('resume_skill, job_skill', [
+    ('scalar', 'scala'),
+    ('electronic', 'electron'),
+    ('electrons', 'electron'),
+    ('sketchup', 'sketch'),
+    ('swifty', 'swift'),
+])
+def test_words_extending_a_skill_are_not_misspellings_of_it(resume_skill, job_skill):
+    assert canonicalizer.canonicalize(resume_skill) == resume_skill
+    assert match_score([resume_skill], [job_skill]) == 0
+
+
+def test_fuzzy_matches_need_the_same_number_of_words():
+    skills = SkillCanonicalizer(['assembly', 'line cooking'])
+    assert skills.canonicalize('assembly line') == 'assembly line'
+    assert skills.canonicalize('asembly') == 'assembly'
+
+
+def test_memo_is_per_instance_and_cleared_by_add():
+    first, second = SkillCanonicalizer(['kubernetes']), SkillCanonicalizer()
+    assert first.canonicalize('kubernets') == 'kubernetes'
+    assert second.canonicalize('kubernets') == 'kubernets'
+
+    second.add('kubernetes', ['k8s'])
+    assert second.canonicalize('kubernets') == 'kubernetes'
+    assert second.canonicalize('K8s') == 'kubernetes'
@@ -0,0 +1,74 @@
+"""
+SkillMatcher finds what a per-skill word-boundary regex finds
+"""
+import random
+import re
+
+import pytest
+
+from skill_matcher import SkillMatcher
+from text_processor import COMMON_SKILLS
+
+VOCABULARY = [
+    'c', 'c++', 'c#', 'r', 'go', 'java', 'javascript', 'react', 'react native', 'node.js', '.net',
+    'sql', 'ms sql server', 'machine learning', 'learning', 'objective-c', 'ci/cd',
+]
+
+
+def regex_matches(vocabulary, text):
+    """
+    The regex rule the matcher replaced: a skill must not touch a word
+    character on a side where it starts or ends with one. For skills made of
+    word characters that is \\b...\\b; "c++" and "c#" may be followed by anything.
+    """
+    found = set()
+    for term in vocabulary:
+        prefix = r'(?<!\w)' if re.match(r'\w', term[0]) else ''
+        suffix = r'(?!\w)' if re.match(r'\w', term[-1]) else ''
+        if re.search(prefix + re.escape(term) + suffix, text, re.IGNORECASE):
+            found.add(term)
+    return found
+
+
+# "c" is a whole word inside "c++" and "c#" under either rule
+@pytest.mark.parametrize('text, expected', [
+    ('C++ and C# developer', {'c', 'c++', 'c#'}),
+    ('Languages: c++, c#; go.', {'c', 'c++', 'c#', 'go'}),
+    ('ended with c++', {'c', 'c++'}),
+    ('ended with c#', {'c', 'c#'}),
+    ('cc++ and xc# are not skills', set()),
+    ('React Native apps', {'react', 'react native'}),
+    ('javascript only', {'javascript'}),
+    ('MS SQL Server and mysql', {'ms sql server', 'sql'}),
+    ('machine learning', {'machine learning', 'learning'}),
+    ('objective-c', {'objective-c', 'c'}),
+    ('node.js, .NET and CI/CD', {'node.js', '.net', 'ci/cd'}),
+    ('r', {'r'}),
+    ('golang gopher', set()),
+    ('', set()),
+])
+def test_edge_cases(text, expected):
+    matcher = SkillMatcher(VOCABULARY)
+    assert matcher.match(text) == expected == regex_matches(VOCABULARY, text)
+
+
+def test_offsets_span_the_matched_text():
+    text = 'Go, C++ and React Native'
+    hits = SkillMatcher(VOCABULARY).find_all(text)
+    assert {(term, text[start:end].lower()) for term, start, end in hits} == {
+        ('go', 'go'), ('c', 'c'), ('c++', 'c++'), ('react', 'react'), ('react native', 'react native')
+    }
+    assert [end for _, _, end in hits] == sorted(end for _, _, end in hits)
+
+
+@pytest.mark.parametrize('vocabulary', [VOCABULARY, COMMON_SKILLS], ids=['edge', 'common'])
+def test_random_texts_match_the_regex_rule(vocabulary):
+    rng = random.Random(20240601)
+    separators = [' ', ', ', '. ', '/', '-', '_', '(', ')', '\n', '', '+', '#', ':']
+    fragments = list(vocabulary) + ['x', 'sql2', 'Script', 'ing', 'C', '_go', 'react-', 'native']
+    matcher = SkillMatcher(vocabulary)
+    for _ in range(1000):
+        text = ''.join(rng.choice(fragments) + rng.choice(separators) for _ in range(rng.randint(0, 8)))
+        if rng.random() < 0.5:
+            text = text.rstrip()
+        assert matcher.match(text) == regex_matches(vocabulary, text), text
@@ -0,0 +1,58 @@
+"""
+Boolean skill query parsing and concurrent skill creation
+"""
+import pytest
+
+from skill_search import QuerySyntaxError, parse_query, tokenize
+
+
+def test_bare_words_form_one_skill():
+    assert tokenize('machine learning AND sql') == [('skill', 'machine learning'), ('op', 'AND'), ('skill', 'sql')]
+
+
+def test_operators_are_case_insensitive_and_quotes_are_literal():
+    assert parse_query('python and "and"') == ('and', [('skill', 'python'), ('skill', 'and')])
+
+
+def test_and_binds_tighter_than_or():
+    assert parse_query('python OR java AND spring') == (
+        'or', [('skill', 'python'), ('and', [('skill', 'java'), ('skill', 'spring')])]
+    )
+
+
+def test_parentheses_and_not():
+    assert parse_query('Python AND (Django OR Flask) AND NOT PHP') == ('and', [
+        ('skill', 'python'),
+        ('or', [('skill', 'django'), ('skill', 'flask')]),
+        ('not', ('skill', 'php'))
+    ])
+
+
+@pytest.mark.parametrize('query', ['', 'python AND', '(python OR java', 'python )', '"python', 'AND python'])
+def test_malformed_queries_are_rejected(query):
+    with pytest.raises(QuerySyntaxError):
+        parse_query(query)
+
+
+def test_get_or_create_many_tolerates_a_concurrent_insert(flask_app):
+    from sqlalchemy import event
+    from models import db, Skill
+
+    raced = []
+
+    def insert_first(conn, cursor, statement, parameters, context, executemany):
+        # Another transaction wins the race between our SELECT and INSERT
+        if not raced and statement.startswith('INSERT') and 'skills' in statement:
+            raced.append(statement)
+            with db.engine.begin() as other:
+                other.execute(Skill.__table__.insert(), {'name': 'race condition skill'})
+
+    event.listen(db.engine, 'before_cursor_execute', insert_first)
+    try:
+        skills = Skill.get_or_create_many(['Race  Condition Skill', 'another race skill'])
+        db.session.commit()
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', insert_first)
+    assert raced
+    assert sorted(skill.name for skill in skills) == ['another race skill', 'race condition skill']
+    assert all(skill.id for skill in skills)
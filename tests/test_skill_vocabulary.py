@@ -0,0 +1,85 @@
+"""
+Skill id storage and the in-process skill vocabulary
+"""
+import pytest
+
+from models import decode_skill_ids, encode_skill_ids
+
+
+def test_skill_id_arrays_grow_with_skill_count_not_id_size():
+    data = encode_skill_ids([5_000_000, 3, 3, 70_000])
+    assert len(data) == 12
+    assert decode_skill_ids(data) == {3, 70_000, 5_000_000}
+    assert encode_skill_ids([]) is None
+    assert decode_skill_ids(None) == frozenset()
+
+
+def test_refresh_loads_ids_committed_out_of_order(flask_app):
+    from models import db, Skill
+    from skill_vocabulary import SkillVocabulary
+
+    vocabulary = SkillVocabulary()
+    vocabulary.refresh()
+    top = vocabulary.max_id
+    db.session.add(Skill(id=top + 10, name='late skill high'))
+    db.session.commit()
+    assert vocabulary.refresh() == 1
+
+    # A transaction that took a lower id commits after the refresh
+    db.session.add(Skill(id=top + 5, name='late skill low'))
+    db.session.commit()
+    assert vocabulary.refresh() == 1
+    assert vocabulary.knows({top + 5, top + 10})
+    assert vocabulary.refresh() == 0
+
+
+JOB_SKILLS = ['react', 'JS', 'Go', 'python', 'python', 'machine learning', 'sql server']
+RESUMES = [
+    ['react native', 'javascript'],
+    ['golang', 'google docs'],
+    ['python3', 'ml'],
+    ['ms sql server', 'learning'],
+    ['sql', 'server', 'machine'],
+    [],
+]
+
+
+@pytest.fixture
+def vocabulary(flask_app, monkeypatch):
+    """A fresh process vocabulary, free of ids other tests rolled back"""
+    import job_matchers
+    from skill_vocabulary import SkillVocabulary
+
+    vocabulary = SkillVocabulary()
+    monkeypatch.setattr(job_matchers, 'skill_vocabulary', vocabulary)
+    return vocabulary
+
+
+def test_matcher_scores_ids_like_the_skill_list_rule(vocabulary):
+    from job_matchers import JobMatcher
+    from models import db, Skill
+    from scoring import match_score
+
+    matcher = JobMatcher(None, 1, JOB_SKILLS)
+    for skills in RESUMES:
+        ids = frozenset(skill.id for skill in Skill.get_or_create_many(skills))
+        db.session.commit()
+        vocabulary.refresh()
+        assert vocabulary.knows(ids)
+        assert matcher.score_ids(ids) == pytest.approx(match_score(skills, JOB_SKILLS)), skills
+
+
+def test_matcher_picks_up_skills_added_after_it_was_built(vocabulary):
+    from job_matchers import JobMatcher
+    from models import db, Skill
+
+    matcher = JobMatcher(None, 1, ['kotlin'])
+    size = matcher.size
+    skills = Skill.get_or_create_many([f'kotlin {index}' for index in range(50)])
+    db.session.commit()
+
+    # Scoring refreshes the vocabulary for ids it hasn't loaded
+    assert matcher.score(['kotlin 0'], frozenset((skills[0].id,))) == 100
+    assert matcher.satisfiers >= {skill.id for skill in skills}
+    # The cache charges for the id sets the matcher holds
+    assert matcher.size > size
@@ -0,0 +1,119 @@
+"""
+The ingest worker: claiming queued tasks, retries and abandoned tasks
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from test_cross_matching import scoring  # noqa: F401
+
+RESUME_SKILLS = ['python', 'sql', 'docker']
+RESUME_TEXT = b'Jane Doe\njane@example.com\n\nSkills\nPython, SQL, Docker\n'
+
+
+@pytest.fixture
+def job(scoring):
+    from models import db, IngestTask, JobDescription, Skill
+
+    job = JobDescription(title='Worker job', description='Python developer')
+    job.set_required_skills(['python', 'sql'])
+    db.session.add(job)
+    # The worker's vocabulary and cache reads use a connection of their own,
+    # which on the suite's in-memory database is shared and rolls back on
+    # close; commit the resume's skills up front so no insert is undone
+    Skill.get_or_create_many(RESUME_SKILLS)
+    db.session.commit()
+    yield job
+
+    db.session.rollback()
+    IngestTask.query.delete()
+    db.session.delete(job)
+    db.session.commit()
+
+
+@pytest.fixture
+def queue(job, tmp_path):
+    """Spool a file and queue a task for it, returning the task"""
+    from models import db, IngestTask
+
+    def queue(filename, content, **columns):
+        path = tmp_path / filename
+        path.write_bytes(content)
+        task = IngestTask(filename=filename, file_path=str(path), job_description_id=job.id, **columns)
+        db.session.add(task)
+        db.session.commit()
+        return task
+
+    return queue
+
+
+def reload(task):
+    """The task as the worker left it, which ran in its own app context"""
+    from models import db
+
+    db.session.expire_all()
+    return db.session.get(type(task), task.id)
+
+
+def test_claim_takes_queued_tasks_oldest_first(queue):
+    from models import IngestTask
+    from worker import claim_next_task
+
+    first = queue('first.txt', RESUME_TEXT)
+    second = queue('second.txt', b'Skills: SQL')
+    queue('done.txt', b'Skills: Go', status=IngestTask.DONE)
+
+    claimed = [claim_next_task(), claim_next_task(), claim_next_task()]
+    assert [task.id if task else None for task in claimed] == [first.id, second.id, None]
+    assert all(task.status == IngestTask.RUNNING and task.attempts == 1 and task.started_at for task in claimed[:2])
+
+
+def test_run_scores_a_queued_resume_and_removes_its_spool_file(queue, job):
+    import worker
+    from models import IngestTask
+
+    task = queue('candidate.txt', RESUME_TEXT)
+    worker.run(once=True)
+
+    task = reload(task)
+    assert task.status == IngestTask.DONE and task.attempts == 1 and task.error is None
+    assert task.resume.job_description_id == job.id
+    assert task.resume.match_score == 100
+    assert not worker.os.path.exists(task.file_path)
+
+
+def test_failing_task_is_retried_then_marked_failed(queue):
+    import worker
+    from models import IngestTask
+
+    task = queue('broken.pdf', b'not a pdf')
+    worker.run(once=True)
+
+    task = reload(task)
+    assert task.status == IngestTask.FAILED
+    assert task.attempts == worker.MAX_ATTEMPTS
+    assert task.error and task.finished_at and task.resume_id is None
+    assert not worker.os.path.exists(task.file_path)
+
+
+def test_stale_running_tasks_are_requeued_or_failed(queue):
+    import worker
+    from models import IngestTask
+
+    long_ago = datetime.utcnow() - worker.STALE_AFTER - timedelta(minutes=1)
+    abandoned = queue('abandoned.txt', RESUME_TEXT, status=IngestTask.RUNNING, attempts=1, started_at=long_ago)
+    exhausted = queue('exhausted.txt', RESUME_TEXT, status=IngestTask.RUNNING,
+                      attempts=worker.MAX_ATTEMPTS, started_at=long_ago)
+    active = queue('active.txt', RESUME_TEXT, status=IngestTask.RUNNING, attempts=1, started_at=datetime.utcnow())
+
+    assert worker.requeue_stale_tasks() == 1
+    assert reload(abandoned).status == IngestTask.QUEUED
+    assert reload(exhausted).status == IngestTask.FAILED
+    assert not worker.os.path.exists(exhausted.file_path)
+    assert reload(active).status == IngestTask.RUNNING
+
+    # The requeued task is picked up again and counts as a second attempt
+    worker.run(once=True)
+    abandoned = reload(abandoned)
+    assert abandoned.status == IngestTask.DONE and abandoned.attempts == 2
+    assert reload(active).status == IngestTask.RUNNING
@@ -2,6 +2,8 @@ import re
 import logging
 from collections import defaultdict
 
+from skill_matcher import SkillMatcher
+
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
@@ -62,6 +64,29 @@ SKILLS_HEADERS = [
     "knowledge areas", "computer skills"
 ]
 
+# Bump whenever extraction output changes so cached results are not reused
+EXTRACTOR_VERSION = 2
+
+# Compiled once so every resume is scanned for all common skills in one pass
+COMMON_SKILLS_MATCHER = SkillMatcher(COMMON_SKILLS)
+
+# Section header pattern, compiled once per process
+SECTION_HEADER_PATTERN = re.compile(
+    r'(?:^|\n)(?:' + '|'.join(EXPERIENCE_HEADERS + SKILLS_HEADERS) + r')[\s:]*\n',
+    re.IGNORECASE
+)
+
+# Phrases that usually introduce a list of skills
+SKILL_PHRASE_PATTERNS = [
+    re.compile(phrase, re.IGNORECASE) for phrase in (
+        r'proficient (?:in|with) (.+?)(?=\.|,|\n|$)',
+        r'experienced (?:in|with) (.+?)(?=\.|,|\n|$)',
+        r'knowledge of (.+?)(?=\.|,|\n|$)',
+        r'familiar with (.+?)(?=\.|,|\n|$)',
+        r'expertise in (.+?)(?=\.|,|\n|$)'
+    )
+]
+
 def extract_skills_experience(text):
     """
     Extract skills and experience from resume text
@@ -121,14 +146,8 @@ def extract_sections(text):
     """
     sections = defaultdict(str)
     
-    # Combine all possible headers
-    all_headers = EXPERIENCE_HEADERS + SKILLS_HEADERS
-    
-    # Create a pattern to match section headers
-    header_pattern = r'(?:^|\n)(?:' + '|'.join(all_headers) + r')[\s:]*\n'
-    
     # Find potential section headers
-    matches = list(re.finditer(header_pattern, text, re.IGNORECASE))
+    matches = list(SECTION_HEADER_PATTERN.finditer(text))
     
     if matches:
         for i, match in enumerate(matches):
@@ -172,9 +191,7 @@ def extract_skills(text, sections):
                     identified_skills.add(skill)
     
     # Also look for common skills throughout the text
-    for skill in COMMON_SKILLS:
-        if re.search(r'\b' + re.escape(skill) + r'\b', text, re.IGNORECASE):
-            identified_skills.add(skill)
+    identified_skills.update(COMMON_SKILLS_MATCHER.match(text))
     
     # Try to find skill lists with bullets or numbers
     bullet_lists = re.findall(r'(?:•|\* |\d+\.) (.+?)(?=(?:•|\* |\d+\.)|$)', text)
@@ -184,16 +201,8 @@ def extract_skills(text, sections):
             identified_skills.add(item)
     
     # Try to extract skills from "proficient in" or "experienced with" phrases
-    skill_phrases = [
-        r'proficient (?:in|with) (.+?)(?=\.|,|\n|$)',
-        r'experienced (?:in|with) (.+?)(?=\.|,|\n|$)',
-        r'knowledge of (.+?)(?=\.|,|\n|$)',
-        r'familiar with (.+?)(?=\.|,|\n|$)',
-        r'expertise in (.+?)(?=\.|,|\n|$)'
-    ]
-    
-    for phrase in skill_phrases:
-        matches = re.finditer(phrase, text, re.IGNORECASE)
+    for phrase in SKILL_PHRASE_PATTERNS:
+        matches = phrase.finditer(text)
         for match in matches:
             skill_text = match.group(1).strip()
             if skill_text and len(skill_text) > 2:
@@ -238,3 +247,37 @@ def extract_experience(text, sections):
             combined_experience += match.group() + "\n\n"
     
     return combined_experience.strip()
+
+def extract_candidate_info(text):
+    """Extract candidate name, email, and phone from resume text"""
+    info = {
+        'name': None,
+        'email': None,
+        'phone': None
+    }
+    
+    # Try to extract email
+    email_match = re.search(r'[\w.+-]+@[\w-]+\.[\w.-]+', text)
+    if email_match:
+        info['email'] = email_match.group(0)
+    
+    # Try to extract phone (simple pattern for various formats)
+    phone_match = re.search(r'(\+\d{1,3}[\s.-])?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}', text)
+    if phone_match:
+        info['phone'] = phone_match.group(0)
+    
+    # Try to extract name (this is more complex, using first 2 lines if they don't match email/phone)
+    lines = text.split('\n')
+    for line in lines[:3]:  # Check first 3 lines for name
+        line = line.strip() #removen any spaces or empty character before and after the text
+        if line and len(line) > 3:
+            # Skip if line contains email or phone
+            if info['email'] and info['email'] in line:
+                continue
+            if info['phone'] and info['phone'] in line:
+                continue
+            if not re.search(r'[\w.+-]+@[\w-]+\.[\w.-]+', line) and not re.search(r'(\+\d{1,3}[\s.-])?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}', line):
+                info['name'] = line
+                break
+    
+    return info
@@ -0,0 +1,148 @@
+"""
+Background worker that drains the ingest task queue.
+
+Uploads posted to /upload/async are spooled to disk and recorded as
+IngestTask rows. Run one or more of these processes next to the web app:
+
+    python worker.py [--poll-interval 2] [--once]
+"""
+import os
+import time
+import logging
+import argparse
+from datetime import datetime, timedelta
+
+from app import app, build_resume
+from models import db, IngestTask
+from cross_matching import match_resumes
+from resume_cache import parse_resume_cached, extract_skills_experience_cached
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 3
+# Tasks left 'running' longer than this are assumed to belong to a dead worker
+STALE_AFTER = timedelta(minutes=15)
+
+
+def claim_next_task():
+    """
+    Atomically move the oldest queued task to 'running'
+
+    Returns:
+        IngestTask: The claimed task, or None if the queue is empty
+    """
+    while True:
+        task = IngestTask.query.filter_by(status=IngestTask.QUEUED).order_by(IngestTask.id).first()
+        if not task:
+            return None
+
+        # Only one worker wins the conditional update for a given task
+        claimed = IngestTask.query.filter_by(id=task.id, status=IngestTask.QUEUED).update({
+            'status': IngestTask.RUNNING,
+            'started_at': datetime.utcnow(),
+            'attempts': IngestTask.attempts + 1
+        }, synchronize_session=False)
+        db.session.commit()
+        if claimed:
+            db.session.refresh(task)
+            return task
+
+
+def requeue_stale_tasks():
+    """
+    Return tasks abandoned by a crashed worker to the queue
+
+    A task that has already used up its attempts is marked failed instead,
+    so a file that keeps killing workers is not retried forever.
+
+    Returns:
+        int: Number of tasks requeued
+    """
+    now = datetime.utcnow()
+    stale = IngestTask.query.filter(
+        IngestTask.status == IngestTask.RUNNING,
+        IngestTask.started_at < now - STALE_AFTER
+    )
+    exhausted = stale.filter(IngestTask.attempts >= MAX_ATTEMPTS)
+    spooled = [file_path for file_path, in exhausted.with_entities(IngestTask.file_path)]
+    failed = exhausted.update({
+        'status': IngestTask.FAILED,
+        'error': f'Worker stopped while processing; gave up after {MAX_ATTEMPTS} attempts',
+        'finished_at': now
+    }, synchronize_session=False)
+    count = stale.update({'status': IngestTask.QUEUED}, synchronize_session=False)
+    db.session.commit()
+
+    for file_path in spooled:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+    if failed:
+        logger.warning(f"Marked {failed} stale ingest tasks as failed after {MAX_ATTEMPTS} attempts")
+    if count:
+        logger.warning(f"Requeued {count} stale ingest tasks")
+    return count
+
+
+def process_task(task):
+    """Parse, extract and score a claimed task, recording the outcome on the task"""
+    logger.debug(f"Processing ingest task {task.id}: {task.filename}")
+    try:
+        text_content = parse_resume_cached(task.file_path)
+        extracted_data = extract_skills_experience_cached(text_content)
+        resume = build_resume(task.filename, text_content, extracted_data, task.job_description)
+        db.session.add(resume)
+        db.session.flush()
+        match_resumes([resume])
+
+        task.resume_id = resume.id
+        task.status = IngestTask.DONE
+        task.error = None
+        task.finished_at = datetime.utcnow()
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Ingest task {task.id} failed: {str(e)}", exc_info=True)
+        task.error = str(e)
+        if task.attempts >= MAX_ATTEMPTS:
+            task.status = IngestTask.FAILED
+            task.finished_at = datetime.utcnow()
+        else:
+            task.status = IngestTask.QUEUED
+        db.session.commit()
+
+    if task.status in (IngestTask.DONE, IngestTask.FAILED) and os.path.exists(task.file_path):
+        os.remove(task.file_path)
+
+
+def run(poll_interval=2.0, once=False):
+    """
+    Drain the queue, sleeping between polls when it is empty
+
+    Args:
+        poll_interval (float): Seconds to wait when no task is queued
+        once (bool): Exit as soon as the queue is empty
+    """
+    with app.app_context():
+        requeue_stale_tasks()
+        while True:
+            task = claim_next_task()
+            if task:
+                process_task(task)
+                continue
+            if once:
+                return
+            time.sleep(poll_interval)
+            requeue_stale_tasks()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Drain the resume ingest task queue")
+    parser.add_argument('--poll-interval', type=float, default=2.0, help="Seconds between polls of an empty queue")
+    parser.add_argument('--once', action='store_true', help="Exit when the queue is empty")
+    args = parser.parse_args()
+    run(poll_interval=args.poll_interval, once=args.once)
+
+
+if __name__ == '__main__':
+    main()